@@ -11,4 +11,5 @@ import image.ocischema
 import image.platform
 import image.regex
 import image.v2s2
-import image.v2s2schema
\ No newline at end of file
+import image.v2s2schema
+import image.validators
\ No newline at end of file
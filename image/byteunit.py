@@ -5,6 +5,20 @@ readable string measured in the nearest byte unit, and with the byte unit
 abbreviation appended onto the end of the string.
 """
 
+# See doc comments below
+BYTE_UNITS = (
+    (1024, 1, "B"),
+    (1024 ** 2, 1024, "KB"),
+    (1024 ** 3, 1024 ** 2, "MB"),
+    (1024 ** 4, 1024 ** 3, "GB")
+)
+"""
+The byte units below TB, each given as the size at which the next unit is
+used instead, the number of bytes in the unit, and the unit abbreviation.  The
+divisors are powers of two, so a single division by the divisor gives exactly
+the same result as repeatedly dividing by 1024.
+"""
+
 class ByteUnit:
     """
     Contains static helper methods for formatting byte size measurements
@@ -21,9 +35,7 @@ class ByteUnit:
         Returns:
             str: The size formatted as a human readable string (e.g. "2.51 MB")
         """
-        units = ['B', 'KB', 'MB', 'GB']
-        for suffix in units:
-            if size < 1024:
-                return f"{size:.2f} {suffix}"
-            size /= 1024
-        return f"{size:.2f} TB"
\ No newline at end of file
+        for threshold, divisor, suffix in BYTE_UNITS:
+            if size < threshold:
+                return f"{size / divisor:.2f} {suffix}"
+        return f"{size / 1024 ** 4:.2f} TB"
\ No newline at end of file
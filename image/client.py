@@ -6,7 +6,6 @@ distribution registry API.
 
 import hashlib
 import json
-import re
 import requests
 import urllib
 from image.descriptor   import  ContainerImageDescriptor
@@ -18,17 +17,17 @@ from image.mediatypes   import  DOCKER_V2S2_MEDIA_TYPE, \
                                 DOCKER_V2S1_MEDIA_TYPE, \
                                 DOCKER_V2S1_SIGNED_MEDIA_TYPE
 from image.reference    import  ContainerImageReference
-from image.regex        import  ANCHORED_DIGEST
+from image.regex        import  is_valid_digest
 from typing             import  Dict, Tuple, Any, Union
 
-DEFAULT_REQUEST_MANIFEST_MEDIA_TYPES = [
+DEFAULT_REQUEST_MANIFEST_MEDIA_TYPES = (
     DOCKER_V2S2_LIST_MEDIA_TYPE,
     DOCKER_V2S2_MEDIA_TYPE,
     OCI_INDEX_MEDIA_TYPE,
     OCI_MANIFEST_MEDIA_TYPE,
     DOCKER_V2S1_MEDIA_TYPE,
     DOCKER_V2S1_SIGNED_MEDIA_TYPE
-]
+)
 """
 The default accepted mediaTypes for querying manifests
 """
@@ -62,16 +61,12 @@ class ContainerImageRegistryClient:
         if isinstance(str_or_ref, str):
             ref = ContainerImageReference(str_or_ref)
 
-        # Split reference into slash-separated components
-        # Get domain, it is the first element of the list
-        # Join all but the first and last components into the path
-        domain_components = ref.ref.split('/')
-        domain = domain_components[0]
-        path = "/".join(domain_components[1:-1])
-
-        # Get name, it is the last element of the list
-        # But if tag and/or digest, those must be parsed out of the name
-        name = domain_components[-1].split("@")[0].split(":")[0]
+        # The domain is the reference's first slash-separated component.  The
+        # path is the parsed name's components between the domain and the
+        # short name, which is empty for a single-component reference.
+        domain = ref.ref.partition("/")[0]
+        path = ref.get_name().partition("/")[2].rpartition("/")[0]
+        name = ref.get_short_name()
 
         # If the domain is docker.io, then convert it to registry-1.docker.io
         if domain == 'docker.io':
@@ -269,7 +264,8 @@ class ContainerImageRegistryClient:
     @staticmethod
     def query_manifest(
             str_or_ref: Union[str, ContainerImageReference],
-            auth: Dict[str, Any]
+            auth: Dict[str, Any],
+            head: bool = False
         ) -> requests.Response:
         """
         Fetches the manifest from the registry API and returns as a requests
@@ -278,6 +274,7 @@ class ContainerImageRegistryClient:
         Args:
             str_or_ref (Union[str, ContainerImageReference]): An image reference
             auth (Dict[str, Any]): A valid docker config JSON loaded into a dict
+            head (bool): Whether to send a HEAD request, fetching only the manifest's headers
 
         Returns:
             requests.Response: The registry API response
@@ -309,7 +306,8 @@ class ContainerImageRegistryClient:
         
         # Send the request to the distribution registry API
         # If it fails with a 401 response code and auth given, do OAuth dance
-        res = requests.get(api_url, headers=headers)
+        send = requests.head if head else requests.get
+        res = send(api_url, headers=headers)
         if res.status_code == 401 and \
             'www-authenticate' in res.headers.keys():
             # Do Oauth dance if basic auth fails
@@ -318,12 +316,42 @@ class ContainerImageRegistryClient:
                 res, reg_auth
             )
             headers['Authorization'] = f'{scheme} {token}'
-            res = requests.get(api_url, headers=headers)
+            res = send(api_url, headers=headers)
 
         # Raise exceptions on error status codes
         res.raise_for_status()
         return res
 
+    @staticmethod
+    def get_media_type(
+            str_or_ref: Union[str, ContainerImageReference],
+            auth: Dict[str, Any]
+        ) -> str:
+        """
+        Fetches the manifest mediaType from the registry API via a HEAD
+        request, without downloading the manifest itself
+
+        Args:
+            str_or_ref (Union[str, ContainerImageReference]): An image reference
+            auth (Dict[str, Any]): A valid docker config JSON loaded into a dict
+
+        Returns:
+            str: The manifest mediaType, or an empty string if not given
+        """
+        # If given a str, then load as a ref
+        ref = str_or_ref
+        if isinstance(str_or_ref, str):
+            ref = ContainerImageReference(str_or_ref)
+
+        # Query the manifest headers, get the manifest response
+        res = ContainerImageRegistryClient.query_manifest(
+            ref, auth, head=True
+        )
+
+        # Parse the mediaType from the Content-Type header, without parameters
+        content_type = str(res.headers.get('Content-Type', ""))
+        return content_type.partition(";")[0].strip()
+
     @staticmethod
     def get_manifest(
             str_or_ref: Union[str, ContainerImageReference],
@@ -391,7 +419,7 @@ class ContainerImageRegistryClient:
             digest = hashlib.sha256(encoded_manifest).hexdigest()
 
         # Validate the digest, return if valid
-        if not bool(re.match(ANCHORED_DIGEST, digest)):
+        if not is_valid_digest(digest):
             raise ContainerImageError(
                 f"Invalid digest: {digest}"
             )
@@ -400,7 +428,8 @@ class ContainerImageRegistryClient:
     @staticmethod
     def delete(
             str_or_ref: Union[str, ContainerImageReference],
-            auth: Dict[str, Any]
+            auth: Dict[str, Any],
+            session: Union[requests.Session, None] = None
         ):
         """
         Deletes the reference from the registry using the registry API
@@ -408,6 +437,7 @@ class ContainerImageRegistryClient:
         Args:
             str_or_ref (Union[str, ContainerImage]): An image reference
             auth (Dict[str, Any]): A valid docker config JSON loaded into a dict
+            session (Union[requests.Session, None]): A session to send the requests through, reusing its connections across deletes
         """
         # If given a str, then load as a ref
         ref = str_or_ref
@@ -432,9 +462,11 @@ class ContainerImageRegistryClient:
         if found:
             headers['Authorization'] = f'Basic {reg_auth}'
         
-        # Send the request to the distribution registry API
+        # Send the request to the distribution registry API, through the
+        # session if given
         # If it fails with a 401 response code and auth given, do OAuth dance
-        res = requests.delete(api_url, headers=headers)
+        http = session if session is not None else requests
+        res = http.delete(api_url, headers=headers)
         if res.status_code == 401 and \
             'www-authenticate' in res.headers.keys():
             # Do Oauth dance if basic auth fails
@@ -443,7 +475,7 @@ class ContainerImageRegistryClient:
                 res, reg_auth
             )
             headers['Authorization'] = f'{scheme} {token}'
-            res = requests.delete(api_url, headers=headers)
+            res = http.delete(api_url, headers=headers)
 
         # Raise exceptions on error status codes
         res.raise_for_status()
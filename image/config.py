@@ -4,8 +4,9 @@ configuration for a container image.
 """
 
 from typing import Dict, Any, Tuple, Type, Union
-from jsonschema import validate, ValidationError
-from image.configschema import CONTAINER_IMAGE_CONFIG_SCHEMA
+from jsonschema import ValidationError
+from image.validators import CONTAINER_IMAGE_CONFIG_VALIDATOR, \
+                             validate_instance
 from image.platform import ContainerImagePlatform
 
 class ContainerImageConfig:
@@ -22,14 +23,10 @@ class ContainerImageConfig:
         Returns:
             Tuple[bool, str]: Whether the config is valid, error message
         """
-        try:
-            validate(
-                instance=config,
-                schema=CONTAINER_IMAGE_CONFIG_SCHEMA
-            )
-        except Exception as e:
-            return False, str(e)
-        return True, ""
+        return validate_instance(
+            CONTAINER_IMAGE_CONFIG_VALIDATOR,
+            config
+        )
     
     def __init__(self, config: Dict[str, Any]):
         """
@@ -9,14 +9,23 @@ metadata and mutating the image through the registry API.
 from __future__ import annotations
 import json
 import requests
+import sys
+from concurrent.futures     import  ThreadPoolExecutor
 from typing                 import  List, Dict, Any, \
-                                    Union, Type, Iterator
+                                    Union, Type, Iterator, Tuple, \
+                                    Iterable
 from image.byteunit         import  ByteUnit
 from image.client           import  ContainerImageRegistryClient
 from image.config           import  ContainerImageConfig
+from image.descriptor       import  ContainerImageDescriptor
 from image.errors           import  ContainerImageError
 from image.manifestfactory  import  ContainerImageManifestFactory
-from image.manifestlist     import  ContainerImageManifestList
+from image.manifestlist     import  ContainerImageManifestList, \
+                                    MANIFEST_FETCH_WORKERS_MAX
+from image.mediatypes       import  DOCKER_V2S2_MEDIA_TYPE, \
+                                    DOCKER_V2S2_LIST_MEDIA_TYPE, \
+                                    OCI_MANIFEST_MEDIA_TYPE, \
+                                    OCI_INDEX_MEDIA_TYPE
 from image.oci              import  ContainerImageManifestOCI, \
                                     ContainerImageIndexOCI
 from image.platform         import  ContainerImagePlatform
@@ -24,6 +33,26 @@ from image.reference        import  ContainerImageReference
 from image.v2s2             import  ContainerImageManifestV2S2, \
                                     ContainerImageManifestListV2S2
 
+# See doc comments below
+MANIFEST_LIST_MEDIA_TYPES = frozenset([
+    DOCKER_V2S2_LIST_MEDIA_TYPE,
+    OCI_INDEX_MEDIA_TYPE
+])
+"""
+The mediaTypes of multi-arch manifests, namely the v2s2 manifest list and the
+OCI image index.
+"""
+
+# See doc comments below
+ARCH_MANIFEST_MEDIA_TYPES = frozenset([
+    DOCKER_V2S2_MEDIA_TYPE,
+    OCI_MANIFEST_MEDIA_TYPE
+])
+"""
+The mediaTypes of single-arch manifests, namely the v2s2 manifest and the OCI
+manifest.
+"""
+
 #########################################
 # Classes for managing container images #
 #########################################
@@ -43,6 +72,8 @@ class ContainerImage(ContainerImageReference):
     through which users can specify their image reference, then query the
     registry API for information about the image.
     """
+    __slots__ = ("_manifest_cache", "_size_cache")
+
     @staticmethod
     def is_manifest_list_static(
             manifest: Union[
@@ -97,8 +128,42 @@ class ContainerImage(ContainerImageReference):
         if not valid:
             raise ContainerImageError(err)
 
-        # Set the image reference property
-        self.ref = ref
+        # If valid, initialize the image
+        self._initialize(ref)
+
+    @classmethod
+    def _from_validated(cls, ref: str) -> "ContainerImage":
+        """
+        Instantiates the image class without validating the reference.  Only
+        for use when the reference has already been validated against the
+        class's validate_static method.
+
+        Args:
+            ref (str): The validated image reference
+
+        Returns:
+            ContainerImage: The image instance
+        """
+        instance = cls.__new__(cls)
+        instance._initialize(ref)
+        return instance
+
+    def _initialize(self, ref: str):
+        """
+        Initializes the image's properties from a validated image reference
+
+        Args:
+            ref (str): The validated image reference
+        """
+        # Set the image reference property, interned so that instances for
+        # the same reference share a single string
+        self.ref = sys.intern(ref)
+
+        # Initialize the caches of manifests fetched from the registry and of
+        # the sizes calculated from them, keyed by the reference and the id of
+        # the auth used.  Only digest references are cached, see get_manifest.
+        self._manifest_cache = {}
+        self._size_cache = {}
     
     def validate(self) -> bool:
         """
@@ -161,7 +226,13 @@ class ContainerImage(ContainerImageReference):
             ContainerImageIndexOCI
         ]:
         """
-        Fetches the manifest from the distribution registry API
+        Fetches the manifest from the distribution registry API.  For digest
+        references, whose manifest is content-addressed and so cannot change,
+        the manifest is cached per auth, so subsequent calls with the same
+        auth reuse it rather than fetching it again.  Tag references are
+        always fetched, since the tag may since have been pushed to, which
+        keeps the manifest consistent with get_digest.  Use invalidate to
+        clear the cache.
 
         Args:
             auth (Dict[str, Any]): A valid docker config JSON with auth into this image's registry
@@ -173,11 +244,53 @@ class ContainerImage(ContainerImageReference):
         valid, err = self.validate()
         if not valid:
             raise ContainerImageError(err)
+
+        # Return the cached manifest if it was already fetched for this ref
+        key = (self.ref, id(auth))
+        entry = self._get_cache_entry(self._manifest_cache, auth)
+        if entry is not None:
+            return entry[1]
         
-        # Use the container image registry client to get the manifest
-        return ContainerImageManifestFactory.create(
+        # Use the container image registry client to get the manifest, caching
+        # it only if it cannot change
+        manifest = ContainerImageManifestFactory.create(
             ContainerImageRegistryClient.get_manifest(self, auth)
         )
+        if self.is_digest_ref():
+            self._manifest_cache[key] = (auth, manifest)
+        return manifest
+
+    def _get_cache_entry(
+            self,
+            cache: Dict[Tuple[str, int], Tuple[Dict[str, Any], Any]],
+            auth: Dict[str, Any]
+        ) -> Union[Tuple[Dict[str, Any], Any], None]:
+        """
+        Looks up the entry cached for this image's current reference and the
+        given auth.  The auth is stored in each entry and compared by
+        identity, so an entry is never returned for a different auth which
+        happens to reuse the id of a garbage-collected one.
+
+        Args:
+            cache (Dict[Tuple[str, int], Tuple[Dict[str, Any], Any]]): The cache to look up
+            auth (Dict[str, Any]): The auth the entry was cached for
+
+        Returns:
+            Union[Tuple[Dict[str, Any], Any], None]: The cached (auth, value) entry, or None
+        """
+        entry = cache.get((self.ref, id(auth)))
+        if entry is not None and entry[0] is auth:
+            return entry
+        return None
+
+    def invalidate(self):
+        """
+        Clears the manifests cached by get_manifest and the sizes cached by
+        get_size, so that the manifest is fetched from the registry again on
+        next use
+        """
+        self._manifest_cache = {}
+        self._size_cache = {}
     
     def exists(self, auth: Dict[str, Any]) -> bool:
         """
@@ -201,7 +314,9 @@ class ContainerImage(ContainerImageReference):
 
     def is_manifest_list(self, auth: Dict[str, Any]) -> bool:
         """
-        Determine if the image is a manifest list
+        Determine if the image is a manifest list.  Unless the manifest is
+        already cached, only its mediaType is fetched from the registry, and
+        the full manifest is fetched only if the mediaType is not recognized.
 
         Args:
             auth (Dict[str, Any]): A valid docker config JSON with auth into this image's registry
@@ -209,6 +324,22 @@ class ContainerImage(ContainerImageReference):
         Returns:
             bool: Whether the image is a manifest list or single-arch
         """
+        # Ensure the ref is valid, if not raise an exception
+        valid, err = self.validate()
+        if not valid:
+            raise ContainerImageError(err)
+
+        # Determine from the manifest mediaType unless the manifest is cached
+        if self._get_cache_entry(self._manifest_cache, auth) is None:
+            media_type = ContainerImageRegistryClient.get_media_type(
+                self, auth
+            )
+            if media_type in MANIFEST_LIST_MEDIA_TYPES:
+                return True
+            if media_type in ARCH_MANIFEST_MEDIA_TYPES:
+                return False
+
+        # Otherwise determine from the manifest itself
         return ContainerImage.is_manifest_list_static(self.get_manifest(auth))
 
     def is_oci(self, auth: Dict[str, Any]) -> bool:
@@ -238,7 +369,9 @@ class ContainerImage(ContainerImageReference):
     def get_size(self, auth: Dict[str, Any]) -> int:
         """
         Calculates the size of the image by fetching its manifest metadata
-        from the registry.
+        from the registry.  For digest references the size is cached
+        alongside the manifest, so for manifest lists the arch manifests are
+        only fetched on the first call.
 
         Args:
             auth (Dict[str, Any]): A valid docker config JSON loaded into a dict
@@ -246,12 +379,26 @@ class ContainerImage(ContainerImageReference):
         Returns:
             int: The size of the image in bytes
         """
+        # Ensure the ref is valid, if not raise an exception
+        valid, err = self.validate()
+        if not valid:
+            raise ContainerImageError(err)
+
+        # Return the cached size if it was already calculated for this ref
+        key = (self.ref, id(auth))
+        entry = self._get_cache_entry(self._size_cache, auth)
+        if entry is not None:
+            return entry[1]
+
         # Get the manifest and calculate its size
         manifest = self.get_manifest(auth)
         if ContainerImage.is_manifest_list_static(manifest):
-            return manifest.get_size(self.get_name(), auth)
+            size = manifest.get_size(self.get_name(), auth)
         else:
-            return manifest.get_size()
+            size = manifest.get_size()
+        if self.is_digest_ref():
+            self._size_cache[key] = (auth, size)
+        return size
 
     def get_size_formatted(self, auth: Dict[str, Any]) -> str:
         """
@@ -266,29 +413,64 @@ class ContainerImage(ContainerImageReference):
         """
         return ByteUnit.format_size_bytes(self.get_size(auth))
     
-    def delete(self, auth: Dict[str, Any]):
+    def delete(
+            self,
+            auth: Dict[str, Any],
+            session: Union[requests.Session, None] = None
+        ):
         """
         Deletes the image from the registry.
 
         Args:
             auth (Dict[str, Any]): A valid docker config JSON loaded into a dict
+            session (Union[requests.Session, None]): A session to send the request through, reusing its connections
         """
         # Ensure the ref is valid, if not raise an exception
         valid, err = self.validate()
         if not valid:
             raise ContainerImageError(err)
-        ContainerImageRegistryClient.delete(self, auth)
+        ContainerImageRegistryClient.delete(self, auth, session=session)
+        self.invalidate()
 
 class ContainerImageList:
     """
     Represents a list of ContainerImages. Enables performing bulk actions
     against many container images at once.
     """
+    __slots__ = ("images",)
+
     def __init__(self):
         """
         Constructor for ContainerImageList class
         """
         self.images = []
+
+    @staticmethod
+    def from_refs(refs: Iterable[str]) -> "ContainerImageList":
+        """
+        Constructs a ContainerImageList from many image references at once.
+        Each distinct reference is validated only once, however many times it
+        occurs, and every image is still constructed as a distinct instance.
+
+        Args:
+            refs (Iterable[str]): The image references
+
+        Returns:
+            ContainerImageList: The list of images, in the order given
+        """
+        # Validate each distinct reference, raising on the first invalid one
+        img_list = ContainerImageList()
+        validated = set()
+        for ref in refs:
+            if ref not in validated:
+                valid, err = ContainerImage.validate_static(ref)
+                if not valid:
+                    raise ContainerImageError(err)
+                validated.add(ref)
+
+            # Construct the image without validating its reference again
+            img_list.images.append(ContainerImage._from_validated(ref))
+        return img_list
     
     def __len__(self) -> int:
         """
@@ -327,48 +509,43 @@ class ContainerImageList:
         Returns:
             int: The deduplicated size of all container images in the list
         """
-        # Aggregate all layer and config digests, sum manifest list entries
+        # Fetching is bound by registry round trips, so each image's manifest
+        # and then each arch manifest are fetched concurrently, all through a
+        # single pool bounded to MANIFEST_FETCH_WORKERS_MAX
         entry_sizes = 0
-        layers = {}
-        configs = {}
-
-        # Loop through each image in the list
-        for image in self.images:
-            # Get the image's manifest
-            manifest = image.get_manifest(auth)
-
-            # If a manifest list, get its configs, entry sizes, layers
-            image_layers = []
-            image_configs = []
-            if ContainerImage.is_manifest_list_static(manifest):
+        manifest_dicts = []
+        arch_refs = {}
+        with ThreadPoolExecutor(
+                max_workers=MANIFEST_FETCH_WORKERS_MAX
+            ) as executor:
+            # Get each image's manifest.  Arch manifests are used directly,
+            # while manifest lists contribute their entry sizes and the unique
+            # arch manifests they reference, deduplicated across the list.
+            manifests = executor.map(
+                lambda image: image.get_manifest(auth),
+                self.images
+            )
+            for image, manifest in zip(self.images, manifests):
+                if not ContainerImage.is_manifest_list_static(manifest):
+                    manifest_dicts.append(manifest.manifest)
+                    continue
                 entry_sizes += manifest.get_entry_sizes()
-                image_layers = manifest.get_layer_descriptors(image.get_name(), auth)
-                image_configs = manifest.get_config_descriptors(image.get_name(), auth)
-            # If an arch manifest, get its config, layers
-            else:
-                image_configs = [manifest.get_config_descriptor()]
-                image_layers = manifest.get_layer_descriptors()
-            
-            # Append the configs & layers to the aggregated dicts
-            for image_config in image_configs:
-                config_digest = image_config.get_digest()
-                config_size = image_config.get_size()
-                configs[config_digest] = config_size
-            for image_layer in image_layers:
-                layer_digest = image_layer.get_digest()
-                layer_size = image_layer.get_size()
-                layers[layer_digest] = layer_size
-        
-        # Calculate the layer and config sizes
-        layer_sizes = 0
-        config_sizes = 0
-        for digest in layers.keys():
-            layer_sizes += layers[digest]
-        for digest in configs.keys():
-            config_sizes += configs[digest]
-        
-        # Return the summed size
-        return layer_sizes + config_sizes + entry_sizes
+                name = image.get_name()
+                for entry in manifest.get_entries():
+                    arch_refs[f"{name}@{entry.get_digest()}"] = None
+
+            # Fetch each unique arch manifest referenced by a manifest list
+            manifest_dicts.extend(executor.map(
+                lambda ref: ContainerImageRegistryClient.get_manifest(
+                    ref, auth
+                ),
+                arch_refs
+            ))
+
+        # Sum the deduplicated config and layer sizes and the entry sizes
+        get_sizes = ContainerImageManifestList.get_descriptor_sizes_static
+        configs, layers = get_sizes(manifest_dicts)
+        return sum(configs.values()) + sum(layers.values()) + entry_sizes
     
     def get_size_formatted(self, auth: Dict[str, Any]) -> str:
         """
@@ -390,8 +567,11 @@ class ContainerImageList:
         Args:
             auth (Dict[str, Any]): A valid docker config JSON dict
         """
-        for image in self.images:
-            image.delete(auth)
+        # Share one session across the deletes so that connections to each
+        # registry are reused rather than reestablished per image
+        with requests.Session() as session:
+            for image in self.images:
+                image.delete(auth, session=session)
 
     def diff(self, previous: Type[ContainerImageList]) -> Type[ContainerImageListDiff]:
         """
@@ -409,38 +589,43 @@ class ContainerImageList:
         # Initialize a ContainerImageListDiff
         diff = ContainerImageListDiff()
 
-        # Construct a mapping of image name to current and prev image instance
-        images = {}
-        for image in self.images:
-            image_name = image.get_name()
-            if image_name not in images:
-                images[image_name] = {}
-            images[image_name]['current'] = image
-        for image in previous.images:
-            image_name = image.get_name()
-            if image_name not in images:
-                images[image_name] = {}
-            images[image_name]['previous'] = image
-
-        # Use the mapping to populate the diff
-        for image_name, keys in images.items():
-            if 'current' in keys and 'previous' in keys:
-                current_identifier = images[image_name]['current'].get_identifier()
-                previous_identifier = images[image_name]['previous'].get_identifier()
-                if current_identifier == previous_identifier:
-                    diff.common.append(images[image_name]['current'])
-                    continue
-                diff.updated.append(images[image_name]['current'])
-            elif 'current' in images[image_name]:
-                diff.added.append(images[image_name]['current'])
-            elif 'previous' in images[image_name]:
-                diff.removed.append(images[image_name]['previous'])
+        # Map each image name to its current and previous image instance
+        current_images = { image.get_name(): image for image in self.images }
+        previous_images = {
+            image.get_name(): image for image in previous.images
+        }
+
+        # Use the mappings to populate the diff via hashed lookups
+        for image_name, current in current_images.items():
+            previous_image = previous_images.get(image_name)
+            if previous_image is None:
+                diff.added.append(current)
+            elif current.get_identifier() == previous_image.get_identifier():
+                diff.common.append(current)
+            else:
+                diff.updated.append(current)
+        for image_name, previous_image in previous_images.items():
+            if image_name not in current_images:
+                diff.removed.append(previous_image)
         return diff
 
+    def __json__(self) -> List[Dict[str, Any]]:
+        """
+        Formats the ContainerImageList as a JSON list.  Each image is formatted
+        here directly, so serializing the list needs a single call into the
+        JSON encoder's default function rather than one call per image.
+
+        Returns:
+            List[Dict[str, Any]]: The ContainerImageList as a JSON list
+        """
+        return [ { "ref": image.ref } for image in self.images ]
+
 class ContainerImageListDiff:
     """
     Represents a diff between two ContainerImageLists
     """
+    __slots__ = ("added", "removed", "updated", "common")
+
     def __init__(self):
         """
         Constructor for the ContainerImageListDiff class
@@ -457,20 +642,25 @@ class ContainerImageListDiff:
         Returns:
             str: The ContainerImageListDiff formatted as a string
         """
-        # Format the summary
-        summary =   f"Added:\t{len(self.added)}\n" + \
-                    f"Removed:\t{len(self.removed)}\n" + \
-                    f"Updated:\t{len(self.updated)}\n" + \
-                    f"Common:\t{len(self.common)}"
-        
-        # Format the added, removed, updated, and common sections
-        added = "\n".join([str(img) for img in self.added])
-        removed = "\n".join([str(img) for img in self.removed])
-        updated = "\n".join([str(img) for img in self.updated])
-        common = "\n".join([str(img) for img in self.common])
-
-        # Format the stringified diff
-        diff_str =  f"Summary\n{summary}\n\nAdded\n{added}\n\n" + \
-                    f"Removed\n{removed}\n\nUpdated\n{updated}\n\n" + \
-                    f"Common\n{common}"
-        return diff_str
+        # Format the summary, then each of the added, removed, updated, and
+        # common sections, joining every line of the diff in a single pass
+        lines = [
+            "Summary",
+            f"Added:\t{len(self.added)}",
+            f"Removed:\t{len(self.removed)}",
+            f"Updated:\t{len(self.updated)}",
+            f"Common:\t{len(self.common)}"
+        ]
+        sections = (
+            ("Added", self.added),
+            ("Removed", self.removed),
+            ("Updated", self.updated),
+            ("Common", self.common)
+        )
+        for title, images in sections:
+            lines.append("")
+            lines.append(title)
+            lines.extend(str(img) for img in images)
+            if len(images) == 0:
+                lines.append("")
+        return "\n".join(lines)
@@ -4,11 +4,11 @@ docker v2s2 and OCI specifications for layer, config, and blob descriptors
 """
 
 import json
-import re
-from jsonschema             import  validate, ValidationError
+from jsonschema             import  ValidationError
 from typing                 import  Dict, Any, Tuple, Union, List
-from image.manifestschema   import  MANIFEST_DESCRIPTOR_SCHEMA
-from image.regex            import  ANCHORED_DIGEST
+from image.regex            import  is_valid_digest
+from image.validators       import  MANIFEST_DESCRIPTOR_VALIDATOR, \
+                                    validate_instance
 
 class ContainerImageDescriptor:
     """
@@ -20,6 +20,8 @@ class ContainerImageDescriptor:
     v2s2 config & layer schemas, which are effectively just descriptors.  Hence,
     we reuse this class across both v2s2 layers / configs, and OCI descriptors.
     """
+    __slots__ = ("descriptor",)
+
     @staticmethod
     def validate_static(descriptor: Dict[str, Any]) -> Tuple[bool, str]:
         """
@@ -32,22 +34,44 @@ class ContainerImageDescriptor:
         Tuple[bool, str]: Whether the descriptor metadata is valid, error msg
         """
         # Validate against the descriptor JSON schema
-        try:
-            validate(
-                instance=descriptor,
-                schema=MANIFEST_DESCRIPTOR_SCHEMA
-            )
-        except Exception as e:
-            return False, str(e)
+        valid, err = validate_instance(
+            MANIFEST_DESCRIPTOR_VALIDATOR,
+            descriptor
+        )
+        if not valid:
+            return False, err
         
         # Validate the digest
-        digest_valid = bool(re.match(ANCHORED_DIGEST, descriptor["digest"]))
+        digest_valid = is_valid_digest(descriptor["digest"])
         if not digest_valid:
             return False, f"Invalid digest: {descriptor['digest']}"
         
         # If both are valid, the descriptor is valid
         return True, ""
 
+    @staticmethod
+    def get_sizes_static(descriptors: List[Dict[str, Any]]) -> Dict[str, int]:
+        """
+        Validates a list of descriptor metadata and returns the size of each
+        keyed by digest, deduplicating descriptors which share a digest.  Reads
+        the metadata directly rather than instantiating a
+        ContainerImageDescriptor per descriptor, so each descriptor is only
+        validated once.
+
+        Args:
+        descriptors (List[Dict[str, Any]]): The descriptor metadata list
+
+        Returns:
+        Dict[str, int]: The size of each descriptor keyed by digest
+        """
+        sizes = {}
+        for descriptor in descriptors:
+            valid, err = ContainerImageDescriptor.validate_static(descriptor)
+            if not valid:
+                raise ValidationError(err)
+            sizes[descriptor["digest"]] = int(descriptor["size"])
+        return sizes
+
     def __init__(self, descriptor: Dict[str, Any]):
         """
         Constructor for the ContainerImageDescriptor class
@@ -88,7 +112,7 @@ class ContainerImageDescriptor:
         str: The layer digest
         """
         digest = self.descriptor.get("digest")
-        valid = bool(re.match(ANCHORED_DIGEST, digest))
+        valid = is_valid_digest(digest)
         if not valid:
             raise ValidationError(f"Invalid digest: {digest}")
         return digest
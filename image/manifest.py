@@ -14,6 +14,8 @@ class ContainerImageManifest:
     ContainerImageManifestOCI since the two specs are very similar, with the
     v2s2 spec being more restrictive than the OCI spec.
     """
+    __slots__ = ("manifest",)
+
     def __init__(self, manifest: Dict[str, Any]):
         """
         Constructor for the ContainerImageManifest class
@@ -23,6 +25,23 @@ class ContainerImageManifest:
         """
         self.manifest = manifest
 
+    @classmethod
+    def _from_validated(cls, manifest: Dict[str, Any]) -> "ContainerImageManifest":
+        """
+        Instantiates the manifest class without validating the manifest.  Only
+        for use when the manifest has already been validated against the
+        class's validate_static method.
+
+        Args:
+            manifest (Dict[str, Any]): The validated manifest loaded into a dict
+
+        Returns:
+            ContainerImageManifest: The manifest instance
+        """
+        instance = cls.__new__(cls)
+        ContainerImageManifest.__init__(instance, manifest)
+        return instance
+
     def get_layer_descriptors(self) -> List[ContainerImageDescriptor]:
         """
         Returns a list of the container image's layer descriptors, defaults to
@@ -71,21 +90,14 @@ class ContainerImageManifest:
             int: The container image manifest size in bytes
         """
         # Get the config size
-        config = self.get_config_descriptor()
-        config_size = config.get_size()
-
-        # Deduplicate the layers in a dict
-        layers = self.get_layer_descriptors()
-        layer_dict = {}
-        for layer in layers:
-            digest = layer.get_digest()
-            size = layer.get_size()
-            layer_dict[digest] = size
-
-        # Get the deduplicated layer sizes
-        layer_size = 0
-        for digest in layer_dict.keys():
-            layer_size += layer_dict[digest]
+        get_sizes = ContainerImageDescriptor.get_sizes_static
+        config_size = sum(get_sizes([ self.manifest.get("config") ]).values())
+
+        # Get the layer sizes, deduplicated by digest
+        layers = list(self.manifest.get("layers"))
+        if len(layers) == 0:
+            raise ValueError("No layers found")
+        layer_size = sum(get_sizes(layers).values())
 
         # Add and return the size of the manifest
         return config_size + layer_size
@@ -4,12 +4,42 @@ can be passed in, and the factory can determine which manifest type to return
 """
 
 import json
-from image.errors   import  ContainerImageError
-from image.oci      import  ContainerImageManifestOCI, \
-                            ContainerImageIndexOCI
-from image.v2s2     import  ContainerImageManifestV2S2, \
-                            ContainerImageManifestListV2S2
-from typing         import  Dict, Any, Union
+from image.errors       import  ContainerImageError
+from image.mediatypes   import  DOCKER_V2S2_MEDIA_TYPE, \
+                                DOCKER_V2S2_LIST_MEDIA_TYPE, \
+                                OCI_MANIFEST_MEDIA_TYPE, \
+                                OCI_INDEX_MEDIA_TYPE
+from image.oci          import  ContainerImageManifestOCI, \
+                                ContainerImageIndexOCI
+from image.v2s2         import  ContainerImageManifestV2S2, \
+                                ContainerImageManifestListV2S2
+from typing             import  Dict, Any, Union
+
+# See doc comments below
+MANIFEST_TYPES = (
+    ContainerImageManifestV2S2,
+    ContainerImageManifestListV2S2,
+    ContainerImageManifestOCI,
+    ContainerImageIndexOCI
+)
+"""
+The manifest types which ContainerImageManifestFactory.create can return, in
+the order in which they are tried.
+"""
+
+# See doc comments below
+MANIFEST_TYPES_BY_MEDIA_TYPE = {
+    DOCKER_V2S2_MEDIA_TYPE: ContainerImageManifestV2S2,
+    DOCKER_V2S2_LIST_MEDIA_TYPE: ContainerImageManifestListV2S2,
+    OCI_MANIFEST_MEDIA_TYPE: ContainerImageManifestOCI,
+    OCI_INDEX_MEDIA_TYPE: ContainerImageIndexOCI
+}
+"""
+The manifest type expected for each manifest mediaType.  The manifest schemas
+disallow additional properties, and the v2s2 types reject the OCI mediaTypes,
+so a manifest which is valid as the type expected for its mediaType could not
+have been valid as any type tried before it.
+"""
 
 class ContainerImageManifestFactory:
     """
@@ -96,33 +126,34 @@ class ContainerImageManifestFactory:
         Returns:
             Union[ContainerImageManifestV2S2,ContainerImageManifestListV2S2,ContainerImageManifestOCI,ContainerImageIndexOCI]: Manifest or manifest list objects for the OCI & v2s2 specs
         """
-        # Validate whether this is a v2s2 manifest
-        is_v2s2_manifest, vm_err = ContainerImageManifestV2S2.validate_static(
-            manifest_or_list
-        )
-        if is_v2s2_manifest:
-            return ContainerImageManifestV2S2(manifest_or_list)
-
-        # If not, validate whether this is a v2s2 manifest list
-        is_v2s2_list, l_err = ContainerImageManifestListV2S2.validate_static(
-            manifest_or_list
-        )
-        if is_v2s2_list:
-            return ContainerImageManifestListV2S2(manifest_or_list)
-        
-        # If not, validate whether this is an OCI manifest
-        is_oci_manifest, om_err = ContainerImageManifestOCI.validate_static(
-            manifest_or_list
-        )
-        if is_oci_manifest:
-            return ContainerImageManifestOCI(manifest_or_list)
-
-        # If not, validate whether this is an OCI image index
-        is_oci_index, i_err = ContainerImageIndexOCI.validate_static(
-            manifest_or_list
-        )
-        if is_oci_index:
-            return ContainerImageIndexOCI(manifest_or_list)
+        # Each candidate type is validated here, so instantiate the matching
+        # type without validating a second time in its constructor
+
+        # Try the type expected for the mediaType first, so that a valid
+        # manifest is usually validated once.  The mediaType is only optional
+        # in the OCI spec, so without one this is an OCI manifest or index.
+        expected = None
+        if isinstance(manifest_or_list, dict):
+            media_type = manifest_or_list.get("mediaType")
+            if media_type is None:
+                if "manifests" in manifest_or_list:
+                    expected = ContainerImageIndexOCI
+                else:
+                    expected = ContainerImageManifestOCI
+            elif isinstance(media_type, str):
+                expected = MANIFEST_TYPES_BY_MEDIA_TYPE.get(media_type)
+        if expected is not None:
+            valid, err = expected.validate_static(manifest_or_list)
+            if valid:
+                return expected._from_validated(manifest_or_list)
+
+        # Otherwise validate against each of the remaining types in turn
+        for manifest_type in MANIFEST_TYPES:
+            if manifest_type is expected:
+                continue
+            valid, err = manifest_type.validate_static(manifest_or_list)
+            if valid:
+                return manifest_type._from_validated(manifest_or_list)
 
         # If neither, raise a ValidationError
         raise ContainerImageError(
@@ -4,14 +4,23 @@ docker v2s2 and OCI specifications for their respective manifest list
 implementations
 """
 
-import re
 import json
+from concurrent.futures         import ThreadPoolExecutor
 from image.client               import ContainerImageRegistryClient
 from image.descriptor           import ContainerImageDescriptor
 from image.manifest             import ContainerImageManifest
 from image.manifestlistentry    import ContainerImageManifestListEntry
-from image.regex                import ANCHORED_NAME
-from typing                     import Dict, Any, List
+from image.regex                import NAME_RE
+from typing                     import Dict, Any, List, Iterable, \
+                                       Tuple
+
+# See doc comments below
+MANIFEST_FETCH_WORKERS_MAX = 32
+"""
+The maximum number of arch manifests fetched from the registry concurrently.
+Fetching is bound by registry round trips rather than CPU, so the pool is
+sized to the number of manifests up to this cap, rather than to the CPU count.
+"""
 
 class ContainerImageManifestList:
     """
@@ -20,6 +29,8 @@ class ContainerImageManifestList:
     ContainerImageManifestListOCI since the two specs are very similar, with the
     v2s2 spec being more restrictive than the OCI spec.
     """
+    __slots__ = ("manifest_list",)
+
     def __init__(self, manifest_list: Dict[str, Any]):
         """
         Constructor for the ContainerImageManifestList class
@@ -29,6 +40,26 @@ class ContainerImageManifestList:
         """
         self.manifest_list = manifest_list
 
+    @classmethod
+    def _from_validated(
+            cls,
+            manifest_list: Dict[str, Any]
+        ) -> "ContainerImageManifestList":
+        """
+        Instantiates the manifest list class without validating the manifest
+        list.  Only for use when the manifest list has already been validated
+        against the class's validate_static method.
+
+        Args:
+            manifest_list (Dict[str, Any]): The validated manifest list dict
+
+        Returns:
+            ContainerImageManifestList: The manifest list instance
+        """
+        instance = cls.__new__(cls)
+        ContainerImageManifestList.__init__(instance, manifest_list)
+        return instance
+
     def get_entries(self) -> List[ContainerImageManifestListEntry]:
         """
         Returns the manifest list entries as ContainerImageManifestListEntry
@@ -63,6 +94,47 @@ class ContainerImageManifestList:
             size += entry.get_size()
         return size
 
+    def _fetch_manifest_dicts(self, name: str, auth: Dict[str, Any]) -> Dict[
+            str, Dict[str, Any]
+        ]:
+        """
+        Fetches the arch manifests from the distribution registry API, keyed
+        by digest.  Manifests are content-addressed, so entries sharing a
+        digest share a manifest, and each unique digest is only fetched once.
+        The unique manifests are fetched concurrently, unless there is only
+        one to fetch.
+
+        Args:
+            name (str): A valid image name, the name of the manifest
+            auth (Dict[str, Any]): A valid docker config JSON dict
+
+        Returns:
+            Dict[str, Dict[str, Any]]: The arch manifest dicts keyed by digest
+        """
+        # Get the unique entry digests, preserving their order
+        digests = list(dict.fromkeys(
+            entry.get_digest() for entry in self.get_entries()
+        ))
+
+        # A single manifest is fetched directly, without a thread pool
+        if len(digests) <= 1:
+            return {
+                digest: ContainerImageRegistryClient.get_manifest(
+                    f"{name}@{digest}", auth
+                ) for digest in digests
+            }
+
+        # Get each arch image's manifest from the registry concurrently
+        workers = min(len(digests), MANIFEST_FETCH_WORKERS_MAX)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            manifests = executor.map(
+                lambda digest: ContainerImageRegistryClient.get_manifest(
+                    f"{name}@{digest}", auth
+                ),
+                digests
+            )
+            return dict(zip(digests, manifests))
+
     def get_manifests(self, name: str, auth: Dict[str, Any]) -> List[
             ContainerImageManifest
         ]:
@@ -77,23 +149,18 @@ class ContainerImageManifestList:
             List[ContainerImageManifest]: The arch manifests
         """
         # Validate the image name
-        valid = bool(re.match(ANCHORED_NAME, name))
+        valid = NAME_RE.fullmatch(name) is not None
         if not valid:
             return False, f"Invalid name: {name}"
 
-        # Loop through each manifest in the manifest list
+        # Fetch each unique arch manifest once, then append one manifest per
+        # entry to the list
+        manifest_dicts = self._fetch_manifest_dicts(name, auth)
         manifests = []
-        manifest_entries = self.get_entries()
-        for entry in manifest_entries:
-            # Construct and validate the arch image ref
-            manifest_digest = entry.get_digest()
-            ref = f"{name}@{manifest_digest}"
-
-            # Get the arch image's manifest from the registry, append to list
-            manifest_dict = ContainerImageRegistryClient.get_manifest(
-                ref, auth
+        for entry in self.get_entries():
+            manifest = ContainerImageManifest(
+                manifest_dicts[entry.get_digest()]
             )
-            manifest = ContainerImageManifest(manifest_dict)
             manifests.append(manifest)
         
         # Return the list of manifests
@@ -150,6 +217,35 @@ class ContainerImageManifestList:
         """
         return str(self.manifest_list.get("mediaType"))
 
+    @staticmethod
+    def get_descriptor_sizes_static(
+            manifest_dicts: Iterable[Dict[str, Any]]
+        ) -> Tuple[Dict[str, int], Dict[str, int]]:
+        """
+        Reads the config and layer sizes of each of the given arch manifests,
+        keyed and deduplicated by digest across all of the manifests, without
+        instantiating a descriptor for each
+
+        Args:
+            manifest_dicts (Iterable[Dict[str, Any]]): The arch manifest dicts
+
+        Returns:
+            Tuple[Dict[str, int], Dict[str, int]]: The config sizes, layer sizes
+        """
+        configs = {}
+        layers = {}
+        get_sizes = ContainerImageDescriptor.get_sizes_static
+        for manifest_dict in manifest_dicts:
+            # Ensure the arch image has layers, as ContainerImageManifest does
+            manifest_layers = list(manifest_dict.get("layers"))
+            if len(manifest_layers) == 0:
+                raise ValueError("No layers found")
+
+            # Append the arch image's config and layers to the dicts
+            configs.update(get_sizes([ manifest_dict.get("config") ]))
+            layers.update(get_sizes(manifest_layers))
+        return configs, layers
+
     def get_size(self, name: str, auth: Dict[str, Any]) -> int:
         """
         Calculates the size of the image using the distribution registry API
@@ -162,43 +258,17 @@ class ContainerImageManifestList:
             int: The size of the manifest list in bytes
         """
         # Validate the image name
-        valid = bool(re.match(ANCHORED_NAME, name))
+        valid = NAME_RE.fullmatch(name) is not None
         if not valid:
             return False, f"Invalid name: {name}"
 
-        # Loop through each manifest in the manifest list
-        configs = {}
-        layers = {}
-        entry_sizes = 0
-        manifest_entries = self.get_entries()
-        for entry in manifest_entries:
-            # Get the manifest list entry size
-            entry_sizes += entry.get_size()
+        # Sum the size of each manifest list entry
+        entry_sizes = self.get_entry_sizes()
 
-            # Construct and validate the arch image ref
-            manifest_digest = entry.get_digest()
-            ref = f"{name}@{manifest_digest}"
-
-            # Get the arch image's manifest from the registry
-            manifest_dict = ContainerImageRegistryClient.get_manifest(
-                ref, auth
-            )
-            manifest = ContainerImageManifest(manifest_dict)
-
-            # Get the arch image's layer and config descriptors
-            manifest_layers = manifest.get_layer_descriptors()
-            manifest_config = manifest.get_config_descriptor()
-
-            # Append config to configs dict
-            config_digest = manifest_config.get_digest()
-            config_size = manifest_config.get_size()
-            configs[config_digest] = config_size
-
-            # Append layers to layers dict
-            for layer in manifest_layers:
-                layer_digest = layer.get_digest()
-                layer_size = layer.get_size()
-                layers[layer_digest] = layer_size
+        # Get the config and layer sizes of each unique arch manifest
+        manifest_dicts = self._fetch_manifest_dicts(name, auth)
+        get_sizes = ContainerImageManifestList.get_descriptor_sizes_static
+        configs, layers = get_sizes(manifest_dicts.values())
 
         # Sum the deduplicated size
         manifest_list_size = entry_sizes
@@ -5,10 +5,9 @@ list implementations
 """
 
 import json
-import re
 from jsonschema     import  ValidationError
 from typing         import  Dict, Any, Type
-from image.regex    import  ANCHORED_DIGEST
+from image.regex    import  is_valid_digest
 from image.platform import  ContainerImagePlatform
 
 class ContainerImageManifestListEntry:
@@ -19,6 +18,8 @@ class ContainerImageManifestListEntry:
     classes since the two specs are very similar, with the v2s2 spec being
     more restrictive than the OCI spec.
     """
+    __slots__ = ("entry",)
+
     def __init__(self, entry: Dict[str, Any]):
         """
         Constructor for the ContainerImageManifestListEntry class
@@ -27,6 +28,26 @@ class ContainerImageManifestListEntry:
             entry (Dict[str, Any]): The manifest list entry loaded into a dict
         """
         self.entry = entry
+
+    @classmethod
+    def _from_validated(
+            cls,
+            entry: Dict[str, Any]
+        ) -> "ContainerImageManifestListEntry":
+        """
+        Instantiates the manifest list entry class without validating the
+        entry.  Only for use when the entry has already been validated against
+        the class's validate_static method.
+
+        Args:
+            entry (Dict[str, Any]): The validated manifest list entry dict
+
+        Returns:
+            ContainerImageManifestListEntry: The manifest list entry instance
+        """
+        instance = cls.__new__(cls)
+        ContainerImageManifestListEntry.__init__(instance, entry)
+        return instance
     
     def get_digest(self) -> str:
         """
@@ -36,7 +57,7 @@ class ContainerImageManifestListEntry:
             str: The entry digest
         """
         digest = self.entry.get("digest")
-        valid = bool(re.match(ANCHORED_DIGEST, digest))
+        valid = is_valid_digest(digest)
         if not valid:
             raise ValidationError(f"Invalid digest: {digest}")
         return digest
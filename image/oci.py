@@ -3,36 +3,35 @@ Contains OCI-specific implementations of the container image manifest,
 manifest list entry, and manifest list classes
 """
 
-import re
 from typing                     import  Dict, Any, Tuple, List
-from jsonschema                 import  validate, ValidationError
-from image.descriptor           import  ContainerImageDescriptor
+from jsonschema                 import  ValidationError
 from image.manifest             import  ContainerImageManifest
 from image.manifestlist         import  ContainerImageManifestList
 from image.manifestlistentry    import  ContainerImageManifestListEntry
 from image.mediatypes           import  DOCKER_V2S2_LIST_MEDIA_TYPE, \
                                         DOCKER_V2S2_MEDIA_TYPE
-from image.platform             import  ContainerImagePlatform
-from image.regex                import  ANCHORED_DIGEST
-from image.ocischema            import  MANIFEST_OCI_SCHEMA, \
-                                        IMAGE_INDEX_OCI_SCHEMA, \
-                                        IMAGE_INDEX_ENTRY_OCI_SCHEMA
+from image.regex                import  is_valid_digest
+from image.validators           import  MANIFEST_OCI_VALIDATOR, \
+                                        IMAGE_INDEX_ENTRY_OCI_VALIDATOR, \
+                                        IMAGE_INDEX_ENTRIES_OCI_VALIDATOR, \
+                                        IMAGE_INDEX_OCI_VALIDATOR, \
+                                        validate_instance
 
 # See doc comments below
-UNSUPPORTED_OCI_INDEX_MEDIA_TYPES = [
+UNSUPPORTED_OCI_INDEX_MEDIA_TYPES = frozenset([
     DOCKER_V2S2_LIST_MEDIA_TYPE
-]
+])
 """
-A list of mediaTypes which are not supported by the OCI image index spec.
+A set of mediaTypes which are not supported by the OCI image index spec.
 This mainly just includes the Docker v2s2 manifest list mediaType.
 """
 
 # See doc comments below
-UNSUPPORTED_OCI_MANIFEST_MEDIA_TYPES = [
+UNSUPPORTED_OCI_MANIFEST_MEDIA_TYPES = frozenset([
     DOCKER_V2S2_MEDIA_TYPE
-]
+])
 """
-A list of mediaTypes which are not supported by the OCI manifest spec.
+A set of mediaTypes which are not supported by the OCI manifest spec.
 This mainly just includes the Docker v2s2 manifest mediaType.
 """
 
@@ -42,6 +41,8 @@ class ContainerImageManifestOCI(ContainerImageManifest):
     Contains validation logic and getters for manifest metadata following the
     manifest OCI specification.
     """
+    __slots__ = ()
+
     @staticmethod
     def validate_static(manifest: Dict[str, Any]) -> Tuple[bool, str]:
         """
@@ -54,29 +55,21 @@ class ContainerImageManifestOCI(ContainerImageManifest):
             Tuple[bool, str]: Whether the manifest is valid, error message
         """
         # Validate the image manifest
-        try:
-            validate(instance=manifest, schema=MANIFEST_OCI_SCHEMA)
-        except Exception as e:
-            return False, str(e)
-        
-        # Validate the image manifest config
-        config_valid, err = ContainerImageDescriptor.validate_static(
-            manifest["config"]
-        )
-        if not config_valid:
-            return config_valid, err
-
-        # Validate the image layers
-        for layer in manifest["layers"]:
-            layer_valid, err = ContainerImageDescriptor.validate_static(layer)
-            if not layer_valid:
-                return layer_valid, err
-        
+        valid, err = validate_instance(MANIFEST_OCI_VALIDATOR, manifest)
+        if not valid:
+            return False, err
+
         # If there is a mediaType, ensure it is not a v2s2 manifest
         if "mediaType" in manifest.keys():
             if manifest["mediaType"] in UNSUPPORTED_OCI_MANIFEST_MEDIA_TYPES:
                 return False, f"Unsupported mediaType: {manifest['mediaType']}"
 
+        # Validate the config and layer digests.  The manifest schema embeds
+        # the descriptor schema, so only the digests remain to be validated.
+        for descriptor in [ manifest["config"], *manifest["layers"] ]:
+            if not is_valid_digest(descriptor["digest"]):
+                return False, f"Invalid digest: {descriptor['digest']}"
+
         # If all are valid, return True with empty error message
         return True, ""
 
@@ -126,6 +119,8 @@ distribution registry API. Contains validation logic and getters for entry
 metadata following the OCI image index specification.
 """
 class ContainerImageIndexEntryOCI(ContainerImageManifestListEntry):
+    __slots__ = ()
+
     @staticmethod
     def validate_static(entry: Dict[str, Any]) -> Tuple[bool, str]:
         """
@@ -138,24 +133,36 @@ class ContainerImageIndexEntryOCI(ContainerImageManifestListEntry):
             Tuple[bool, str]: Whether the index entry is valid, error msg
         """
         # Validate the image index entry
-        try:
-            validate(instance=entry, schema=IMAGE_INDEX_ENTRY_OCI_SCHEMA)
-        except Exception as e:
-            return False, str(e)
-        
-        # Validate the image index entry digest
-        digest_valid = bool(re.match(ANCHORED_DIGEST, entry["digest"]))
+        valid, err = validate_instance(
+            IMAGE_INDEX_ENTRY_OCI_VALIDATOR,
+            entry
+        )
+        if not valid:
+            return False, err
+
+        # Validate the parts of the entry not covered by its schema
+        return ContainerImageIndexEntryOCI._validate_semantics(entry)
+
+    @staticmethod
+    def _validate_semantics(entry: Dict[str, Any]) -> Tuple[bool, str]:
+        """
+        Validates the parts of an image index entry which are not covered by
+        its JSON schema.  Only for use on entries which have already been
+        validated against the entry schema, either directly or as part of an
+        image index.
+
+        Args:
+            entry (Dict[str, Any]): The schema-validated entry to validate
+
+        Returns:
+            Tuple[bool, str]: Whether the index entry is valid, error msg
+        """
+        # Validate the image index entry digest.  The platform needs no
+        # further validation, as the entry schema embeds the platform schema.
+        digest_valid = is_valid_digest(entry["digest"])
         if not digest_valid:
             return False, f"Invalid digest: {entry['digest']}"
 
-        # Validate the index entry platform, if given
-        if "platform" in entry.keys():
-            platform_valid, err = ContainerImagePlatform.validate_static(
-                entry["platform"]
-            )
-            if not platform_valid:
-                return platform_valid, err
-
         # Valid if all of the above are valid
         return True, ""
 
@@ -210,6 +217,8 @@ Contains validation logic and getters for image index metadata following the
 OCI image index specification.
 """
 class ContainerImageIndexOCI(ContainerImageManifestList):
+    __slots__ = ()
+
     @staticmethod
     def validate_static(manifest_list: Dict[str, Any]) -> Tuple[bool, str]:
         """
@@ -222,24 +231,27 @@ class ContainerImageIndexOCI(ContainerImageManifestList):
             Tuple[bool, str]: Whether the image index valid, error message
         """
         # Validate the image index
-        try:
-            validate(instance=manifest_list, schema=IMAGE_INDEX_OCI_SCHEMA)
-        except Exception as e:
-            return False, str(e)
-        
-        # Validate the image index entries
-        for entry in manifest_list["manifests"]:
-            entry_valid, err = ContainerImageIndexEntryOCI.validate_static(
-                entry
-            )
-            if not entry_valid:
-                return entry_valid, err
+        valid, err = validate_instance(
+            IMAGE_INDEX_OCI_VALIDATOR,
+            manifest_list
+        )
+        if not valid:
+            return False, err
         
-        # Validate the mediaType, if unsupported then error
+        # Validate the mediaType before the entry checks, if unsupported then
+        # error
         if "mediaType" in manifest_list.keys():
             if manifest_list["mediaType"] in UNSUPPORTED_OCI_INDEX_MEDIA_TYPES:
                 return False, f"Unsupported mediaType: {manifest_list['mediaType']}"
 
+        # Validate the image index entries.  The index schema embeds the entry
+        # schema, so only the checks outside of the schema are needed here.
+        validate_entry = ContainerImageIndexEntryOCI._validate_semantics
+        for entry in manifest_list["manifests"]:
+            entry_valid, err = validate_entry(entry)
+            if not entry_valid:
+                return entry_valid, err
+
         # Success if both valid
         return True, ""
     
@@ -295,13 +307,26 @@ class ContainerImageIndexOCI(ContainerImageManifestList):
         Returns:
             List[ContainerImageIndexEntryOCI]: The entries
         """
-        entries = self.get_entries()
-        for i in range(len(entries)):
-            # Convert each entry to an OCI entry
-            entries[i] = ContainerImageIndexEntryOCI.from_manifest_list_entry(
-                entries[i]
-            )
-        return entries
+        # Validate all of the entries in one pass against the entries array
+        # schema, then the parts of each entry not covered by the schema
+        manifests = self.manifest_list.get("manifests")
+        valid, err = validate_instance(
+            IMAGE_INDEX_ENTRIES_OCI_VALIDATOR,
+            manifests
+        )
+        if not valid:
+            raise ValidationError(err)
+        validate_entry = ContainerImageIndexEntryOCI._validate_semantics
+        for entry in manifests:
+            entry_valid, err = validate_entry(entry)
+            if not entry_valid:
+                raise ValidationError(err)
+
+        # Convert each entry to an OCI entry without validating it again
+        return [
+            ContainerImageIndexEntryOCI._from_validated(entry)
+            for entry in manifests
+        ]
 
     def get_oci_manifests(
             self, name: str, auth: Dict[str, Any]
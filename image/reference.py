@@ -3,20 +3,21 @@ Contains the ContainerImageReference class, which can validate and parse
 references to container images in remote registries
 """
 
-import re
+import sys
+from functools      import  lru_cache
 from image.errors   import  ContainerImageError
-from image.regex    import  REFERENCE_PAT, \
-                            ANCHORED_DIGEST, \
-                            ANCHORED_TAG, \
-                            ANCHORED_NAME, \
-                            ANCHORED_DOMAIN
-from typing         import  Tuple, Dict, Any
+from image.regex    import  DOMAIN_RE, \
+                            NAME_TOTAL_LENGTH_MAX, \
+                            parse_reference
+from typing         import  Tuple, Dict, Any, Union
 
 class ContainerImageReference:
     """
     Represents a container image reference. Contains logic for validating and
     parsing container image references.
     """
+    __slots__ = ("ref", "_parsed")
+
     @staticmethod
     def validate_static(ref: str) -> Tuple[bool, str]:
         """
@@ -28,9 +29,13 @@ class ContainerImageReference:
         Returns:
             Tuple[bool, str]: Whether the reference is valid, error message
         """
-        valid = bool(re.match(REFERENCE_PAT, ref))
-        if not valid:
+        # Parse the reference, then ensure its name is not oversized
+        parsed = parse_reference(ref)
+        if parsed is None:
             return False, f"Invalid reference: {ref}"
+        if len(parsed[0]) > NAME_TOTAL_LENGTH_MAX:
+            return False, \
+                f"Name longer than {NAME_TOTAL_LENGTH_MAX} characters: {ref}"
         return True, ""
 
     def __init__(self, ref: str):
@@ -45,8 +50,30 @@ class ContainerImageReference:
         if not valid:
             raise ContainerImageError(err)
 
-        # Set the image reference property
-        self.ref = ref
+        # Set the image reference property, interned so that instances for
+        # the same reference share a single string
+        self.ref = sys.intern(ref)
+
+    @classmethod
+    def from_string(cls, ref: str) -> "ContainerImageReference":
+        """
+        Returns a shared instance for the given image reference, constructing
+        and validating it only the first time the reference is seen.  Since
+        the returned instance is shared across callers, it must not be
+        mutated.  Callers requiring a distinct instance should use the
+        constructor instead.  Only ContainerImageReference instances are
+        shared, since subclasses such as ContainerImage hold per-instance
+        state, so subclasses are always constructed anew.
+
+        Args:
+            ref (str): The image reference
+
+        Returns:
+            ContainerImageReference: The shared instance for the reference
+        """
+        if cls is not ContainerImageReference:
+            return cls(ref)
+        return _shared_reference(ref)
 
     def validate(self) -> bool:
         """
@@ -57,25 +84,43 @@ class ContainerImageReference:
         """
         return ContainerImageReference.validate_static(self.ref)
 
-    def is_digest_ref(self) -> bool:
+    def _parse(self) -> Tuple[str, Union[str, None], Union[str, None]]:
         """
-        Determines if the image reference is a digest reference
+        Validates and parses the image reference into its name, tag, and digest.
+        The parsed components are cached alongside the reference they were
+        parsed from, so the reference is only parsed again if it is changed.
 
         Returns:
-            bool: Whether the image is a digest reference
+            Tuple[str, Union[str, None], Union[str, None]]: The name, tag, and digest
         """
+        # Return the cached components if the ref is unchanged since parsing
+        cached = getattr(self, "_parsed", None)
+        if cached is not None and cached[0] == self.ref:
+            return cached[1]
+
         # Ensure the ref is valid, if not raise an exception
         valid, err = self.validate()
         if not valid:
             raise ContainerImageError(err)
-        
-        # Check for an "@" character, if not found then it is not a digest ref
-        if "@" not in self.ref:
-            return False
-        
-        # Parse out the digest and validate it, if valid then its a digest ref
-        digest = self.ref.split("@")[-1]
-        return bool(re.match(ANCHORED_DIGEST, digest))
+        # Intern the digest, as the same digest recurs across the references
+        # to an image and the entries of the manifest lists containing it
+        name, tag, digest = parse_reference(self.ref)
+        if digest is not None:
+            digest = sys.intern(digest)
+        parsed = (name, tag, digest)
+        self._parsed = (self.ref, parsed)
+        return parsed
+
+    def is_digest_ref(self) -> bool:
+        """
+        Determines if the image reference is a digest reference
+
+        Returns:
+            bool: Whether the image is a digest reference
+        """
+        # If the reference has a digest, then it is a digest ref
+        name, tag, digest = self._parse()
+        return digest is not None
 
     def is_tag_ref(self) -> bool:
         """
@@ -84,20 +129,10 @@ class ContainerImageReference:
         Returns:
             bool: Whether the image is a tag referenece
         """
-        # Ensure the ref is valid, if not raise an exception
-        valid, err = self.validate()
-        if not valid:
-            raise ContainerImageError(err)
-
-        # If the image is a digest ref, then it is not a tag ref
-        if self.is_digest_ref():
-            return False
-
-        # Parse out the tag and validate it, if valdi then it is a tag ref
-        tag = "latest"
-        if ":" in self.ref:
-            tag = self.ref.split(":")[-1]
-        return bool(re.match(ANCHORED_TAG, tag))
+        # If the reference has no digest, then its tag is either given or
+        # implied to be latest, so it is a tag ref
+        name, tag, digest = self._parse()
+        return digest is None
 
     def get_identifier(self) -> str:
         """
@@ -107,21 +142,14 @@ class ContainerImageReference:
         Returns:
             str: The image identifier, either a tag or digest
         """
-        # Ensure the ref is valid, if not raise an exception
-        valid, err = self.validate()
-        if not valid:
-            raise ContainerImageError(err)
-
-        # Get either the tag or digest as the identifier for the image
-        # Raise an exception if neither a valid tag or digest is found
-        if self.is_digest_ref():
-            return self.ref.split("@")[-1]
-        elif self.is_tag_ref():
-            if ":" in self.ref:
-                return self.ref.split(":")[-1]
-            return "latest"
-        else:
-            raise Exception(f"Not a valid tag or digest ref: {self.ref}")
+        # Get either the digest or tag as the identifier for the image,
+        # preferring the digest and defaulting the tag to latest
+        name, tag, digest = self._parse()
+        if digest is not None:
+            return digest
+        if tag is not None:
+            return tag
+        return "latest"
 
     def get_name(self) -> str:
         """
@@ -131,20 +159,8 @@ class ContainerImageReference:
         Returns:
             str: The image name
         """
-        # Ensure the ref is valid, if not raise an exception
-        valid, err = self.validate()
-        if not valid:
-            raise ContainerImageError(err)
-        
-        # Parse out any digests or tags
-        digestless = self.ref.split("@")[0]
-        tagless = digestless.split(":")[0]
-
-        # Validate the image name, if valid then return
-        valid = bool(re.match(ANCHORED_NAME, tagless))
-        if not valid:
-            raise ContainerImageError(f"Invalid name: {tagless}")
-        return tagless
+        name, tag, digest = self._parse()
+        return name
 
     def get_registry(self) -> str:
         """
@@ -156,11 +172,12 @@ class ContainerImageReference:
         # Get the image name
         name = self.get_name()
 
-        # Split the path off and isolate the registry domain
-        registry = name.split("/")[0]
+        # Partition the path off and isolate the registry domain
+        registry = name.partition("/")[0]
 
-        # Validate the registry domain, return if valid
-        valid = bool(re.match(ANCHORED_DOMAIN, registry))
+        # Validate the registry domain against the domain pattern alone, with
+        # no attempt to resolve it, and return if valid
+        valid = DOMAIN_RE.fullmatch(registry) is not None
         if not valid:
             raise ContainerImageError(f"Invalid domain: {registry}")
         return registry
@@ -176,12 +193,8 @@ class ContainerImageReference:
         # Get the image name
         name = self.get_name()
 
-        # Split the path off and isolate the path
-        name_comp = name.split("/")
-        name_comp.pop(0) # Remove the registry
-
-        # Reconstruct and return the path
-        return "/".join(name_comp)
+        # Partition the registry off and return the path
+        return name.partition("/")[2]
     
     def get_short_name(self) -> str:
         """
@@ -192,7 +205,7 @@ class ContainerImageReference:
         Returns:
             str: The image short name
         """
-        return self.get_name().split("/")[-1]
+        return self.get_name().rpartition("/")[2]
     
     def __str__(self) -> str:
         """
@@ -211,3 +224,17 @@ class ContainerImageReference:
             Dict[str, Any]: The ContainerImage as a JSON dict
         """
         return { "ref": self.ref }
+
+@lru_cache(maxsize=4096)
+def _shared_reference(ref: str) -> ContainerImageReference:
+    """
+    Constructs the shared ContainerImageReference instance returned by
+    ContainerImageReference.from_string for the given image reference
+
+    Args:
+        ref (str): The image reference
+
+    Returns:
+        ContainerImageReference: The shared instance for the reference
+    """
+    return ContainerImageReference(ref)
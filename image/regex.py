@@ -5,8 +5,9 @@ python from official containers/image go module.
 Ref: https://github.com/containers/image/blob/main/docker/reference/regexp.go
 """
 
+import functools
 import re
-from typing import List
+from typing import List, Tuple, Union
 
 # See doc comments below
 ALPHA_NUMERIC = r"[a-z0-9]+"
@@ -20,7 +21,7 @@ Ref: https://github.com/containers/image/blob/main/docker/reference/regexp.go
 """
 
 # See doc comments below
-SEPARATOR = r"(?:[._]|__|[-]*)"
+SEPARATOR = r"(?:[._]|__|[-]+)"
 """
 Defines the separators allowed to be embedded in name components. This allows
 one period, one or two underscore and multiple dashes. Repeated dashes and
@@ -38,18 +39,85 @@ an optional port.
 """
 
 # See doc comments below
-TAG_PAT = r"[\w][\w.-]{0,127}"
+TAG_PAT = r"[A-Za-z0-9_][A-Za-z0-9_.-]{0,127}"
 """
 Matches valid tag names. From the docker/docker library's graph/tags.go source
-file
+file.  The go \\w class is ASCII-only, so it is spelled out here rather than
+using python's unicode-aware \\w.
 """
 
 # See doc comments below
-DIGEST_PAT = r"[A-Za-z][A-Za-z0-9]*(?:[-_+.][A-Za-z][A-Za-z0-9]*)*:[0-9a-fA-F]{32,}"
+DIGEST_ALGORITHM_PAT = r"[A-Za-z][A-Za-z0-9]*(?:[-_+.][A-Za-z][A-Za-z0-9]*)*"
+"""
+Matches the algorithm component of a digest, preceding the colon.
+"""
+
+# See doc comments below
+DIGEST_PAT = fr"{DIGEST_ALGORITHM_PAT}:[0-9a-fA-F]{{32,}}"
 """
 The string counterpart for DIGEST_REGEXP.
 """
 
+# See doc comments below
+DIGEST_SHA256_FAST = r"sha256:[0-9a-f]{64}"
+"""
+Matches canonical sha256 digests, which account for nearly all digests seen
+in practice.  This is a strict subset of DIGEST_PAT which avoids its nested
+quantifiers, so it may be tried first with DIGEST_PAT as the fallback.
+"""
+
+# See doc comments below
+DOT = r"\."
+"""
+The escaped period literal, which separates domain components.
+"""
+
+# See doc comments below
+COLON = r":"
+"""
+The colon literal, which precedes a port or a tag.
+"""
+
+# See doc comments below
+SLASH = r"/"
+"""
+The forward slash literal, which separates path components.
+"""
+
+# See doc comments below
+AT = r"@"
+"""
+The at sign literal, which precedes a digest.
+"""
+
+# See doc comments below
+NAME_TOTAL_LENGTH_MAX = 255
+"""
+The maximum length of the name component of a reference, as enforced by the
+distribution/reference go module.
+"""
+
+# See doc comments below
+TAG_LENGTH_MAX = 128
+"""
+The maximum length of a tag, matching the bound in TAG_PAT.
+"""
+
+# See doc comments below
+DIGEST_LENGTH_MAX = 1024
+"""
+The maximum length of a digest.  Longer inputs are rejected before any
+pattern is run against them.
+"""
+
+# See doc comments below
+REFERENCE_LENGTH_MAX = NAME_TOTAL_LENGTH_MAX + TAG_LENGTH_MAX + \
+    DIGEST_LENGTH_MAX + 2
+"""
+The maximum length of a full reference, i.e. a name, a tag, and a digest
+along with their separators.
+"""
+
 # See doc comments below
 IDENTIFIER = r"([a-f0-9]{64})"
 """
@@ -150,19 +218,7 @@ def anchored(res: List[str]) -> str:
     return r"^" + expression(res) + r"$"
 
 # See doc comments below
-NAME_COMPONENT = expression(
-    [
-        ALPHA_NUMERIC,
-        optional(
-            repeated(
-                [
-                    SEPARATOR,
-                    ALPHA_NUMERIC
-                ]
-            )
-        )
-    ]
-)
+NAME_COMPONENT = fr"{ALPHA_NUMERIC}(?:{SEPARATOR}{ALPHA_NUMERIC})*"
 """
 Restricts registry path component names to start with at least one letter or
 number, with following parts able to be separated by one period, one or two
@@ -170,24 +226,18 @@ underscore and multiple dashes.
 """
 
 # See doc comments below
-DOMAIN = expression(
-    [
-        DOMAIN_COMPONENT,
-        optional(
-            repeated(
-                [
-                    literal("."),
-                    DOMAIN_COMPONENT
-                ]
-            )
-        ),
-        optional(
-            [
-                literal(":"),
-                r"[0-9]+"
-            ]
-        )
-    ]
+PATH_PAT = fr"{NAME_COMPONENT}(?:{SLASH}{NAME_COMPONENT})*"
+"""
+The path portion of a name, i.e. one or more name components separated by
+forward slashes.  This is shared by NAME_PAT and ANCHORED_NAME rather than
+being spelled out in each.
+"""
+
+# See doc comments below
+DOMAIN = (
+    fr"{DOMAIN_COMPONENT}"
+    fr"(?:{DOT}{DOMAIN_COMPONENT})*"
+    fr"(?:{COLON}[0-9]+)?"
 )
 """
 Defines the structure of potential domain components that may be part of image
@@ -196,43 +246,70 @@ compatibility with Docker image names.
 """
 
 # See doc comments below
-ANCHORED_DOMAIN = anchored(DOMAIN)
+ANCHORED_DOMAIN = fr"^{DOMAIN}$"
 """
 Matches valid domains, anchored at the start and end of the matched string.
 """
 
 # See doc comments below
-ANCHORED_TAG = anchored(TAG_PAT)
+ANCHORED_DOMAIN_RE = re.compile(ANCHORED_DOMAIN)
+"""
+The compiled counterpart of ANCHORED_DOMAIN.
+"""
+
+# See doc comments below
+DOMAIN_RE = re.compile(DOMAIN)
+"""
+The compiled counterpart of DOMAIN.  Use fullmatch to match whole domains.
+Unlike ANCHORED_DOMAIN_RE.match, this rejects a trailing newline.
+"""
+
+# See doc comments below
+ANCHORED_TAG = fr"^{TAG_PAT}$"
 """
 Matches valid tag names, anchored at the start and end of the matched string.
 """
 
 # See doc comments below
-ANCHORED_DIGEST = anchored(DIGEST_PAT)
+ANCHORED_TAG_RE = re.compile(ANCHORED_TAG)
+"""
+The compiled counterpart of ANCHORED_TAG.
+"""
+
+# See doc comments below
+TAG_RE = re.compile(TAG_PAT)
+"""
+The compiled counterpart of TAG_PAT.  Use fullmatch to match whole tags.
+"""
+
+# See doc comments below
+ANCHORED_DIGEST = fr"^{DIGEST_PAT}$"
 """
 Matches valid digests, anchored at the start and end of the matched string.
 """
 
 # See doc comments below
-NAME_PAT = expression(
-	[
-        optional(
-            [
-                DOMAIN,
-                literal("/")
-            ]
-        ),
-        NAME_COMPONENT,
-        optional(
-            repeated(
-                [
-                    literal("/"),
-                    NAME_COMPONENT
-                ]
-            )
-        )
-    ]
-)
+SHA256_DIGEST_RE = re.compile(DIGEST_SHA256_FAST)
+"""
+The compiled counterpart of DIGEST_SHA256_FAST.  Use fullmatch, as the pattern
+is not anchored.
+"""
+
+# See doc comments below
+ANCHORED_DIGEST_RE = re.compile(ANCHORED_DIGEST)
+"""
+The compiled counterpart of ANCHORED_DIGEST, compiled once at import so that
+matching does not go through the re module's pattern cache on every call.
+"""
+
+# See doc comments below
+DIGEST_RE = re.compile(DIGEST_PAT)
+"""
+The compiled counterpart of DIGEST_PAT.  Use fullmatch to match whole digests.
+"""
+
+# See doc comments below
+NAME_PAT = fr"(?:{DOMAIN}{SLASH})?{PATH_PAT}"
 """
 The format for the name component of references. The regexp has capturing
 groups for the domain and name part omitting the separating forward slash from
@@ -240,56 +317,111 @@ either.
 """
 
 # See doc comments below
-ANCHORED_NAME = anchored(
-    [
-        optional(
-            [
-                capture(
-                    DOMAIN
-                ),
-                literal("/")
-            ]
-        ),
-        capture(
-            [
-                NAME_COMPONENT,
-                optional(
-                    repeated(
-                        [
-                            literal("/"),
-                            NAME_COMPONENT
-                        ]
-                    )
-                )
-            ]
-        )
-    ]
-)
+ANCHORED_NAME = fr"^(?:({DOMAIN}){SLASH})?({PATH_PAT})$"
 """
 Used to parse a name value, capturing the domain and trailing components.
 """
 
 # See doc comments below
-REFERENCE_PAT = anchored(
-    [
-        capture(
-            NAME_PAT
-        ),
-        optional(
-            [
-                literal(":"),
-                capture(TAG_PAT)
-            ]
-        ),
-        optional(
-            [
-                literal("@"),
-                capture(DIGEST_PAT)
-            ]
-        )
-    ]
-)
+ANCHORED_NAME_RE = re.compile(ANCHORED_NAME)
+"""
+The compiled counterpart of ANCHORED_NAME.
+"""
+
+# See doc comments below
+NAME_RE = re.compile(NAME_PAT)
+"""
+The compiled counterpart of NAME_PAT.  Use fullmatch to match whole names.
+"""
+
+# See doc comments below
+REFERENCE_PAT = fr"^(?P<name>{NAME_PAT})(?:{COLON}(?P<tag>{TAG_PAT}))?(?:{AT}(?P<digest>{DIGEST_PAT}))?$"
 """
 The full supported format of a reference. The regexp is anchored and has
-capturing groups for name, tag, and digest components.
+named capturing groups for the name, tag, and digest components.
+"""
+
+# See doc comments below
+REFERENCE_RE = re.compile(REFERENCE_PAT)
+"""
+The compiled counterpart of REFERENCE_PAT.
 """
+
+# See doc comments below
+DIGEST_ALGORITHM_BYTES_RE = re.compile(DIGEST_ALGORITHM_PAT.encode("ascii"))
+"""
+The compiled bytes counterpart of DIGEST_ALGORITHM_PAT.  Use fullmatch on the
+encoded algorithm component of a digest.  Only the short algorithm component
+is matched against a pattern, as the encoded component is checked for hex via
+bytes.translate.
+"""
+
+# See doc comments below
+HEX_DIGITS = b"0123456789abcdefABCDEF"
+"""
+The characters permitted in the encoded portion of a digest.  Deleting these
+from an encoded digest via bytes.translate leaves an empty bytes object if and
+only if the digest is entirely hex.
+"""
+
+# See doc comments below
+COMMON_DIGEST_ALGORITHMS = frozenset([b"sha256", b"sha512"])
+"""
+The digest algorithms which are known to match the algorithm component of
+DIGEST_PAT, and hence need not be checked against the full pattern.
+"""
+
+# See doc comments below
+DIGEST_CACHE_SIZE = 4096
+"""
+The number of digests whose validity is cached by is_valid_digest.  The same
+digests are checked repeatedly, once when a descriptor is validated and again
+by its getters, and layers are commonly shared across manifests.
+"""
+
+@functools.lru_cache(maxsize=DIGEST_CACHE_SIZE)
+def is_valid_digest(digest: str) -> bool:
+    """
+    Determines whether a digest matches ANCHORED_DIGEST.  The encoded portion
+    of the digest is checked via bytes.translate rather than the regex engine,
+    and the algorithm is only matched against DIGEST_ALGORITHM_BYTES_RE if it
+    is not one of the common digest algorithms.  Results are cached for the
+    most recently checked digests.
+
+    Args:
+        digest (str): The digest to check
+
+    Returns:
+        bool: Whether the digest is valid
+    """
+    if len(digest) > DIGEST_LENGTH_MAX:
+        return False
+    encoded = digest.encode("ascii", "replace")
+    algorithm, sep, hex_part = encoded.partition(b":")
+    if not sep or len(hex_part) < 32 or hex_part.translate(None, HEX_DIGITS):
+        return False
+    if algorithm in COMMON_DIGEST_ALGORITHMS:
+        return True
+    return DIGEST_ALGORITHM_BYTES_RE.fullmatch(algorithm) is not None
+
+def parse_reference(ref: str) -> Union[
+        Tuple[str, Union[str, None], Union[str, None]],
+        None
+    ]:
+    """
+    Parses an image reference into its name, tag, and digest components using
+    a single match of REFERENCE_RE, rather than splitting the reference and
+    matching each component separately.
+
+    Args:
+        ref (str): The image reference
+
+    Returns:
+        Union[Tuple[str, Union[str, None], Union[str, None]], None]: The name, tag, and digest, None if invalid
+    """
+    if len(ref) > REFERENCE_LENGTH_MAX:
+        return None
+    match = REFERENCE_RE.fullmatch(ref)
+    if match is None:
+        return None
+    return match.group("name", "tag", "digest")
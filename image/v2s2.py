@@ -3,36 +3,36 @@ Contains docker v2s2-specific implementations of the container image manifest,
 manifest list entry, and manifest list classes
 """
 
-import re
 from typing import Dict, Any, Tuple, List
-from jsonschema import validate, ValidationError
+from jsonschema import ValidationError
 from image.descriptor           import  ContainerImageDescriptor
 from image.manifest             import  ContainerImageManifest
 from image.manifestlist         import  ContainerImageManifestList
 from image.manifestlistentry    import  ContainerImageManifestListEntry
 from image.mediatypes           import  OCI_INDEX_MEDIA_TYPE, \
                                         OCI_MANIFEST_MEDIA_TYPE
-from image.platform             import  ContainerImagePlatform
-from image.regex                import  ANCHORED_DIGEST
-from image.v2s2schema           import  MANIFEST_V2_SCHEMA, \
-                                        MANIFEST_LIST_V2_SCHEMA, \
-                                        MANIFEST_LIST_V2_ENTRY_SCHEMA
+from image.regex                import  is_valid_digest
+from image.validators           import  MANIFEST_V2_VALIDATOR, \
+                                        MANIFEST_LIST_V2_VALIDATOR, \
+                                        MANIFEST_LIST_V2_ENTRY_VALIDATOR, \
+                                        MANIFEST_LIST_V2_ENTRIES_VALIDATOR, \
+                                        validate_instance
 
 # See doc comments below
-UNSUPPORTED_V2S2_MANIFEST_MEDIA_TYPES = [
+UNSUPPORTED_V2S2_MANIFEST_MEDIA_TYPES = frozenset([
     OCI_MANIFEST_MEDIA_TYPE
-]
+])
 """
-A list of mediaTypes which are not supported by the v2s2 manifest spec.
+A set of mediaTypes which are not supported by the v2s2 manifest spec.
 This mainly just includes the OCI manifest mediaType.
 """
 
 # See doc comments below
-UNSUPPORTED_V2S2_MANIFEST_LIST_MEDIA_TYPES = [
+UNSUPPORTED_V2S2_MANIFEST_LIST_MEDIA_TYPES = frozenset([
     OCI_INDEX_MEDIA_TYPE
-]
+])
 """
-A list of mediaTypes which are not supported by the v2s2 manifest list
+A set of mediaTypes which are not supported by the v2s2 manifest list
 spec.  This mainly just includes the OCI index mediaType.
 """
 
@@ -44,6 +44,8 @@ Contains validation logic and getters for manifest metadata following the
 manifest v2s2 specification.
 """
 class ContainerImageManifestV2S2(ContainerImageManifest):
+    __slots__ = ()
+
     @staticmethod
     def validate_static(manifest: Dict[str, Any]) -> Tuple[bool, str]:
         """
@@ -56,10 +58,13 @@ class ContainerImageManifestV2S2(ContainerImageManifest):
             Tuple[bool, str]: Whether the manifest is valid, error message
         """
         # Validate the image manifest
-        try:
-            validate(instance=manifest, schema=MANIFEST_V2_SCHEMA)
-        except Exception as e:
-            return False, str(e)
+        valid, err = validate_instance(MANIFEST_V2_VALIDATOR, manifest)
+        if not valid:
+            return False, err
+
+        # Validate the mediaType before the more expensive descriptor checks
+        if manifest["mediaType"] in UNSUPPORTED_V2S2_MANIFEST_MEDIA_TYPES:
+            return False, f"Unsupported mediaType: {manifest['mediaType']}"
         
         # Validate the image manifest config
         config_valid, err = ContainerImageDescriptor.validate_static(
@@ -69,14 +74,11 @@ class ContainerImageManifestV2S2(ContainerImageManifest):
             return config_valid, err
 
         # Validate the image layers
+        validate_descriptor = ContainerImageDescriptor.validate_static
         for layer in manifest["layers"]:
-            layer_valid, err = ContainerImageDescriptor.validate_static(layer)
+            layer_valid, err = validate_descriptor(layer)
             if not layer_valid:
                 return layer_valid, err
-        
-        # Validate the mediaType
-        if manifest["mediaType"] in UNSUPPORTED_V2S2_MANIFEST_MEDIA_TYPES:
-            return False, f"Unsupported mediaType: {manifest['mediaType']}"
 
         # If all are valid, return True with empty error message
         return True, ""
@@ -127,6 +129,8 @@ distribution registry API. Contains validation logic and getters for entry
 metadata following the manifest v2s2 specification.
 """
 class ContainerImageManifestListEntryV2S2(ContainerImageManifestListEntry):
+    __slots__ = ()
+
     @staticmethod
     def validate_static(entry: Dict[str, Any]) -> Tuple[bool, str]:
         """
@@ -139,23 +143,36 @@ class ContainerImageManifestListEntryV2S2(ContainerImageManifestListEntry):
             Tuple[bool, str]: Whether the manifest list entry is valid, error msg
         """
         # Validate the image manifest list entry
-        try:
-            validate(instance=entry, schema=MANIFEST_LIST_V2_ENTRY_SCHEMA)
-        except Exception as e:
-            return False, str(e)
-        
-        # Validate the image manifest list entry digest
-        digest_valid = bool(re.match(ANCHORED_DIGEST, entry["digest"]))
+        valid, err = validate_instance(
+            MANIFEST_LIST_V2_ENTRY_VALIDATOR,
+            entry
+        )
+        if not valid:
+            return False, err
+
+        # Validate the parts of the entry not covered by its schema
+        return ContainerImageManifestListEntryV2S2._validate_semantics(entry)
+
+    @staticmethod
+    def _validate_semantics(entry: Dict[str, Any]) -> Tuple[bool, str]:
+        """
+        Validates the parts of an image manifest list entry which are not
+        covered by its JSON schema.  Only for use on entries which have already
+        been validated against the entry schema, either directly or as part of
+        a manifest list.
+
+        Args:
+            entry (Dict[str, Any]): The schema-validated entry to validate
+
+        Returns:
+            Tuple[bool, str]: Whether the manifest list entry is valid, error msg
+        """
+        # Validate the image manifest list entry digest.  The platform needs no
+        # further validation, as the entry schema embeds the platform schema.
+        digest_valid = is_valid_digest(entry["digest"])
         if not digest_valid:
             return False, f"Invalid digest: {entry['digest']}"
 
-        # Validate the manifest list entry platform
-        platform_valid, err = ContainerImagePlatform.validate_static(
-            entry["platform"]
-        )
-        if not platform_valid:
-            return platform_valid, err
-
         # Valid if all of the above are valid
         return True, ""
 
@@ -210,6 +227,8 @@ Contains validation logic and getters for manifest list metadata following the
 manifest v2s2 specification.
 """
 class ContainerImageManifestListV2S2(ContainerImageManifestList):
+    __slots__ = ()
+
     @staticmethod
     def validate_static(manifest_list: Dict[str, Any]) -> Tuple[bool, str]:
         """
@@ -222,22 +241,24 @@ class ContainerImageManifestListV2S2(ContainerImageManifestList):
             Tuple[bool, str]: Whether the manifest list is valid, error message
         """
         # Validate the image manifest list
-        try:
-            validate(instance=manifest_list, schema=MANIFEST_LIST_V2_SCHEMA)
-        except Exception as e:
-            return False, str(e)
+        valid, err = validate_instance(
+            MANIFEST_LIST_V2_VALIDATOR,
+            manifest_list
+        )
+        if not valid:
+            return False, err
+
+        # Validate the mediaType before the more expensive entry checks
+        if manifest_list["mediaType"] in UNSUPPORTED_V2S2_MANIFEST_LIST_MEDIA_TYPES:
+            return False, f"Unsupported mediaType: {manifest_list['mediaType']}"
         
-        # Validate the manifest list entries
+        # Validate the manifest list entries.  The list schema embeds the entry
+        # schema, so only the checks outside of the schema are needed here.
+        validate_entry = ContainerImageManifestListEntryV2S2._validate_semantics
         for entry in manifest_list["manifests"]:
-            entry_valid, err = ContainerImageManifestListEntryV2S2.validate_static(
-                entry
-            )
+            entry_valid, err = validate_entry(entry)
             if not entry_valid:
                 return entry_valid, err
-        
-        # Validate the mediaType, if unsupported then error
-        if manifest_list["mediaType"] in UNSUPPORTED_V2S2_MANIFEST_LIST_MEDIA_TYPES:
-            return False, f"Unsupported mediaType: {manifest_list['mediaType']}"
 
         # Success if both valid
         return True, ""
@@ -294,13 +315,26 @@ class ContainerImageManifestListV2S2(ContainerImageManifestList):
         Returns:
             List[ContainerImageManifestListEntryV2S2]: The entries
         """
-        entries = self.get_entries()
-        for i in range(len(entries)):
-            # Convert each entry to a v2s2 entry
-            entries[i] = ContainerImageManifestListEntryV2S2.from_manifest_list_entry(
-                entries[i]
-            )
-        return entries
+        # Validate all of the entries in one pass against the entries array
+        # schema, then the parts of each entry not covered by the schema
+        manifests = self.manifest_list.get("manifests")
+        valid, err = validate_instance(
+            MANIFEST_LIST_V2_ENTRIES_VALIDATOR,
+            manifests
+        )
+        if not valid:
+            raise ValidationError(err)
+        validate_entry = ContainerImageManifestListEntryV2S2._validate_semantics
+        for entry in manifests:
+            entry_valid, err = validate_entry(entry)
+            if not entry_valid:
+                raise ValidationError(err)
+
+        # Convert each entry to a v2s2 entry without validating it again
+        return [
+            ContainerImageManifestListEntryV2S2._from_validated(entry)
+            for entry in manifests
+        ]
 
     def get_v2s2_manifests(
             self, name: str, auth: Dict[str, Any]
@@ -316,10 +350,8 @@ class ContainerImageManifestListV2S2(ContainerImageManifestList):
         Returns:
             List[ContainerImageManifestV2S2]: The arch manifests
         """
-        manifests = self.get_manifests(name, auth)
-        for i in range(len(manifests)):
-            # Convert each manifest to a v2s2 manifest
-            manifests[i] = ContainerImageManifestV2S2.from_manifest(
-                manifests[i]
-            )
-        return manifests
+        # Convert each manifest to a v2s2 manifest
+        return [
+            ContainerImageManifestV2S2.from_manifest(manifest)
+            for manifest in self.get_manifests(name, auth)
+        ]
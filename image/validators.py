@@ -0,0 +1,415 @@
+"""
+Contains prebuilt JSON schema validators for the schema constants defined
+throughout containerimage-py.  Building a validator checks the schema against
+its metaschema, which is far more expensive than validating an instance, so
+each validator is built once, on first use, rather than on every validation.
+Deferring the build to first use keeps it out of import time for users who
+never validate.
+
+Each schema is also compiled into a plain python predicate, which checks
+whether an instance is valid far faster than jsonschema can.  The jsonschema
+validator is then only needed to report why an instance is invalid.
+"""
+
+import functools
+import json
+import numbers
+from typing                 import  Dict, Any, Tuple, Union, Iterator, \
+                                    Callable
+from jsonschema             import  ValidationError
+from jsonschema.exceptions  import  best_match
+from jsonschema.protocols   import  Validator
+from jsonschema.validators  import  validator_for
+from image.configschema    import  CONTAINER_IMAGE_CONFIG_SCHEMA
+from image.manifestschema   import  MANIFEST_DESCRIPTOR_SCHEMA, \
+                                    IMAGE_INDEX_ENTRY_PLATFORM_SCHEMA
+from image.ocischema        import  MANIFEST_OCI_SCHEMA, \
+                                    IMAGE_INDEX_OCI_SCHEMA, \
+                                    IMAGE_INDEX_ENTRY_OCI_SCHEMA
+from image.v2s2schema       import  MANIFEST_V2_SCHEMA, \
+                                    MANIFEST_LIST_V2_SCHEMA, \
+                                    MANIFEST_LIST_V2_ENTRY_SCHEMA
+
+# See doc comments below
+JSON_TYPE_CHECKS = {
+    "object": lambda instance: isinstance(instance, dict),
+    "array": lambda instance: isinstance(instance, list),
+    "string": lambda instance: isinstance(instance, str),
+    "boolean": lambda instance: isinstance(instance, bool),
+    "null": lambda instance: instance is None,
+    "number": lambda instance: isinstance(instance, numbers.Number) and \
+        not isinstance(instance, bool),
+    "integer": lambda instance: (
+        isinstance(instance, int) and not isinstance(instance, bool)
+    ) or (isinstance(instance, float) and instance.is_integer())
+}
+"""
+Checks for each JSON schema type, matching those of the jsonschema library's
+default type checker.  Booleans are not numbers, and floats with an integral
+value are integers.
+"""
+
+# See doc comments below
+COMPILABLE_KEYWORDS = frozenset([
+    "type",
+    "properties",
+    "required",
+    "additionalProperties",
+    "items",
+    "oneOf",
+    "description"
+])
+"""
+The JSON schema keywords which compile_schema supports.  These are all of the
+keywords used by the schema constants throughout containerimage-py.  Schemas
+using any other keyword are not compiled.
+"""
+
+def compile_schema(schema: Dict[str, Any]) -> Union[
+        Callable[[Any], bool],
+        None
+    ]:
+    """
+    Compiles a JSON schema into a predicate determining whether an instance
+    is valid against it, for schemas using only COMPILABLE_KEYWORDS
+
+    Args:
+        schema (Dict[str, Any]): The JSON schema
+
+    Returns:
+        Union[Callable[[Any], bool], None]: The predicate, None if the schema is not compilable
+    """
+    # Boolean schemas either accept or reject every instance
+    if isinstance(schema, bool):
+        return lambda instance: schema
+    if not isinstance(schema, dict) or not COMPILABLE_KEYWORDS.issuperset(
+            schema
+        ):
+        return None
+    checks = []
+
+    # Compile the type check, accepting any of the types if given a list
+    if "type" in schema:
+        types = schema["type"]
+        if isinstance(types, str):
+            types = [ types ]
+        if not all(t in JSON_TYPE_CHECKS for t in types):
+            return None
+        type_checks = [ JSON_TYPE_CHECKS[t] for t in types ]
+        if len(type_checks) == 1:
+            checks.append(type_checks[0])
+        else:
+            checks.append(
+                lambda instance: any(check(instance) for check in type_checks)
+            )
+
+    # Compile the object keywords, which only apply to objects
+    properties = {}
+    for name, subschema in schema.get("properties", {}).items():
+        properties[name] = compile_schema(subschema)
+        if properties[name] is None:
+            return None
+    required = tuple(schema.get("required", ()))
+    additional = compile_schema(schema.get("additionalProperties", True))
+    if additional is None:
+        return None
+    allows_additional = schema.get("additionalProperties", True) is True
+    if properties or required or not allows_additional:
+        def check_object(instance: Any) -> bool:
+            if not isinstance(instance, dict):
+                return True
+            for name in required:
+                if name not in instance:
+                    return False
+            for name, value in instance.items():
+                check = properties.get(name)
+                if check is not None:
+                    if not check(value):
+                        return False
+                elif not allows_additional and not additional(value):
+                    return False
+            return True
+        checks.append(check_object)
+
+    # Compile the array keywords, which only apply to arrays
+    if "items" in schema:
+        items = compile_schema(schema["items"])
+        if items is None:
+            return None
+        checks.append(
+            lambda instance: not isinstance(instance, list) or \
+                all(items(item) for item in instance)
+        )
+
+    # Compile the oneOf keyword, requiring exactly one subschema to be valid
+    if "oneOf" in schema:
+        one_of = [ compile_schema(subschema) for subschema in schema["oneOf"] ]
+        if any(check is None for check in one_of):
+            return None
+        checks.append(
+            lambda instance: sum(check(instance) for check in one_of) == 1
+        )
+
+    # Combine the checks, avoiding a loop for the common single check case
+    if len(checks) == 0:
+        return lambda instance: True
+    if len(checks) == 1:
+        return checks[0]
+    return lambda instance: all(check(instance) for check in checks)
+
+# See doc comments below
+VALIDATOR_CACHE_SIZE = 32
+"""
+The number of distinct schemas whose validators are cached by build_validator.
+"""
+
+@functools.lru_cache(maxsize=VALIDATOR_CACHE_SIZE)
+def _build_validator_for_key(schema_key: str) -> Validator:
+    """
+    Checks a canonically serialized JSON schema against its metaschema and
+    builds a validator for it
+
+    Args:
+        schema_key (str): The JSON schema serialized with sorted keys
+
+    Returns:
+        Validator: The validator for the JSON schema
+    """
+    schema = json.loads(schema_key)
+    cls = validator_for(schema)
+    cls.check_schema(schema)
+    return cls(schema)
+
+def build_validator(schema: Dict[str, Any]) -> Validator:
+    """
+    Checks a JSON schema against its metaschema and builds a validator for it.
+    Validators are cached by the schema's content, so equal schemas share a
+    single validator rather than each being checked and built again.
+
+    Args:
+        schema (Dict[str, Any]): The JSON schema
+
+    Returns:
+        Validator: The validator for the JSON schema
+    """
+    return _build_validator_for_key(json.dumps(schema, sort_keys=True))
+
+class LazyValidator:
+    """
+    Wraps a JSON schema whose validator is built via build_validator the first
+    time it is used, then reused for every subsequent validation.  The schema
+    is also compiled via compile_schema on first use, if compilable.
+    """
+    def __init__(self, schema: Dict[str, Any]):
+        """
+        Constructor for the LazyValidator class
+
+        Args:
+            schema (Dict[str, Any]): The JSON schema
+        """
+        self.schema = schema
+        self._validator = None
+        self._compiled = None
+        self._compiled_built = False
+        self._types = None
+        self._required = ()
+        self._properties = None
+        if isinstance(schema, dict) and "oneOf" not in schema:
+            types = schema.get("type")
+            if isinstance(types, str):
+                types = [ types ]
+            if isinstance(types, list) and \
+                    all(t in JSON_TYPE_CHECKS for t in types):
+                self._types = types
+            self._required = tuple(schema.get("required", ()))
+            if schema.get("additionalProperties", True) is False:
+                self._properties = frozenset(schema.get("properties", {}))
+
+    def is_valid(self, instance: Any) -> bool:
+        """
+        Determines whether the instance is valid, using the compiled schema if
+        the schema is compilable
+
+        Args:
+            instance (Any): The instance to validate
+
+        Returns:
+            bool: Whether the instance is valid
+        """
+        if not self._compiled_built:
+            self._compiled = compile_schema(self.schema)
+            self._compiled_built = True
+        if self._compiled is not None:
+            return self._compiled(instance)
+        return self.get_validator().is_valid(instance)
+
+    def precheck(self, instance: Any) -> Union[str, None]:
+        """
+        Finds the error for an instance which is invalid in an obvious way,
+        either of the wrong type or missing a required property, without
+        invoking jsonschema.  The error matches that which jsonschema reports
+        for the instance.
+
+        Args:
+            instance (Any): The invalid instance
+
+        Returns:
+            Union[str, None]: The error message, None if not an obvious error
+        """
+        # An instance of the wrong type fails only the type keyword
+        if self._types is not None and \
+                not any(JSON_TYPE_CHECKS[t](instance) for t in self._types):
+            types = ", ".join(repr(t) for t in self._types)
+            return f"$: {instance!r} is not of type {types}"
+
+        # A missing required property outranks any error nested deeper in the
+        # object, but not an unexpected property, so that case is left out
+        if not isinstance(instance, dict):
+            return None
+        if self._properties is not None and \
+                not self._properties.issuperset(instance):
+            return None
+        for name in self._required:
+            if name not in instance:
+                return f"$: {name!r} is a required property"
+        return None
+
+    def get_validator(self) -> Validator:
+        """
+        Returns the validator for the schema, building it on first use
+
+        Returns:
+            Validator: The validator for the JSON schema
+        """
+        if self._validator is None:
+            self._validator = build_validator(self.schema)
+        return self._validator
+
+    def iter_errors(self, instance: Any) -> Iterator[ValidationError]:
+        """
+        Lazily yields each validation error for the instance
+
+        Args:
+            instance (Any): The instance to validate
+
+        Returns:
+            Iterator[ValidationError]: The validation errors
+        """
+        return self.get_validator().iter_errors(instance)
+
+def validate_instance(
+        validator: Union[Validator, LazyValidator],
+        instance: Any
+    ) -> Tuple[bool, str]:
+    """
+    Validates an instance using a prebuilt validator, reporting the same error
+    that jsonschema.validate would have raised.  Valid instances are accepted
+    by the compiled schema without invoking jsonschema.  The error message is
+    given as the JSON path of the failing instance followed by the error's
+    short message, since the full str() of a jsonschema error pretty-prints
+    both the schema and the instance, which costs far more than validation
+    itself.  Instances which are invalid in an obvious way, such as a missing
+    required property, are reported without invoking jsonschema at all.
+
+    Args:
+        validator (Union[Validator, LazyValidator]): The prebuilt validator
+        instance (Any): The instance to validate
+
+    Returns:
+        Tuple[bool, str]: Whether the instance is valid, error message
+    """
+    if isinstance(validator, LazyValidator):
+        if validator.is_valid(instance):
+            return True, ""
+        err = validator.precheck(instance)
+        if err is not None:
+            return False, err
+    error = best_match(validator.iter_errors(instance))
+    if error is not None:
+        return False, f"{error.json_path}: {error.message}"
+    return True, ""
+
+# See doc comments below
+MANIFEST_DESCRIPTOR_VALIDATOR = LazyValidator(MANIFEST_DESCRIPTOR_SCHEMA)
+"""
+The prebuilt validator for MANIFEST_DESCRIPTOR_SCHEMA.  This is run once per
+config and layer descriptor, so it is the most frequently used validator.
+"""
+
+# See doc comments below
+IMAGE_INDEX_ENTRY_PLATFORM_VALIDATOR = LazyValidator(
+    IMAGE_INDEX_ENTRY_PLATFORM_SCHEMA
+)
+"""
+The prebuilt validator for IMAGE_INDEX_ENTRY_PLATFORM_SCHEMA.
+"""
+
+# See doc comments below
+CONTAINER_IMAGE_CONFIG_VALIDATOR = LazyValidator(
+    CONTAINER_IMAGE_CONFIG_SCHEMA
+)
+"""
+The prebuilt validator for CONTAINER_IMAGE_CONFIG_SCHEMA.
+"""
+
+# See doc comments below
+MANIFEST_OCI_VALIDATOR = LazyValidator(MANIFEST_OCI_SCHEMA)
+"""
+The prebuilt validator for MANIFEST_OCI_SCHEMA.  The schema embeds the
+descriptor schema for the config and layers, so the full manifest structure is
+validated in one pass.
+"""
+
+# See doc comments below
+IMAGE_INDEX_OCI_VALIDATOR = LazyValidator(IMAGE_INDEX_OCI_SCHEMA)
+"""
+The prebuilt validator for IMAGE_INDEX_OCI_SCHEMA.  The schema embeds the
+index entry and platform schemas, so the full index structure is validated in
+one pass.
+"""
+
+# See doc comments below
+IMAGE_INDEX_ENTRY_OCI_VALIDATOR = LazyValidator(
+    IMAGE_INDEX_ENTRY_OCI_SCHEMA
+)
+"""
+The prebuilt validator for IMAGE_INDEX_ENTRY_OCI_SCHEMA.
+"""
+
+# See doc comments below
+IMAGE_INDEX_ENTRIES_OCI_VALIDATOR = LazyValidator(
+    IMAGE_INDEX_OCI_SCHEMA["properties"]["manifests"]
+)
+"""
+The prebuilt validator for the manifests array of IMAGE_INDEX_OCI_SCHEMA, for
+validating each of an index's entries in one pass.
+"""
+
+# See doc comments below
+MANIFEST_V2_VALIDATOR = LazyValidator(MANIFEST_V2_SCHEMA)
+"""
+The prebuilt validator for MANIFEST_V2_SCHEMA.
+"""
+
+# See doc comments below
+MANIFEST_LIST_V2_VALIDATOR = LazyValidator(MANIFEST_LIST_V2_SCHEMA)
+"""
+The prebuilt validator for MANIFEST_LIST_V2_SCHEMA.
+"""
+
+# See doc comments below
+MANIFEST_LIST_V2_ENTRY_VALIDATOR = LazyValidator(
+    MANIFEST_LIST_V2_ENTRY_SCHEMA
+)
+"""
+The prebuilt validator for MANIFEST_LIST_V2_ENTRY_SCHEMA.
+"""
+
+# See doc comments below
+MANIFEST_LIST_V2_ENTRIES_VALIDATOR = LazyValidator(
+    MANIFEST_LIST_V2_SCHEMA["properties"]["manifests"]
+)
+"""
+The prebuilt validator for the manifests array of MANIFEST_LIST_V2_SCHEMA, for
+validating each of a manifest list's entries in one pass.
+"""
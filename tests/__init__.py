@@ -10,4 +10,5 @@ import tests.oci_test
 import tests.platform_test
 import tests.registryclient_test
 import tests.registryclientmock
-import tests.v2s2_test
\ No newline at end of file
+import tests.v2s2_test
+import tests.validators_test
\ No newline at end of file
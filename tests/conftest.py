@@ -0,0 +1,42 @@
+import pytest
+from image.client               import  ContainerImageRegistryClient
+from tests.registryclientmock   import  MockResponse, \
+                                        mock_get_manifest
+
+def clone_payload(payload):
+    # Copies a JSON payload of nested dicts and lists, sharing its immutable
+    # leaves.  Payloads are plain JSON, with no cycles or custom classes, so
+    # this skips copy.deepcopy's memo and dispatch machinery entirely.
+    payload_type = type(payload)
+    if payload_type is dict:
+        return { key: clone_payload(value) for key, value in payload.items() }
+    if payload_type is list:
+        return [ clone_payload(value) for value in payload ]
+    return payload
+
+@pytest.fixture
+def make_payload():
+    # Returns a fresh copy of an example payload, which tests may mutate
+    return clone_payload
+
+@pytest.fixture
+def mock_registry(monkeypatch):
+    # Replace ContainerImageRegistryClient.get_manifest directly, which is
+    # called in the implementation of ContainerImageManifestList.get_manifests
+    # and ContainerImageManifestList.get_size.  Request it before mocker, so
+    # that any mocker patch over it is undone first on teardown.
+    monkeypatch.setattr(
+        ContainerImageRegistryClient,
+        "get_manifest",
+        staticmethod(mock_get_manifest)
+    )
+
+@pytest.fixture
+def mock_get(mocker):
+    # Returns a function which patches requests.get to respond with the given
+    # payload, returning the MockResponse it responds with
+    def install(payload):
+        response = MockResponse(json=payload)
+        mocker.patch("requests.get", return_value=response)
+        return response
+    return install
@@ -1,8 +1,10 @@
 import json
+import sys
 from image.byteunit             import  ByteUnit
 from image.errors               import  ContainerImageError
 from image.v2s2                 import  ContainerImageManifestV2S2
 from image.oci                  import  ContainerImageManifestOCI
+from image.reference            import  ContainerImageReference
 from image.containerimage       import  ContainerImage, \
                                         ContainerImageManifestListV2S2, \
                                         ContainerImageIndexOCI
@@ -18,7 +20,9 @@ from tests.registryclientmock   import  MOCK_IMAGE_NAME, \
                                         ATTESTATION_S390X_MANIFEST, \
                                         ATTESTATION_AMD64_ATTESTATION_MANIFEST, \
                                         ATTESTATION_S390X_ATTESTATION_MANIFEST, \
-                                        mock_get_manifest
+                                        mock_get_manifest, \
+                                        mock_get_media_type, \
+                                        MockResponse
 
 def test_container_image_static_validation():
     # Ensure the empty string is invalid
@@ -33,26 +37,20 @@ def test_container_image_static_validation():
     valid, err = ContainerImage.validate_static(
         "this.is/a/valid/image:v1.2.3"
     )
-    assert valid == True
-    assert isinstance(err, str)
-    assert len(err) == 0
+    assert (valid, err) == (True, "")
 
     # Ensure an image name is valid, as tag is implied to be latest
     valid, err = ContainerImage.validate_static(
         "this.is/an/image/name"
     )
-    assert valid == True
-    assert isinstance(err, str)
-    assert len(err) == 0
+    assert (valid, err) == (True, "")
 
     # Ensure a digest ref is valid
     valid, err = ContainerImage.validate_static(
         "this.is/an/image/by-digest@" + \
         "sha256:f5d2c6a1e0c86e4234ea601552dbabb4ced0e013a1efcbfb439f1f6a7a9275b0"
     )
-    assert valid == True
-    assert isinstance(err, str)
-    assert len(err) == 0
+    assert (valid, err) == (True, "")
 
     # Ensure an invalid conatiner image is invalid
     valid, err = ContainerImage.validate_static(
@@ -62,6 +60,31 @@ def test_container_image_static_validation():
     assert isinstance(err, str)
     assert len(err) > 0
 
+    # Ensure a reference whose name exceeds the maximum length is invalid
+    valid, err = ContainerImage.validate_static(
+        "this.is/" + "a" * 256 + ":v1.2.3"
+    )
+    assert valid == False
+    assert isinstance(err, str)
+    assert len(err) > 0
+
+    # Ensure a long invalid reference is rejected without catastrophic
+    # backtracking over its name components
+    valid, err = ContainerImage.validate_static(
+        "a" * 64 + "!"
+    )
+    assert valid == False
+    assert isinstance(err, str)
+    assert len(err) > 0
+
+    # Ensure a tag containing non-ASCII word characters is invalid
+    valid, err = ContainerImage.validate_static(
+        "this.is/a/valid/image:v1.2.3-\u00e9"
+    )
+    assert valid == False
+    assert isinstance(err, str)
+    assert len(err) > 0
+
 def test_container_image_instantiation():
     # Ensure an exception is thrown if invalid
     exc = None
@@ -76,13 +99,25 @@ def test_container_image_instantiation():
     image = ContainerImage("this.is/a/valid/image:v1.2.3")
     assert isinstance(image, ContainerImage)
 
+    # Ensure a distinct ContainerImage is returned when constructed from a
+    # string, since ContainerImages hold per-instance manifest caches
+    image = ContainerImage.from_string("this.is/a/valid/image:v1.2.3")
+    assert isinstance(image, ContainerImage)
+    assert image is not \
+        ContainerImage.from_string("this.is/a/valid/image:v1.2.3")
+
+    # Ensure the same ContainerImageReference is shared when constructed from
+    # a string
+    ref = ContainerImageReference.from_string("this.is/a/valid/image:v1.2.3")
+    assert type(ref) is ContainerImageReference
+    assert ref is \
+        ContainerImageReference.from_string("this.is/a/valid/image:v1.2.3")
+
 def test_container_image_instance_validation():
     # Ensure a valid ContainerImage is valid
     image = ContainerImage("this.is/a/valid/image:v1.2.3")
     valid, err = image.validate()
-    assert valid == True
-    assert isinstance(err, str)
-    assert len(err) == 0
+    assert (valid, err) == (True, "")
 
     # Ensure if we invalidate the ContainerImage ref, it's invalid
     image.ref = ""
@@ -119,6 +154,11 @@ def test_container_image_is_digest_ref():
     is_digest = image.is_digest_ref()
     assert is_digest == True
 
+    # Ensure the ref is parsed again if it is changed after parsing
+    image.ref = "this.is/a/valid/image:v1.2.3"
+    is_digest = image.is_digest_ref()
+    assert is_digest == False
+
     # Ensure if we invalidate the image ref, an exception is thrown
     exc = None
     image.ref = ""
@@ -178,6 +218,11 @@ def test_container_image_get_identifier():
     identifier = image.get_identifier()
     assert identifier == "latest"
 
+    # Ensure identifier matches for implied tag ref with a registry port
+    image = ContainerImage("localhost:5000/example/image")
+    identifier = image.get_identifier()
+    assert identifier == "latest"
+
     # Ensure identifier matches for digest ref
     digest = "sha256:f5d2c6a1e0c86e4234ea601552dbabb4ced0e013a1efcbfb439f1f6a7a9275b0"
     image = ContainerImage(
@@ -197,6 +242,9 @@ def test_container_image_get_identifier():
     identifier = image.get_identifier()
     assert identifier == digest
 
+    # Ensure the digest is interned, so it is shared across references
+    assert identifier is sys.intern(digest)
+
     # Ensure if we invalidate the image ref, an exception is thrown
     exc = None
     image.ref = ""
@@ -240,6 +288,11 @@ def test_container_image_get_name():
     name = image.get_name()
     assert name == "icr.io/cpopen/cp4waiops/bcdr"
 
+    # Ensure name matches for implied tag ref with a registry port
+    image = ContainerImage("localhost:5000/example/image")
+    name = image.get_name()
+    assert name == "localhost:5000/example/image"
+
     # Ensure if we invalidate the image ref, an exception is thrown
     exc = None
     image.ref = ""
@@ -250,12 +303,7 @@ def test_container_image_get_name():
     assert exc != None
     assert isinstance(exc, ContainerImageError)
 
-def test_container_image_get_manifest(mocker):
-    mocker.patch(
-        "image.containerimage.ContainerImageRegistryClient.get_manifest",
-        mock_get_manifest
-    )
-
+def test_container_image_get_manifest(mock_registry, mocker):
     # Ensure for a v2s2 manifest list, a v2s2 manifest list is returned
     image = ContainerImage(f"{MOCK_IMAGE_NAME}:latest")
     manifest_list = image.get_manifest(MOCK_REGISTRY_CREDS)
@@ -280,6 +328,38 @@ def test_container_image_get_manifest(mocker):
     oci_manifest = image.get_manifest(MOCK_REGISTRY_CREDS)
     assert isinstance(oci_manifest, ContainerImageManifestOCI)
 
+    # Ensure the manifest is cached until the cache is invalidated
+    mock = mocker.patch(
+        "image.containerimage.ContainerImageRegistryClient.get_manifest",
+        side_effect=mock_get_manifest
+    )
+    assert image.get_manifest(MOCK_REGISTRY_CREDS) is oci_manifest
+    assert mock.call_count == 0
+    image.invalidate()
+    assert image.get_manifest(MOCK_REGISTRY_CREDS) is not oci_manifest
+    assert mock.call_count == 1
+
+    # Ensure reassigning the ref to another digest fetches its own manifest
+    mock.reset_mock()
+    image.ref = f"{MOCK_IMAGE_NAME}@" + \
+        REDHAT_MANIFEST_LIST_EXAMPLE['manifests'][0]['digest']
+    assert isinstance(
+        image.get_manifest(MOCK_REGISTRY_CREDS), ContainerImageManifestV2S2
+    )
+    assert mock.call_count == 1
+
+    # Ensure an equal but distinct auth does not reuse the cached manifest
+    image.get_manifest(dict(MOCK_REGISTRY_CREDS))
+    assert mock.call_count == 2
+
+    # Ensure a tag ref's manifest is fetched on every call, so that it stays
+    # consistent with the digest the registry reports for the tag
+    mock.reset_mock()
+    image = ContainerImage(f"{MOCK_IMAGE_NAME}:latest")
+    image.get_manifest(MOCK_REGISTRY_CREDS)
+    image.get_manifest(MOCK_REGISTRY_CREDS)
+    assert mock.call_count == 2
+
     # Ensure if we invalidate the image ref, an exception is thrown
     exc = None
     image.ref = ""
@@ -290,10 +370,10 @@ def test_container_image_get_manifest(mocker):
     assert exc != None
     assert isinstance(exc, ContainerImageError)
 
-def test_container_image_is_manifest_list(mocker):
+def test_container_image_is_manifest_list(mock_registry, mocker):
     mocker.patch(
-        "image.containerimage.ContainerImageRegistryClient.get_manifest",
-        mock_get_manifest
+        "image.containerimage.ContainerImageRegistryClient.get_media_type",
+        mock_get_media_type
     )
 
     # Ensure for a v2s2 manifest list, it is seen as a manifest list
@@ -320,6 +400,15 @@ def test_container_image_is_manifest_list(mocker):
     is_manifest_list = image.is_manifest_list(MOCK_REGISTRY_CREDS)
     assert is_manifest_list == False
 
+    # Ensure the manifest is fetched if its mediaType is not recognized
+    mocker.patch(
+        "image.containerimage.ContainerImageRegistryClient.get_media_type",
+        return_value="application/json"
+    )
+    image = ContainerImage(f"{MOCK_IMAGE_NAME}:latest")
+    is_manifest_list = image.is_manifest_list(MOCK_REGISTRY_CREDS)
+    assert is_manifest_list == True
+
     # Ensure if we invalidate the image ref, an exception is thrown
     exc = None
     image.ref = ""
@@ -330,12 +419,7 @@ def test_container_image_is_manifest_list(mocker):
     assert exc != None
     assert isinstance(exc, ContainerImageError)
 
-def test_container_image_get_size(mocker):
-    mocker.patch(
-        "image.containerimage.ContainerImageRegistryClient.get_manifest",
-        mock_get_manifest
-    )
-
+def test_container_image_get_size(mock_registry, mocker):
     # Ensure size matches expected size for a v2s2 manifest list
     image = ContainerImage(f"{MOCK_IMAGE_NAME}:latest")
     size = image.get_size(MOCK_REGISTRY_CREDS)
@@ -353,9 +437,16 @@ def test_container_image_get_size(mocker):
                     REDHAT_S390X_MANIFEST["layers"][0]["size"]
     assert size == expected_size
 
-    # Ensure formatted size matches expected value for a v2s2 manifest list
+    # Ensure formatted size matches expected value for a v2s2 manifest list,
+    # and since the tag may have been pushed to, its manifests are fetched
+    # again rather than cached
+    mock = mocker.patch(
+        "image.containerimage.ContainerImageRegistryClient.get_manifest",
+        side_effect=mock_get_manifest
+    )
     size_formatted = image.get_size_formatted(MOCK_REGISTRY_CREDS)
     assert size_formatted == ByteUnit.format_size_bytes(expected_size)
+    assert mock.call_count == 5
 
     # Ensure size matches expected size for a v2s2 manifest
     image = ContainerImage(
@@ -367,9 +458,21 @@ def test_container_image_get_size(mocker):
                     REDHAT_AMD64_MANIFEST["layers"][0]["size"]
     assert size == expected_size
 
-    # Ensure formatted size matches expected value for a v2s2 manifest
+    # Ensure formatted size matches expected value for a v2s2 manifest, and
+    # since the digest ref cannot change, the cached size is reused without
+    # fetching any manifests
+    mock.reset_mock()
     size_formatted = image.get_size_formatted(MOCK_REGISTRY_CREDS)
     assert size_formatted == ByteUnit.format_size_bytes(expected_size)
+    assert mock.call_count == 0
+
+    # Ensure reassigning the ref to another digest calculates its own size
+    image.ref = f"{MOCK_IMAGE_NAME}@" + \
+        REDHAT_MANIFEST_LIST_EXAMPLE["manifests"][1]["digest"]
+    size = image.get_size(MOCK_REGISTRY_CREDS)
+    assert size == REDHAT_ARM64_MANIFEST["config"]["size"] + \
+                   REDHAT_ARM64_MANIFEST["layers"][0]["size"]
+    assert mock.call_count == 1
 
     # Ensure size matches expected size for an OCI manifest list
     image = ContainerImage(f"{MOCK_IMAGE_NAME}:latest-attestation")
@@ -421,9 +524,7 @@ def test_container_image_get_size(mocker):
     assert isinstance(exc, ContainerImageError)
 
 def test_container_image_delete(mocker):
-    mock_response = mocker.MagicMock()
-    mock_response.raise_for_status.return_value = None
-    mocker.patch("requests.delete", return_value=mock_response)
+    mocker.patch("requests.delete", return_value=MockResponse())
 
     # Ensure no exceptions are raised when image is successfully deleted
     image = ContainerImage(f"{MOCK_IMAGE_NAME}:latest")
@@ -442,8 +543,4 @@ def test_container_image_to_string():
 def test_container_image_to_json():
     # Ensure JSON conversion matches expected JSON conversion
     image = ContainerImage("this.is/a/valid/image:v1.2.3")
-    assert json.dumps(image) == json.dumps(
-        {
-            "ref": "this.is/a/valid/image:v1.2.3"
-        }
-    )
+    assert json.dumps(image) == '{"ref": "this.is/a/valid/image:v1.2.3"}'
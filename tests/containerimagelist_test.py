@@ -1,4 +1,7 @@
+import json
 from image.byteunit             import  ByteUnit
+from image.client               import  ContainerImageRegistryClient
+from image.errors               import  ContainerImageError
 from image.containerimage       import  ContainerImageList, \
                                         ContainerImage, \
                                         ContainerImageListDiff
@@ -11,7 +14,7 @@ from tests.registryclientmock   import  MOCK_IMAGE_NAME, \
                                         REDHAT_ARM64_MANIFEST, \
                                         REDHAT_PPC64LE_MANIFEST, \
                                         REDHAT_S390X_MANIFEST, \
-                                        mock_get_manifest
+                                        MockResponse
 
 EXPECTED_DIFF_UPDATED_STR_1 = """Updated
 this.is.an/image-1:and-a-different-tag
@@ -54,12 +57,38 @@ def test_container_image_list_append():
     )
     assert len(img_list) == 1
 
-def test_container_image_list_get_size(mocker):
-    mocker.patch(
-        "image.containerimage.ContainerImageRegistryClient.get_manifest",
-        mock_get_manifest
-    )
+def test_container_image_list_from_refs():
+    # Ensure an image is constructed for each given ref, in order
+    refs = [
+        "this.is/my/image:and-my-tag",
+        "this.is/my/other-image:and-my-tag",
+        "this.is/my/image:and-my-tag"
+    ]
+    img_list = ContainerImageList.from_refs(refs)
+    assert len(img_list) == 3
+    assert [str(image) for image in img_list] == refs
+    assert img_list.images[0] is not img_list.images[2]
+
+    # Ensure an exception is thrown if any ref is invalid
+    exc = None
+    try:
+        img_list = ContainerImageList.from_refs(refs + ["not an image"])
+    except Exception as e:
+        exc = e
+    assert exc != None
+    assert isinstance(exc, ContainerImageError)
 
+def test_container_image_list_to_json():
+    # Ensure the ContainerImageList serializes to a list of its images
+    img_list = ContainerImageList()
+    img_list.append(ContainerImage("this.is/my/image:and-my-tag"))
+    img_list.append(ContainerImage("this.is/my/other-image:and-my-tag"))
+    assert json.loads(json.dumps(img_list)) == [
+        { "ref": "this.is/my/image:and-my-tag" },
+        { "ref": "this.is/my/other-image:and-my-tag" }
+    ]
+
+def test_container_image_list_get_size(mock_registry):
     # Ensure the ContainerImageList size matches the expected size
     img_list = ContainerImageList()
     img_list.append(
@@ -101,10 +130,29 @@ def test_container_image_list_get_size(mocker):
     assert size == expected_size
     assert formatted == ByteUnit.format_size_bytes(expected_size)
 
+def test_container_image_list_get_size_fetches(mock_registry, mocker):
+    # Ensure each image's manifest is fetched once, and each arch manifest
+    # shared across the list's manifest lists is fetched only once
+    spy = mocker.spy(ContainerImageRegistryClient, "get_manifest")
+    img_list = ContainerImageList.from_refs([
+        f"{MOCK_IMAGE_NAME}:latest",
+        f"{MOCK_IMAGE_NAME}:latest-dup"
+    ])
+    img_list.get_size(MOCK_REGISTRY_CREDS)
+    refs = [ str(call.args[0]) for call in spy.call_args_list ]
+    assert len(refs) == len(set(refs))
+    unique_digests = set(
+        entry["digest"] for entry in
+        REDHAT_MANIFEST_LIST_EXAMPLE["manifests"] + \
+        REDHAT_MANIFEST_LIST_EXAMPLE_DUP["manifests"]
+    )
+    assert len(refs) == 2 + len(unique_digests)
+
 def test_container_image_list_delete(mocker):
-    mock_response = mocker.MagicMock()
-    mock_response.raise_for_status.return_value = None
-    mocker.patch("requests.delete", return_value=mock_response)
+    mock_delete = mocker.patch(
+        "requests.Session.delete",
+        return_value=MockResponse()
+    )
 
     # Ensure no exceptions are raised when images are successfully deleted
     img_list = ContainerImageList()
@@ -131,6 +179,9 @@ def test_container_image_list_delete(mocker):
         exc = e
     assert exc == None
 
+    # Ensure each image was deleted through the shared session
+    assert mock_delete.call_count == 3
+
 def test_container_image_list_diff():
     #Ensure the image list diff matches the expected diff
     img_list_1 = ContainerImageList()
@@ -1,5 +1,5 @@
-import copy
 import json
+import pytest
 from jsonschema         import  ValidationError
 from image.descriptor   import  ContainerImageDescriptor
 
@@ -20,12 +20,28 @@ OCI_DESCRIPTOR_EXAMPLE_EXTENDED = {
     ]
 }
 
+# The example serialized once, rather than on every comparison
+OCI_DESCRIPTOR_EXAMPLE_STR = json.dumps(
+    OCI_DESCRIPTOR_EXAMPLE, indent=2, sort_keys=False
+)
+
+@pytest.fixture
+def oci_descriptor(make_payload):
+    return make_payload(OCI_DESCRIPTOR_EXAMPLE)
+
+@pytest.fixture
+def oci_descriptor_extended(make_payload):
+    return make_payload(OCI_DESCRIPTOR_EXAMPLE_EXTENDED)
+
 """
 ContainerImageDescriptor tests
 
 Unit tests for the ContainerImageDescriptor class
 """
-def test_container_image_oci_descriptor_static_validation():
+def test_container_image_oci_descriptor_static_validation(
+        oci_descriptor,
+        oci_descriptor_extended
+    ):
     # Empty dict should be invalid
     empty_dict_valid, err = ContainerImageDescriptor.validate_static({})
     assert empty_dict_valid == False
@@ -59,12 +75,11 @@ def test_container_image_oci_descriptor_static_validation():
     assert isinstance(err, str)
 
     # CNCF example should be valid
-    oci_descriptor_mut = copy.deepcopy(OCI_DESCRIPTOR_EXAMPLE)
+    oci_descriptor_mut = oci_descriptor
     oci_desc_valid, err = ContainerImageDescriptor.validate_static(
         oci_descriptor_mut
     )
-    assert oci_desc_valid == True
-    assert isinstance(err, str)
+    assert (oci_desc_valid, err) == (True, "")
 
     # Size as string should be invalid
     oci_descriptor_mut["size"] = "32654"
@@ -73,7 +88,7 @@ def test_container_image_oci_descriptor_static_validation():
     )
     assert oci_desc_valid == False
     assert isinstance(err, str)
-    oci_descriptor_mut["size"] = copy.copy(OCI_DESCRIPTOR_EXAMPLE["size"])
+    oci_descriptor_mut["size"] = OCI_DESCRIPTOR_EXAMPLE["size"]
 
     # Digest as int should be invalid
     oci_descriptor_mut["digest"] = 1234
@@ -82,7 +97,7 @@ def test_container_image_oci_descriptor_static_validation():
     )
     assert oci_desc_valid == False
     assert isinstance(err, str)
-    oci_descriptor_mut["digest"] = copy.copy(OCI_DESCRIPTOR_EXAMPLE["digest"])
+    oci_descriptor_mut["digest"] = OCI_DESCRIPTOR_EXAMPLE["digest"]
 
     # mediaType as int should be invalid
     oci_descriptor_mut["mediaType"] = 1234
@@ -91,7 +106,7 @@ def test_container_image_oci_descriptor_static_validation():
     )
     assert oci_desc_valid == False
     assert isinstance(err, str)
-    oci_descriptor_mut["mediaType"] = copy.copy(OCI_DESCRIPTOR_EXAMPLE["mediaType"])
+    oci_descriptor_mut["mediaType"] = OCI_DESCRIPTOR_EXAMPLE["mediaType"]
 
     # Digest of valid type but invalid format should be invalid
     oci_descriptor_mut["digest"] = "notadigest"
@@ -100,39 +115,28 @@ def test_container_image_oci_descriptor_static_validation():
     )
     assert oci_desc_valid == False
     assert isinstance(err, str)
-    oci_descriptor_mut["digest"] = copy.copy(OCI_DESCRIPTOR_EXAMPLE["digest"])
+    oci_descriptor_mut["digest"] = OCI_DESCRIPTOR_EXAMPLE["digest"]
 
     # With URLs should be valid
     oci_ext_desc_valid, err = ContainerImageDescriptor.validate_static(
-        copy.deepcopy(OCI_DESCRIPTOR_EXAMPLE_EXTENDED)
+        oci_descriptor_extended
     )
-    assert oci_ext_desc_valid == True
-    assert isinstance(err, str)
+    assert (oci_ext_desc_valid, err) == (True, "")
 
-def test_container_image_oci_descriptor_instantiation():
+def test_container_image_oci_descriptor_instantiation(oci_descriptor):
     # Ensure exception is thrown on instantiation using invalid schema
-    exc = None
-    try:
-        desc = ContainerImageDescriptor({})
-    except Exception as e:
-        exc = e
-    assert exc != None
-    assert isinstance(exc, ValidationError)
+    with pytest.raises(ValidationError):
+        ContainerImageDescriptor({})
 
     # Ensure ContainerImageDescriptor is returned on instantiation using valid schema
-    desc = ContainerImageDescriptor(
-        copy.deepcopy(OCI_DESCRIPTOR_EXAMPLE)
-    )
+    desc = ContainerImageDescriptor(oci_descriptor)
     assert isinstance(desc, ContainerImageDescriptor)
 
-def test_container_image_oci_descriptor_instance_validation():
+def test_container_image_oci_descriptor_instance_validation(oci_descriptor):
     # Ensure ContainerImageDescriptor instantiates and is valid post-instantiation
-    desc = ContainerImageDescriptor(
-        copy.deepcopy(OCI_DESCRIPTOR_EXAMPLE)
-    )
+    desc = ContainerImageDescriptor(oci_descriptor)
     valid, err = desc.validate()
-    assert valid == True
-    assert isinstance(err, str)
+    assert (valid, err) == (True, "")
 
     # Ensure if we modify a property of the ContainerImageDescriptor to be invalid,
     # it becomes invalid
@@ -141,103 +145,79 @@ def test_container_image_oci_descriptor_instance_validation():
     assert valid == False
     assert isinstance(err, str)
 
-def test_container_image_oci_descriptor_get_digest():
+def test_container_image_oci_descriptor_get_digest(oci_descriptor):
     # Ensure digest matches expected digest
-    desc = ContainerImageDescriptor(
-        copy.deepcopy(OCI_DESCRIPTOR_EXAMPLE)
-    )
+    desc = ContainerImageDescriptor(oci_descriptor)
     digest = desc.get_digest()
     assert digest == "sha256:5b0bcabd1ed22e9fb1310cf6c2dec7cdef19f0ad69efa1f392e94a4333501270"
 
     # Ensure if we modify the digest to be invalid type, a TypeError is thrown
     desc.descriptor["digest"] = 1234
-    exc = None
-    try:
-        digest = desc.get_digest()
-    except Exception as e:
-        exc = e
-    assert exc != None
-    assert isinstance(exc, TypeError)
+    with pytest.raises(TypeError):
+        desc.get_digest()
 
     # Ensure if we remove the digest, a TypeError is thrown
     desc.descriptor.pop("digest")
-    exc = None
-    try:
-        digest = desc.get_digest()
-    except Exception as e:
-        exc = e
-    assert exc != None
-    assert isinstance(exc, TypeError)
+    with pytest.raises(TypeError):
+        desc.get_digest()
 
     # Ensure if we modify the digest to be valid type with invalid value,
     # a ValidationError is thrown
     desc.descriptor["digest"] = "notadigest"
-    exc = None
-    try:
-        digest = desc.get_digest()
-    except Exception as e:
-        exc = e
-    assert exc != None
-    assert isinstance(exc, ValidationError)
-
-def test_container_image_oci_descriptor_get_size():
+    with pytest.raises(ValidationError):
+        desc.get_digest()
+
+def test_container_image_oci_descriptor_get_size(oci_descriptor):
     # Ensure size matches expected size
-    desc = ContainerImageDescriptor(
-        copy.deepcopy(OCI_DESCRIPTOR_EXAMPLE)
-    )
+    desc = ContainerImageDescriptor(oci_descriptor)
     size = desc.get_size()
     assert size == 7682
 
     # Ensure if we modify the size to be invalid type which cannot be converted
     # to an int, a ValueError is thrown
     desc.descriptor["size"] = "notanint"
-    exc = None
-    try:
-        size = desc.get_size()
-    except Exception as e:
-        exc = e
-    assert exc != None
-    assert isinstance(exc, ValueError)
+    with pytest.raises(ValueError):
+        desc.get_size()
 
     # Ensure if we remove the size, a TypeError is thrown
     desc.descriptor.pop("size")
-    exc = None
-    try:
-        size = desc.get_size()
-    except Exception as e:
-        exc = e
-    assert exc != None
-    assert isinstance(exc, TypeError)
-
-def test_container_image_oci_descriptor_get_media_type():
+    with pytest.raises(TypeError):
+        desc.get_size()
+
+def test_container_image_oci_descriptor_get_media_type(oci_descriptor):
     # Ensure mediaType matches expected mediaType
-    desc = ContainerImageDescriptor(
-        copy.deepcopy(OCI_DESCRIPTOR_EXAMPLE)
-    )
+    desc = ContainerImageDescriptor(oci_descriptor)
     media_type = desc.get_media_type()
     assert media_type == "application/vnd.oci.image.manifest.v1+json"
 
     # Ensure if we remove the mediaType, a TypeError is thrown
     desc.descriptor.pop("mediaType")
-    exc = None
-    try:
-        media_type = desc.get_media_type()
-    except Exception as e:
-        exc = e
-    assert exc != None
-    assert isinstance(exc, TypeError)
-
-def test_container_image_oci_descriptor_to_string():
+    with pytest.raises(TypeError):
+        desc.get_media_type()
+
+def test_container_image_oci_descriptor_to_string(oci_descriptor):
     # Ensure stringified descriptor matches expected stringified contents
-    desc_str = json.dumps(OCI_DESCRIPTOR_EXAMPLE, indent=2, sort_keys=False)
-    desc = ContainerImageDescriptor(
-        copy.deepcopy(OCI_DESCRIPTOR_EXAMPLE)
-    )
-    assert str(desc) == desc_str
+    desc = ContainerImageDescriptor(oci_descriptor)
+    assert str(desc) == OCI_DESCRIPTOR_EXAMPLE_STR
 
-def test_container_image_oci_descriptor_to_json():
+def test_container_image_oci_descriptor_to_json(oci_descriptor):
     # Ensure JSONified descriptor matches expected JSONified contents
-    desc = ContainerImageDescriptor(
-        copy.deepcopy(OCI_DESCRIPTOR_EXAMPLE)
-    )
+    desc = ContainerImageDescriptor(oci_descriptor)
     assert json.dumps(desc) == json.dumps(OCI_DESCRIPTOR_EXAMPLE)
+
+def test_container_image_oci_descriptor_get_sizes_static(
+        oci_descriptor,
+        oci_descriptor_extended
+    ):
+    # Ensure sizes are keyed by digest, deduplicating shared digests
+    sizes = ContainerImageDescriptor.get_sizes_static(
+        [ oci_descriptor, oci_descriptor_extended ]
+    )
+    assert sizes == { oci_descriptor["digest"]: 7682 }
+
+    # Ensure if any descriptor is invalid, a ValidationError is thrown
+    oci_descriptor_extended["digest"] = "notadigest"
+    with pytest.raises(ValidationError):
+        ContainerImageDescriptor.get_sizes_static(
+            [ oci_descriptor, oci_descriptor_extended ]
+        )
@@ -1,5 +1,5 @@
-import copy
 import json
+import pytest
 from jsonschema         import  ValidationError
 from image.descriptor   import  ContainerImageDescriptor
 from image.manifest     import  ContainerImageManifest
@@ -54,11 +54,22 @@ REDHAT_MANIFEST_EXAMPLE = {
     ]
 }
 
-def test_container_image_manifest_get_config_descriptor():
+# The example serialized once, rather than on every comparison
+OCI_MANIFEST_EXAMPLE_STR = json.dumps(
+    OCI_MANIFEST_EXAMPLE, indent=2, sort_keys=False
+)
+
+@pytest.fixture
+def oci_manifest(make_payload):
+    return make_payload(OCI_MANIFEST_EXAMPLE)
+
+@pytest.fixture
+def redhat_manifest(make_payload):
+    return make_payload(REDHAT_MANIFEST_EXAMPLE)
+
+def test_container_image_manifest_get_config_descriptor(oci_manifest):
     # Ensure valid config equals expected config
-    manifest = ContainerImageManifest(
-        copy.deepcopy(OCI_MANIFEST_EXAMPLE)
-    )
+    manifest = ContainerImageManifest(oci_manifest)
     config = manifest.get_config_descriptor()
     assert isinstance(config, ContainerImageDescriptor)
     assert config.descriptor == manifest.manifest["config"]
@@ -66,19 +77,12 @@ def test_container_image_manifest_get_config_descriptor():
     # Ensure if we invalidate a property of the manifest config,
     # an error is thrown
     manifest.manifest["config"]["digest"] = "notadigest"
-    exc = None
-    try:
-        desc = manifest.get_config_descriptor()
-    except Exception as e:
-        exc = e
-    assert exc != None
-    assert isinstance(exc, ValidationError)
+    with pytest.raises(ValidationError):
+        manifest.get_config_descriptor()
 
-def test_container_image_manifest_get_layer_descriptors():
+def test_container_image_manifest_get_layer_descriptors(oci_manifest):
     # Ensure valid layers equal expected layers
-    manifest = ContainerImageManifest(
-        copy.deepcopy(OCI_MANIFEST_EXAMPLE)
-    )
+    manifest = ContainerImageManifest(oci_manifest)
     layers = manifest.get_layer_descriptors()
     assert isinstance(layers, list)
     assert len(layers) == 3
@@ -91,39 +95,29 @@ def test_container_image_manifest_get_layer_descriptors():
 
     # Ensure if we invalidate a property of a layer, an error is thrown
     manifest.manifest["layers"][0]["digest"] = "notadigest"
-    exc = None
-    try:
-        layers = manifest.get_layer_descriptors()
-    except Exception as e:
-        exc = e
-    assert exc != None
-    assert isinstance(exc, ValidationError)
+    with pytest.raises(ValidationError):
+        manifest.get_layer_descriptors()
 
-def test_container_image_manifest_get_size():
+def test_container_image_manifest_get_size(oci_manifest, redhat_manifest):
     # Ensure size matches expected size
     expected_size = OCI_MANIFEST_EXAMPLE["config"]["size"] + \
                     OCI_MANIFEST_EXAMPLE["layers"][0]["size"] + \
                     OCI_MANIFEST_EXAMPLE["layers"][1]["size"] + \
                     OCI_MANIFEST_EXAMPLE["layers"][2]["size"]
-    manifest = ContainerImageManifest(
-        copy.deepcopy(OCI_MANIFEST_EXAMPLE)
-    )
+    manifest = ContainerImageManifest(oci_manifest)
     size = manifest.get_size()
     assert size == expected_size
 
     # Ensure size matches expected size
     expected_size = REDHAT_MANIFEST_EXAMPLE["config"]["size"] + \
                     REDHAT_MANIFEST_EXAMPLE["layers"][0]["size"]
-    manifest = ContainerImageManifest(
-        copy.deepcopy(REDHAT_MANIFEST_EXAMPLE)
-    )
+    manifest = ContainerImageManifest(redhat_manifest)
     size = manifest.get_size()
     assert size == expected_size
 
 def test_container_image_manifest_to_string():
-    manifest_str = json.dumps(OCI_MANIFEST_EXAMPLE, indent=2, sort_keys=False)
     manifest = ContainerImageManifest(OCI_MANIFEST_EXAMPLE)
-    assert str(manifest) == manifest_str
+    assert str(manifest) == OCI_MANIFEST_EXAMPLE_STR
 
 def test_container_image_manifest_to_json():
     manifest = ContainerImageManifest(OCI_MANIFEST_EXAMPLE)
@@ -1,4 +1,4 @@
-import copy
+import pytest
 from jsonschema                 import  ValidationError
 from image.errors               import  ContainerImageError
 from image.oci                  import  ContainerImageManifestOCI
@@ -66,242 +66,123 @@ CNCF_MANIFEST_LIST_EXAMPLE = {
     ]
 }
 
-def test_container_image_manifest_factory_create_v2s2_manifest():
-    # Ensure exception is thrown when empty dict is passed
-    exc = None
-    try:
-        manifest = ContainerImageManifestFactory.create_v2s2_manifest(
-            {}
-        )
-    except Exception as e:
-        exc = e
-    assert exc != None
-    assert isinstance(exc, ValidationError)
+# The example payloads, selected by name through the payload fixture
+PAYLOAD_EXAMPLES = {
+    "empty": {},
+    "v2s2_manifest": CNCF_MANIFEST_EXAMPLE,
+    "v2s2_manifest_list": CNCF_MANIFEST_LIST_EXAMPLE,
+    "oci_manifest": ATTESTATION_AMD64_ATTESTATION_MANIFEST,
+    "oci_index": ATTESTATION_MANIFEST_LIST_EXAMPLE
+}
 
+@pytest.fixture
+def payload(request, make_payload):
+    return make_payload(PAYLOAD_EXAMPLES[request.param])
+
+@pytest.mark.parametrize("payload", ["v2s2_manifest"], indirect=True)
+def test_container_image_manifest_factory_create_v2s2_manifest(payload):
     # Ensure manifest is created when valid v2s2 manifest is passed
-    manifest = ContainerImageManifestFactory.create_v2s2_manifest(
-        copy.deepcopy(CNCF_MANIFEST_EXAMPLE)
-    )
+    manifest = ContainerImageManifestFactory.create_v2s2_manifest(payload)
     assert isinstance(manifest, ContainerImageManifestV2S2)
 
-    # Ensure exception is thrown when v2s2 manifest list is passed
-    exc = None
-    try:
-        manifest = ContainerImageManifestFactory.create_v2s2_manifest(
-            copy.deepcopy(CNCF_MANIFEST_LIST_EXAMPLE)
-        )
-    except Exception as e:
-        exc = e
-    assert exc != None
-    assert isinstance(exc, ValidationError)
-
-    # Ensure exception is thrown when OCI manifest is passed
-    exc = None
-    try:
-        manifest = ContainerImageManifestFactory.create_v2s2_manifest(
-            copy.deepcopy(ATTESTATION_AMD64_ATTESTATION_MANIFEST)
-        )
-    except Exception as e:
-        exc = e
-    assert exc != None
-    assert isinstance(exc, ValidationError)
-
-    # Ensure exception is thrown when OCI image index is passed
-    exc = None
-    try:
-        manifest = ContainerImageManifestFactory.create_v2s2_manifest(
-            copy.deepcopy(ATTESTATION_MANIFEST_LIST_EXAMPLE)
-        )
-    except Exception as e:
-        exc = e
-    assert exc != None
-    assert isinstance(exc, ValidationError)
-
-def test_container_image_manifest_factory_create_oci_manifest():
-    # Ensure exception is thrown when empty dict is passed
-    exc = None
-    try:
-        manifest = ContainerImageManifestFactory.create_oci_manifest(
-            {}
-        )
-    except Exception as e:
-        exc = e
-    assert exc != None
-    assert isinstance(exc, ValidationError)
-
+@pytest.mark.parametrize(
+    "payload",
+    [ "empty", "v2s2_manifest_list", "oci_manifest", "oci_index" ],
+    indirect=True
+)
+def test_container_image_manifest_factory_create_v2s2_manifest_invalid(
+        payload
+    ):
+    # Ensure exception is thrown when anything but a v2s2 manifest is passed
+    with pytest.raises(ValidationError):
+        ContainerImageManifestFactory.create_v2s2_manifest(payload)
+
+@pytest.mark.parametrize("payload", ["oci_manifest"], indirect=True)
+def test_container_image_manifest_factory_create_oci_manifest(payload):
     # Ensure manifest is created when valid OCI manifest is passed
-    manifest = ContainerImageManifestFactory.create_oci_manifest(
-        copy.deepcopy(ATTESTATION_AMD64_ATTESTATION_MANIFEST)
-    )
+    manifest = ContainerImageManifestFactory.create_oci_manifest(payload)
     assert isinstance(manifest, ContainerImageManifestOCI)
 
-    # Ensure exception is thrown when OCI image index is passed
-    exc = None
-    try:
-        manifest = ContainerImageManifestFactory.create_oci_manifest(
-            copy.deepcopy(ATTESTATION_MANIFEST_LIST_EXAMPLE)
-        )
-    except Exception as e:
-        exc = e
-    assert exc != None
-    assert isinstance(exc, ValidationError)
-
-    # Ensure exception is thrown when v2s2 manifest is passed
-    exc = None
-    try:
-        manifest = ContainerImageManifestFactory.create_oci_manifest(
-            copy.deepcopy(CNCF_MANIFEST_EXAMPLE)
-        )
-    except Exception as e:
-        exc = e
-    assert exc != None
-    assert isinstance(exc, ValidationError)
-
-    # Ensure exception is thrown when v2s2 manifest list is passed
-    exc = None
-    try:
-        manifest = ContainerImageManifestFactory.create_oci_manifest(
-            copy.deepcopy(CNCF_MANIFEST_LIST_EXAMPLE)
-        )
-    except Exception as e:
-        exc = e
-    assert exc != None
-    assert isinstance(exc, ValidationError)
-
-def test_container_image_manifest_factory_create_v2s2_manifest_list():
-    # Ensure exception is thrown when empty dict is passed
-    exc = None
-    try:
-        manifest_list = ContainerImageManifestFactory.create_v2s2_manifest_list(
-            {}
-        )
-    except Exception as e:
-        exc = e
-    assert exc != None
-    assert isinstance(exc, ValidationError)
-
+@pytest.mark.parametrize(
+    "payload",
+    [ "empty", "oci_index", "v2s2_manifest", "v2s2_manifest_list" ],
+    indirect=True
+)
+def test_container_image_manifest_factory_create_oci_manifest_invalid(
+        payload
+    ):
+    # Ensure exception is thrown when anything but an OCI manifest is passed
+    with pytest.raises(ValidationError):
+        ContainerImageManifestFactory.create_oci_manifest(payload)
+
+@pytest.mark.parametrize("payload", ["v2s2_manifest_list"], indirect=True)
+def test_container_image_manifest_factory_create_v2s2_manifest_list(payload):
     # Ensure manifest list is created when valid v2s2 manifest list is passed
     manifest_list = ContainerImageManifestFactory.create_v2s2_manifest_list(
-        copy.deepcopy(CNCF_MANIFEST_LIST_EXAMPLE)
+        payload
     )
     assert isinstance(manifest_list, ContainerImageManifestListV2S2)
 
-    # Ensure exception is thrown when v2s2 manifest is passed
-    exc = None
-    try:
-        manifest_list = ContainerImageManifestFactory.create_v2s2_manifest_list(
-            copy.deepcopy(CNCF_MANIFEST_EXAMPLE)
-        )
-    except Exception as e:
-        exc = e
-    assert exc != None
-    assert isinstance(exc, ValidationError)
-
-    # Ensure exception is thrown when OCI image index is passed
-    exc = None
-    try:
-        manifest_list = ContainerImageManifestFactory.create_v2s2_manifest_list(
-            copy.deepcopy(ATTESTATION_MANIFEST_LIST_EXAMPLE)
-        )
-    except Exception as e:
-        exc = e
-    assert exc != None
-    assert isinstance(exc, ValidationError)
-
-    # Ensure exception is thrown when OCI manifest is passed
-    exc = None
-    try:
-        manifest_list = ContainerImageManifestFactory.create_v2s2_manifest_list(
-            copy.deepcopy(ATTESTATION_AMD64_ATTESTATION_MANIFEST)
-        )
-    except Exception as e:
-        exc = e
-    assert exc != None
-    assert isinstance(exc, ValidationError)
-
-def test_container_image_manifest_factory_create_oci_image_index():
-    # Ensure exception is thrown when empty dict is passed
-    exc = None
-    try:
-        manifest_list = ContainerImageManifestFactory.create_oci_image_index(
-            {}
-        )
-    except Exception as e:
-        exc = e
-    assert exc != None
-    assert isinstance(exc, ValidationError)
-
+@pytest.mark.parametrize(
+    "payload",
+    [ "empty", "v2s2_manifest", "oci_index", "oci_manifest" ],
+    indirect=True
+)
+def test_container_image_manifest_factory_create_v2s2_manifest_list_invalid(
+        payload
+    ):
+    # Ensure exception is thrown when anything but a v2s2 manifest list is
+    # passed
+    with pytest.raises(ValidationError):
+        ContainerImageManifestFactory.create_v2s2_manifest_list(payload)
+
+@pytest.mark.parametrize("payload", ["oci_index"], indirect=True)
+def test_container_image_manifest_factory_create_oci_image_index(payload):
     # Ensure image index is created when valid OCI image index is passed
     manifest_list = ContainerImageManifestFactory.create_oci_image_index(
-        copy.deepcopy(ATTESTATION_MANIFEST_LIST_EXAMPLE)
+        payload
     )
     assert isinstance(manifest_list, ContainerImageIndexOCI)
 
-    # Ensure exception is thrown when v2s2 manifest is passed
-    exc = None
-    try:
-        manifest_list = ContainerImageManifestFactory.create_oci_image_index(
-            copy.deepcopy(CNCF_MANIFEST_EXAMPLE)
-        )
-    except Exception as e:
-        exc = e
-    assert exc != None
-    assert isinstance(exc, ValidationError)
-
-    # Ensure exception is thrown when OCI manifest is passed
-    exc = None
-    try:
-        manifest_list = ContainerImageManifestFactory.create_oci_image_index(
-            copy.deepcopy(ATTESTATION_AMD64_ATTESTATION_MANIFEST)
-        )
-    except Exception as e:
-        exc = e
-    assert exc != None
-    assert isinstance(exc, ValidationError)
-
-    # Ensure exception is thrown when v2s2 manifest list is passed
-    exc = None
-    try:
-        manifest_list = ContainerImageManifestFactory.create_oci_image_index(
-            copy.deepcopy(CNCF_MANIFEST_LIST_EXAMPLE)
-        )
-    except Exception as e:
-        exc = e
-    assert exc != None
-    assert isinstance(exc, ValidationError)
-
-def test_container_image_manifest_factory_create():
+@pytest.mark.parametrize(
+    "payload",
+    [ "empty", "v2s2_manifest", "oci_manifest", "v2s2_manifest_list" ],
+    indirect=True
+)
+def test_container_image_manifest_factory_create_oci_image_index_invalid(
+        payload
+    ):
+    # Ensure exception is thrown when anything but an OCI image index is passed
+    with pytest.raises(ValidationError):
+        ContainerImageManifestFactory.create_oci_image_index(payload)
+
+@pytest.mark.parametrize(
+    "payload,expected",
+    [
+        ("v2s2_manifest_list", ContainerImageManifestListV2S2),
+        ("v2s2_manifest", ContainerImageManifestV2S2),
+        ("oci_index", ContainerImageIndexOCI),
+        ("oci_manifest", ContainerImageManifestOCI)
+    ],
+    indirect=["payload"]
+)
+def test_container_image_manifest_factory_create(payload, expected):
+    # Ensure the expected manifest type is created for each valid payload
+    manifest = ContainerImageManifestFactory.create(payload)
+    assert isinstance(manifest, expected)
+
+@pytest.mark.parametrize("payload", ["empty"], indirect=True)
+def test_container_image_manifest_factory_create_invalid(payload):
     # Ensure exception is thrown when empty dict is passed
-    exc = None
-    try:
-        nothing = ContainerImageManifestFactory.create(
-            {}
-        )
-    except Exception as e:
-        exc = e
-    assert exc != None
-    assert isinstance(exc, ContainerImageError)
-
-    # Ensure v2s2 manifest list is created when valid v2s2 manifest list is passed
-    manifest_list = ContainerImageManifestFactory.create(
-        copy.deepcopy(CNCF_MANIFEST_LIST_EXAMPLE)
-    )
-    assert isinstance(manifest_list, ContainerImageManifestListV2S2)
-
-    # Ensure v2s2 manifest is created when valid v2s2 manifest is passed
-    v2s2_manifest = ContainerImageManifestFactory.create(
-        copy.deepcopy(CNCF_MANIFEST_EXAMPLE)
-    )
-    assert isinstance(v2s2_manifest, ContainerImageManifestV2S2)
-
-    # Ensure OCI image index is created when valid OCI image index is passed
-    image_index = ContainerImageManifestFactory.create(
-        copy.deepcopy(ATTESTATION_MANIFEST_LIST_EXAMPLE)
-    )
-    assert isinstance(image_index, ContainerImageIndexOCI)
-
-    # Ensure OCI manifest is created when valid OCI manifest is passed
-    oci_manifest = ContainerImageManifestFactory.create(
-        copy.deepcopy(ATTESTATION_AMD64_ATTESTATION_MANIFEST)
-    )
-    assert isinstance(oci_manifest, ContainerImageManifestOCI)
+    with pytest.raises(ContainerImageError):
+        ContainerImageManifestFactory.create(payload)
+
+@pytest.mark.parametrize("payload", ["oci_manifest", "oci_index"], indirect=True)
+def test_container_image_manifest_factory_create_without_media_type(payload):
+    # Ensure OCI types are still created when the optional mediaType is omitted
+    payload.pop("mediaType")
+    manifest = ContainerImageManifestFactory.create(payload)
+    if "manifests" in payload:
+        assert isinstance(manifest, ContainerImageIndexOCI)
+    else:
+        assert isinstance(manifest, ContainerImageManifestOCI)
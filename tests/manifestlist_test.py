@@ -1,5 +1,5 @@
-import copy
 import json
+import pytest
 from image.manifestlistentry    import  ContainerImageManifestListEntry
 from image.containerimage       import  ContainerImageManifestList
 from image.manifest             import  ContainerImageManifest
@@ -41,15 +41,21 @@ CNCF_MANIFEST_LIST_EXAMPLE = {
     ]
 }
 
+# The examples serialized once, rather than on every comparison
+CNCF_MANIFEST_LIST_EXAMPLE_JSON = json.dumps(CNCF_MANIFEST_LIST_EXAMPLE)
+CNCF_MANIFEST_LIST_EXAMPLE_STR = json.dumps(
+    CNCF_MANIFEST_LIST_EXAMPLE, indent=2, sort_keys=False
+)
+
 """
 ContainerImageManifest tests
 
 Unit tests for the ContainerImageManifest class
 """
-def test_container_image_manifest_list_get_entries():
+def test_container_image_manifest_list_get_entries(make_payload):
     # Ensure entries match expected typing and length
     manifest_list = ContainerImageManifestList(
-        copy.deepcopy(CNCF_MANIFEST_LIST_EXAMPLE)
+        make_payload(CNCF_MANIFEST_LIST_EXAMPLE)
     )
     entries = manifest_list.get_entries()
     assert isinstance(entries, list)
@@ -57,15 +63,12 @@ def test_container_image_manifest_list_get_entries():
     assert isinstance(entries[0], ContainerImageManifestListEntry)
     assert isinstance(entries[1], ContainerImageManifestListEntry)
 
-def test_container_image_manifest_list_get_manifests(mocker):
-    # Mock the ContainerImageRegistryClient.get_manifest function which is
-    # called in the implementation of ContainerImageManifestList.get_size
-    mocker.patch(
-        "image.containerimage.ContainerImageRegistryClient.get_manifest",
-        mock_get_manifest
-    )
+def test_container_image_manifest_list_get_manifests(
+        mock_registry,
+        make_payload
+    ):
     manifest_list = ContainerImageManifestList(
-        copy.deepcopy(REDHAT_MANIFEST_LIST_EXAMPLE)
+        make_payload(REDHAT_MANIFEST_LIST_EXAMPLE)
     )
     manifests = manifest_list.get_manifests(
         MOCK_IMAGE_NAME, MOCK_REGISTRY_CREDS
@@ -82,15 +85,25 @@ def test_container_image_manifest_list_get_manifests(mocker):
     assert isinstance(manifests[2], ContainerImageManifest)
     assert isinstance(manifests[3], ContainerImageManifest)
 
-def test_container_image_manifest_list_get_size(mocker):
-    # Mock the ContainerImageRegistryClient.get_manifest function which is
-    # called in the implementation of ContainerImageManifestList.get_size
-    mocker.patch(
-        "image.containerimage.ContainerImageRegistryClient.get_manifest",
-        mock_get_manifest
+def test_container_image_manifest_list_get_manifests_single_entry(
+        mock_registry,
+        mocker,
+        make_payload
+    ):
+    # Ensure a single entry is fetched directly, without a thread pool
+    executor = mocker.patch("image.manifestlist.ThreadPoolExecutor")
+    manifest_list_dict = make_payload(REDHAT_MANIFEST_LIST_EXAMPLE)
+    manifest_list_dict["manifests"] = manifest_list_dict["manifests"][:1]
+    manifest_list = ContainerImageManifestList(manifest_list_dict)
+    manifests = manifest_list.get_manifests(
+        MOCK_IMAGE_NAME, MOCK_REGISTRY_CREDS
     )
+    assert json.dumps(manifests) == json.dumps([ REDHAT_AMD64_MANIFEST ])
+    assert executor.call_count == 0
+
+def test_container_image_manifest_list_get_size(mock_registry, make_payload):
     manifest_list = ContainerImageManifestList(
-        copy.deepcopy(REDHAT_MANIFEST_LIST_EXAMPLE)
+        make_payload(REDHAT_MANIFEST_LIST_EXAMPLE)
     )
     size = manifest_list.get_size(MOCK_IMAGE_NAME, MOCK_REGISTRY_CREDS)
     expected_size = REDHAT_MANIFEST_LIST_EXAMPLE["manifests"][0]["size"] + \
@@ -107,15 +120,56 @@ def test_container_image_manifest_list_get_size(mocker):
                     REDHAT_S390X_MANIFEST["layers"][0]["size"]
     assert size == expected_size
 
+def test_container_image_manifest_list_get_size_duplicate_digests(
+        mocker,
+        make_payload
+    ):
+    # Ensure entries sharing a digest have their manifest fetched only once
+    mock = mocker.patch(
+        "image.containerimage.ContainerImageRegistryClient.get_manifest",
+        side_effect=mock_get_manifest
+    )
+    duplicated = make_payload(REDHAT_MANIFEST_LIST_EXAMPLE)
+    duplicated["manifests"].append(
+        make_payload(REDHAT_MANIFEST_LIST_EXAMPLE["manifests"][0])
+    )
+    manifest_list = ContainerImageManifestList(duplicated)
+    size = manifest_list.get_size(MOCK_IMAGE_NAME, MOCK_REGISTRY_CREDS)
+    assert mock.call_count == 4
+
+    # Ensure the duplicated entry's size is still counted
+    expected_size = ContainerImageManifestList(
+        make_payload(REDHAT_MANIFEST_LIST_EXAMPLE)
+    ).get_size(MOCK_IMAGE_NAME, MOCK_REGISTRY_CREDS)
+    assert size == expected_size + \
+                    REDHAT_MANIFEST_LIST_EXAMPLE["manifests"][0]["size"]
+
+def test_container_image_manifest_list_get_size_no_layers(
+        mocker,
+        make_payload
+    ):
+    # Ensure an arch manifest with no layers raises, as it does when sizing
+    # the arch manifest directly
+    no_layers = make_payload(REDHAT_AMD64_MANIFEST)
+    no_layers["layers"] = []
+    mocker.patch(
+        "image.containerimage.ContainerImageRegistryClient.get_manifest",
+        return_value=no_layers
+    )
+    manifest_list = ContainerImageManifestList(
+        make_payload(REDHAT_MANIFEST_LIST_EXAMPLE)
+    )
+    with pytest.raises(ValueError):
+        manifest_list.get_size(MOCK_IMAGE_NAME, MOCK_REGISTRY_CREDS)
+    with pytest.raises(ValueError):
+        ContainerImageManifest(no_layers).get_size()
+
 def test_container_image_manifest_list_to_string():
     # Ensure stringified manifest list matches expected string
-    manifest_list_str = json.dumps(
-        CNCF_MANIFEST_LIST_EXAMPLE, indent=2, sort_keys=False
-    )
     manifest_list = ContainerImageManifestList(CNCF_MANIFEST_LIST_EXAMPLE)
-    assert str(manifest_list) == manifest_list_str
+    assert str(manifest_list) == CNCF_MANIFEST_LIST_EXAMPLE_STR
 
 def test_container_image_manifest_to_json():
     # Ensure JSONified manifest list matches expected JSON conversion
     manifest_list = ContainerImageManifestList(CNCF_MANIFEST_LIST_EXAMPLE)
-    assert json.dumps(manifest_list) == json.dumps(CNCF_MANIFEST_LIST_EXAMPLE)
+    assert json.dumps(manifest_list) == CNCF_MANIFEST_LIST_EXAMPLE_JSON
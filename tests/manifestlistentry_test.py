@@ -1,5 +1,5 @@
-import copy
 import json
+import pytest
 from jsonschema                 import ValidationError
 from image.manifestlistentry    import ContainerImageManifestListEntry
 
@@ -44,6 +44,14 @@ REDHAT_MANIFEST_LIST_ENTRY_EXAMPLE = {
     "size": 429
 }
 
+# The example serialized once, rather than on every comparison
+CNCF_MANIFEST_LIST_ENTRY_EXAMPLE_JSON = json.dumps(
+    CNCF_MANIFEST_LIST_ENTRY_EXAMPLE
+)
+CNCF_MANIFEST_LIST_ENTRY_EXAMPLE_STR = json.dumps(
+    CNCF_MANIFEST_LIST_ENTRY_EXAMPLE, indent=2, sort_keys=False
+)
+
 """
 ContainerImageManifestListEntry tests
 
@@ -64,49 +72,34 @@ def test_container_image_manifest_list_entry_instantiation():
     )
     assert isinstance(entry, ContainerImageManifestListEntry)
 
-def test_container_image_manifest_list_entry_get_digest():
+def test_container_image_manifest_list_entry_get_digest(make_payload):
     # Ensure digest matches expected digest
     entry = ContainerImageManifestListEntry(
-        copy.deepcopy(CNCF_MANIFEST_LIST_ENTRY_EXAMPLE)
+        make_payload(CNCF_MANIFEST_LIST_ENTRY_EXAMPLE)
     )
     digest = entry.get_digest()
     assert digest == CNCF_MANIFEST_LIST_ENTRY_EXAMPLE["digest"]
 
     # Ensure if we modify the digest to be invalid type, a TypeError is thrown
     entry.entry["digest"] = 1234
-    exc = None
-    try:
-        digest = entry.get_digest()
-    except Exception as e:
-        exc = e
-    assert exc != None
-    assert isinstance(exc, TypeError)
+    with pytest.raises(TypeError):
+        entry.get_digest()
 
     # Ensure if we remove the digest, a TypeError is thrown
     entry.entry.pop("digest")
-    exc = None
-    try:
-        digest = entry.get_digest()
-    except Exception as e:
-        exc = e
-    assert exc != None
-    assert isinstance(exc, TypeError)
+    with pytest.raises(TypeError):
+        entry.get_digest()
 
     # Ensure if we modify the digest to be valid type with invalid value,
     # a ValidationError is thrown
     entry.entry["digest"] = "notadigest"
-    exc = None
-    try:
-        digest = entry.get_digest()
-    except Exception as e:
-        exc = e
-    assert exc != None
-    assert isinstance(exc, ValidationError)
-
-def test_container_image_manifest_list_entry_get_size():
+    with pytest.raises(ValidationError):
+        entry.get_digest()
+
+def test_container_image_manifest_list_entry_get_size(make_payload):
     # Ensure size matches expected size
     entry = ContainerImageManifestListEntry(
-        copy.deepcopy(CNCF_MANIFEST_LIST_ENTRY_EXAMPLE)
+        make_payload(CNCF_MANIFEST_LIST_ENTRY_EXAMPLE)
     )
     size = entry.get_size()
     assert size == CNCF_MANIFEST_LIST_ENTRY_EXAMPLE["size"]
@@ -114,73 +107,50 @@ def test_container_image_manifest_list_entry_get_size():
     # Ensure if we modify the size to be invalid type which cannot be converted
     # to an int, a ValueError is thrown
     entry.entry["size"] = "notanint"
-    exc = None
-    try:
-        size = entry.get_size()
-    except Exception as e:
-        exc = e
-    assert exc != None
-    assert isinstance(exc, ValueError)
+    with pytest.raises(ValueError):
+        entry.get_size()
 
     # Ensure if we remove the size, a TypeError is thrown
     entry.entry.pop("size")
-    exc = None
-    try:
-        size = entry.get_size()
-    except Exception as e:
-        exc = e
-    assert exc != None
-    assert isinstance(exc, TypeError)
-
-def test_container_image_manifest_list_entry_get_media_type():
+    with pytest.raises(TypeError):
+        entry.get_size()
+
+def test_container_image_manifest_list_entry_get_media_type(make_payload):
     # Ensure mediaType matches expected mediaType
     entry = ContainerImageManifestListEntry(
-        copy.deepcopy(CNCF_MANIFEST_LIST_ENTRY_EXAMPLE)
+        make_payload(CNCF_MANIFEST_LIST_ENTRY_EXAMPLE)
     )
     media_type = entry.get_media_type()
     assert media_type == CNCF_MANIFEST_LIST_ENTRY_EXAMPLE["mediaType"]
 
     # Ensure if we remove the mediaType, a TypeError is thrown
     entry.entry.pop("mediaType")
-    exc = None
-    try:
-        media_type = entry.get_media_type()
-    except Exception as e:
-        exc = e
-    assert exc != None
-    assert isinstance(exc, TypeError)
-
-def test_container_image_manifest_list_entry_get_platform():
+    with pytest.raises(TypeError):
+        entry.get_media_type()
+
+def test_container_image_manifest_list_entry_get_platform(make_payload):
     # Ensure platform matches expected platform
     entry = ContainerImageManifestListEntry(
-        copy.deepcopy(CNCF_MANIFEST_LIST_ENTRY_EXAMPLE)
+        make_payload(CNCF_MANIFEST_LIST_ENTRY_EXAMPLE)
     )
     platform = entry.get_platform()
     assert platform.platform == CNCF_MANIFEST_LIST_ENTRY_EXAMPLE["platform"]
 
     # Ensure if we remove the platform, a TypeError is thrown
     entry.entry.pop("platform")
-    exc = None
-    try:
-        platform = entry.get_platform()
-    except Exception as e:
-        exc = e
-    assert exc != None
-    assert isinstance(exc, TypeError)
-
-def test_container_image_manifest_list_entry_to_string():
+    with pytest.raises(TypeError):
+        entry.get_platform()
+
+def test_container_image_manifest_list_entry_to_string(make_payload):
     # Ensure the string conversion matches the expected string conversion
-    entry_str = json.dumps(
-        CNCF_MANIFEST_LIST_ENTRY_EXAMPLE, indent=2, sort_keys=False
-    )
     entry = ContainerImageManifestListEntry(
-        copy.deepcopy(CNCF_MANIFEST_LIST_ENTRY_EXAMPLE)
+        make_payload(CNCF_MANIFEST_LIST_ENTRY_EXAMPLE)
     )
-    assert str(entry) == entry_str
+    assert str(entry) == CNCF_MANIFEST_LIST_ENTRY_EXAMPLE_STR
 
-def test_container_image_manifest_list_entry_to_json():
+def test_container_image_manifest_list_entry_to_json(make_payload):
     # Ensure the JSON conversion matches the expected JSON conversion
     entry = ContainerImageManifestListEntry(
-        copy.deepcopy(CNCF_MANIFEST_LIST_ENTRY_EXAMPLE)
+        make_payload(CNCF_MANIFEST_LIST_ENTRY_EXAMPLE)
     )
-    assert json.dumps(entry) == json.dumps(CNCF_MANIFEST_LIST_ENTRY_EXAMPLE)
+    assert json.dumps(entry) == CNCF_MANIFEST_LIST_ENTRY_EXAMPLE_JSON
@@ -1,5 +1,5 @@
-import copy
 import json
+import pytest
 from jsonschema                 import  ValidationError
 from image.containerimage       import  ContainerImageIndexOCI
 from image.manifest             import  ContainerImageManifest
@@ -12,8 +12,7 @@ from tests.registryclientmock   import  ATTESTATION_MANIFEST_LIST_EXAMPLE, \
                                         ATTESTATION_S390X_ATTESTATION_MANIFEST, \
                                         REDHAT_MANIFEST_LIST_EXAMPLE, \
                                         MOCK_IMAGE_NAME, \
-                                        MOCK_REGISTRY_CREDS, \
-                                        mock_get_manifest
+                                        MOCK_REGISTRY_CREDS
 
 # Example manifest from the OCI image manifest spec
 # Ref: https://github.com/opencontainers/image-spec/blob/v1.0.1/manifest.md
@@ -116,7 +115,29 @@ ContainerImageIndexEntryOCI tests
 
 Unit tests for the ContainerImageIndexEntryOCI class
 """
-def test_container_image_oci_image_index_entry_static_validation():
+# See doc comments below
+REMOVED = object()
+"""
+Marks a field which an invalid fixture case removes from the example.
+"""
+
+# See doc comments below
+INDEX_ENTRY_CASES = [
+    ({ "mediaType": REMOVED }, False),
+    ({ "digest": REMOVED }, False),
+    ({ "digest": 1234 }, False),
+    ({ "digest": "notadigest" }, False),
+    ({ "size": REMOVED }, False),
+    ({ "size": "abcd" }, False),
+    ({ "platform": REMOVED }, True),
+    ({ "platform": 1234 }, False)
+]
+"""
+Changes applied to the example image index entry, each with whether the
+changed entry should be valid.
+"""
+
+def test_container_image_oci_image_index_entry_static_validation(make_payload):
     # Empty dict should be invalid
     empty_dict_valid, err = ContainerImageIndexEntryOCI.validate_static(
         {}
@@ -126,122 +147,55 @@ def test_container_image_oci_image_index_entry_static_validation():
     assert len(err) > 0
 
     # Valid OCI example should be valid
-    oci_example_mut = copy.deepcopy(DOCKER_BUILDX_ATTESTATION_INDEX_ENTRY)
     oci_example_valid, err = ContainerImageIndexEntryOCI.validate_static(
-        oci_example_mut
-    )
-    assert oci_example_valid == True
-    assert isinstance(err, str)
-    assert len(err) == 0
-
-    # No mediaType should be invalid
-    oci_example_mut.pop("mediaType")
-    no_mt_valid, err = ContainerImageIndexEntryOCI.validate_static(
-        oci_example_mut
-    )
-    assert no_mt_valid == False
-    assert isinstance(err, str)
-    assert len(err) > 0
-    oci_example_mut["mediaType"] = copy.copy(
-        DOCKER_BUILDX_ATTESTATION_INDEX_ENTRY["mediaType"]
-    )
-
-    # No digest should be invalid
-    oci_example_mut.pop("digest")
-    no_dig_valid, err = ContainerImageIndexEntryOCI.validate_static(
-        oci_example_mut
-    )
-    assert no_dig_valid == False
-    assert isinstance(err, str)
-    assert len(err) > 0
-
-    # Invalid digest type should be invalid
-    oci_example_mut["digest"] = 1234
-    inv_dig_valid, err = ContainerImageIndexEntryOCI.validate_static(
-        oci_example_mut
-    )
-    assert inv_dig_valid == False
-    assert isinstance(err, str)
-    assert len(err) > 0
-
-    # Invalid digest value should be invalid
-    oci_example_mut["digest"] = "notadigest"
-    inv_dig_valid, err = ContainerImageIndexEntryOCI.validate_static(
-        oci_example_mut
-    )
-    assert inv_dig_valid == False
-    assert isinstance(err, str)
-    assert len(err) > 0
-    oci_example_mut["digest"] = copy.copy(
-        DOCKER_BUILDX_ATTESTATION_INDEX_ENTRY["digest"]
-    )
-
-    # No size should be invalid
-    oci_example_mut.pop("size")
-    no_size_valid, err = ContainerImageIndexEntryOCI.validate_static(
-        oci_example_mut
-    )
-    assert no_size_valid == False
-    assert isinstance(err, str)
-    assert len(err) > 0
-
-    # Invalid size type should be invalid
-    oci_example_mut["size"] = "abcd"
-    inv_size_valid, err = ContainerImageIndexEntryOCI.validate_static(
-        oci_example_mut
-    )
-    assert inv_size_valid == False
-    assert isinstance(err, str)
-    assert len(err) > 0
-    oci_example_mut["size"] = copy.copy(
-        DOCKER_BUILDX_ATTESTATION_INDEX_ENTRY["size"]
-    )
-
-    # No platform should be valid
-    oci_example_mut.pop("platform")
-    no_plt_valid, err = ContainerImageIndexEntryOCI.validate_static(
-        oci_example_mut
-    )
-    assert no_plt_valid == True
-    assert isinstance(err, str)
-    assert len(err) == 0
-
-    # Invalid platform type should be invalid
-    oci_example_mut["platform"] = 1234
-    inv_plt_valid, err = ContainerImageIndexEntryOCI.validate_static(
-        oci_example_mut
-    )
-    assert inv_plt_valid == False
-    assert isinstance(err, str)
-    assert len(err) > 0
-
-def test_container_image_oci_image_index_entry_instantiation():
+        make_payload(DOCKER_BUILDX_ATTESTATION_INDEX_ENTRY)
+    )
+    assert (oci_example_valid, err) == (True, "")
+
+@pytest.mark.parametrize("changes,expected", INDEX_ENTRY_CASES)
+def test_container_image_oci_image_index_entry_static_validation_changes(
+        make_payload,
+        changes,
+        expected
+    ):
+    # Apply the changes to a fresh copy of the example
+    oci_example_mut = make_payload(DOCKER_BUILDX_ATTESTATION_INDEX_ENTRY)
+    for key, value in changes.items():
+        if value is REMOVED:
+            oci_example_mut.pop(key)
+        else:
+            oci_example_mut[key] = value
+
+    # Ensure the changed entry is only valid if expected, with an error
+    # message if and only if invalid
+    valid, err = ContainerImageIndexEntryOCI.validate_static(oci_example_mut)
+    assert valid == expected
+    assert isinstance(err, str)
+    assert (len(err) == 0) == expected
+
+def test_container_image_oci_image_index_entry_instantiation(make_payload):
     # Invalid entry should raise ValidationError
-    exc = None
-    try:
-        entry = ContainerImageIndexEntryOCI(
+    with pytest.raises(ValidationError):
+        ContainerImageIndexEntryOCI(
             {}
         )
-    except Exception as e:
-        exc = e
-    assert exc != None
-    assert isinstance(exc, ValidationError)
 
     # Valid entry should be a ContainerImageIndexEntryOCI instance
     entry = ContainerImageIndexEntryOCI(
-        copy.deepcopy(DOCKER_BUILDX_ATTESTATION_INDEX_ENTRY)
+        make_payload(DOCKER_BUILDX_ATTESTATION_INDEX_ENTRY)
     )
     assert isinstance(entry, ContainerImageIndexEntryOCI)
 
-def test_container_image_oci_image_index_entry_instance_validation():
+def test_container_image_oci_image_index_entry_instance_validation(
+        make_payload
+    ):
     # Ensure ContainerImageIndexEntryOCI instantiates and is valid
     # post-instantiation
     entry = ContainerImageIndexEntryOCI(
-        copy.deepcopy(DOCKER_BUILDX_ATTESTATION_INDEX_ENTRY)
+        make_payload(DOCKER_BUILDX_ATTESTATION_INDEX_ENTRY)
     )
     valid, err = entry.validate()
-    assert valid == True
-    assert isinstance(err, str)
+    assert (valid, err) == (True, "")
 
     # Ensure if we modify a property of the ContainerImageIndexEntryOCI
     # to be invalid, it becomes invalid
@@ -255,7 +209,7 @@ ContainerImageIndexOCI tests
 
 Unit tests for the ContainerImageIndexOCI class
 """
-def test_container_image_oci_manifest_list_static_validation():
+def test_container_image_oci_manifest_list_static_validation(make_payload):
     # Empty dict should be invalid
     empty_dict_valid, err = ContainerImageIndexOCI.validate_static({})
     assert empty_dict_valid == False
@@ -263,13 +217,11 @@ def test_container_image_oci_manifest_list_static_validation():
     assert len(err) > 0
 
     # Valid OCI example should be valid
-    oci_example_mut = copy.deepcopy(OCI_IMAGE_INDEX_EXAMPLE)
+    oci_example_mut = make_payload(OCI_IMAGE_INDEX_EXAMPLE)
     oci_example_valid, err = ContainerImageIndexOCI.validate_static(
         oci_example_mut
     )
-    assert oci_example_valid == True
-    assert isinstance(err, str)
-    assert len(err) == 0
+    assert (oci_example_valid, err) == (True, "")
 
     # No schemaVersion should be invalid
     oci_example_mut.pop("schemaVersion")
@@ -279,18 +231,14 @@ def test_container_image_oci_manifest_list_static_validation():
     assert no_sv_valid == False
     assert isinstance(err, str)
     assert len(err) > 0
-    oci_example_mut["schemaVersion"] = copy.copy(
-        OCI_IMAGE_INDEX_EXAMPLE["schemaVersion"]
-    )
+    oci_example_mut["schemaVersion"] = OCI_IMAGE_INDEX_EXAMPLE["schemaVersion"]
 
     # With OCI index mediaType should be valid
     oci_example_mut["mediaType"] = "application/vnd.oci.image.index.v1+json"
     oci_mt_valid, err = ContainerImageIndexOCI.validate_static(
         oci_example_mut
     )
-    assert oci_mt_valid == True
-    assert isinstance(err, str)
-    assert len(err) == 0
+    assert (oci_mt_valid, err) == (True, "")
 
     # With v2s2 manifest list mediaType should be invalid
     oci_example_mut["mediaType"] = "application/vnd.docker.distribution.manifest.list.v2+json"
@@ -337,31 +285,24 @@ def test_container_image_oci_manifest_list_static_validation():
     assert isinstance(err, str)
     assert len(err) > 0
 
-def test_container_image_oci_manifest_list_instantiation():
+def test_container_image_oci_manifest_list_instantiation(make_payload):
     # Ensure exception is thrown on instantiation using invalid schema
-    exc = None
-    try:
-        manifest_list = ContainerImageIndexOCI({})
-    except Exception as e:
-        exc = e
-    assert exc != None
-    assert isinstance(exc, ValidationError)
+    with pytest.raises(ValidationError):
+        ContainerImageIndexOCI({})
 
     # Ensure ContainerImageIndexOCI is returned when using valid schema
     manifest_list = ContainerImageIndexOCI(
-        copy.deepcopy(OCI_IMAGE_INDEX_EXAMPLE)
+        make_payload(OCI_IMAGE_INDEX_EXAMPLE)
     )
     assert isinstance(manifest_list, ContainerImageIndexOCI)
 
-def test_container_image_oci_manifest_list_instance_validation():
+def test_container_image_oci_manifest_list_instance_validation(make_payload):
     # Ensure ContainerImageIndexOCI instantiates and is valid post-instantiation
     manifest_list = ContainerImageIndexOCI(
-        copy.deepcopy(OCI_IMAGE_INDEX_EXAMPLE)
+        make_payload(OCI_IMAGE_INDEX_EXAMPLE)
     )
     valid, err = manifest_list.validate()
-    assert valid == True
-    assert isinstance(err, str)
-    assert len(err) == 0
+    assert (valid, err) == (True, "")
 
     # Ensure if we invalidate a property of the manifest, it's invalid
     manifest_list.manifest_list["mediaType"] = 1234
@@ -377,9 +318,8 @@ def test_container_image_oci_manifest_list_instance_validation():
     assert valid == False
     assert isinstance(err, str)
     assert len(err) > 0
-    manifest_list.manifest_list["schemaVersion"] = copy.copy(
+    manifest_list.manifest_list["schemaVersion"] = \
         OCI_IMAGE_INDEX_EXAMPLE["schemaVersion"]
-    )
 
     # Ensure if we invalidate a property of a manifest entry, it's invalid
     manifest_list.manifest_list["manifests"][0]["digest"] = "notadigest"
@@ -387,14 +327,13 @@ def test_container_image_oci_manifest_list_instance_validation():
     assert valid == False
     assert isinstance(err, str)
     assert len(err) > 0
-    manifest_list.manifest_list["manifests"][0]["digest"] = copy.copy(
+    manifest_list.manifest_list["manifests"][0]["digest"] = \
         OCI_IMAGE_INDEX_EXAMPLE["manifests"][0]["digest"]
-    )
 
-def test_container_image_oci_manifest_list_get_entries():
+def test_container_image_oci_manifest_list_get_entries(make_payload):
     # Ensure entries match expected typing and length
     manifest_list = ContainerImageIndexOCI(
-        copy.deepcopy(OCI_IMAGE_INDEX_EXAMPLE)
+        make_payload(OCI_IMAGE_INDEX_EXAMPLE)
     )
     entries = manifest_list.get_oci_entries()
     assert isinstance(entries, list)
@@ -403,26 +342,24 @@ def test_container_image_oci_manifest_list_get_entries():
     assert isinstance(entries[1], ContainerImageIndexEntryOCI)
 
     # Ensure if we invalidate a property of a manifest entry, it's invalid
-    exc = None
     manifest_list.manifest_list["manifests"][0]["digest"] = "notadigest"
-    try:
-        entries = manifest_list.get_oci_entries()
-    except Exception as e:
-        exc = e
-    assert exc != None
-    assert isinstance(exc, ValidationError)
-
-def test_container_image_oci_manifest_list_get_manifests(mocker):
-    # Mock the ContainerImageRegistryClient.get_manifest function which is
-    # called in the implementation of ContainerImageManifestList.get_size
-    mocker.patch(
-        "image.containerimage.ContainerImageRegistryClient.get_manifest",
-        mock_get_manifest
-    )
+    with pytest.raises(ValidationError):
+        manifest_list.get_oci_entries()
 
+    # Ensure if we break the schema of a manifest entry, it's invalid
+    manifest_list.manifest_list["manifests"][0]["digest"] = \
+        OCI_IMAGE_INDEX_EXAMPLE["manifests"][0]["digest"]
+    manifest_list.manifest_list["manifests"][1]["size"] = "abcd"
+    with pytest.raises(ValidationError):
+        manifest_list.get_oci_entries()
+
+def test_container_image_oci_manifest_list_get_manifests(
+        mock_registry,
+        make_payload
+    ):
     # Ensure the OCI index manifests can be retrieved
     manifest_list = ContainerImageIndexOCI(
-        copy.deepcopy(ATTESTATION_MANIFEST_LIST_EXAMPLE)
+        make_payload(ATTESTATION_MANIFEST_LIST_EXAMPLE)
     )
     manifests = manifest_list.get_oci_manifests(
         MOCK_IMAGE_NAME, MOCK_REGISTRY_CREDS
@@ -440,7 +377,7 @@ ContainerImageManifestOCI tests
 
 Unit tests for the ContainerImageManifestOCI class
 """
-def test_container_image_oci_manifest_static_validation():
+def test_container_image_oci_manifest_static_validation(make_payload):
     # Empty dict should be invalid
     empty_dict_valid, err = ContainerImageManifestOCI.validate_static({})
     assert empty_dict_valid == False
@@ -449,14 +386,12 @@ def test_container_image_oci_manifest_static_validation():
 
     # Valid OCI example manifest should be valid
     oci_manifest_valid, err = ContainerImageManifestOCI.validate_static(
-        copy.deepcopy(OCI_MANIFEST_EXAMPLE)
+        make_payload(OCI_MANIFEST_EXAMPLE)
     )
-    assert oci_manifest_valid == True
-    assert isinstance(err, str)
-    assert len(err) == 0
+    assert (oci_manifest_valid, err) == (True, "")
 
     # No schemaVersion should be invalid
-    oci_example_mut = copy.deepcopy(OCI_MANIFEST_EXAMPLE)
+    oci_example_mut = make_payload(OCI_MANIFEST_EXAMPLE)
     oci_example_mut.pop("schemaVersion")
     no_sv_valid, err = ContainerImageManifestOCI.validate_static(
         oci_example_mut
@@ -464,7 +399,7 @@ def test_container_image_oci_manifest_static_validation():
     assert no_sv_valid == False
     assert isinstance(err, str)
     assert len(err) > 0
-    oci_example_mut["schemaVersion"] = copy.deepcopy(
+    oci_example_mut["schemaVersion"] = make_payload(
         OCI_MANIFEST_EXAMPLE["schemaVersion"]
     )
 
@@ -476,7 +411,7 @@ def test_container_image_oci_manifest_static_validation():
     assert no_conf_valid == False
     assert isinstance(err, str)
     assert len(err) > 0
-    oci_example_mut["config"] = copy.deepcopy(
+    oci_example_mut["config"] = make_payload(
         OCI_MANIFEST_EXAMPLE["config"]
     )
 
@@ -488,52 +423,51 @@ def test_container_image_oci_manifest_static_validation():
     assert no_layers_valid == False
     assert isinstance(err, str)
     assert len(err) > 0
-    oci_example_mut["layers"] = copy.copy(
-        OCI_MANIFEST_EXAMPLE["layers"]
+
+    # Invalid layer digest should be invalid
+    oci_example_mut = make_payload(OCI_MANIFEST_EXAMPLE)
+    oci_example_mut["layers"][-1]["digest"] = "notadigest"
+    layer_digest_valid, err = ContainerImageManifestOCI.validate_static(
+        oci_example_mut
     )
+    assert layer_digest_valid == False
+    assert err == "Invalid digest: notadigest"
 
     # V2S2 RedHat example should be invalid
     rh_example_valid, err = ContainerImageManifestOCI.validate_static(
-        copy.deepcopy(REDHAT_MANIFEST_EXAMPLE)
+        make_payload(REDHAT_MANIFEST_EXAMPLE)
     )
     assert rh_example_valid == False
     assert isinstance(err, str)
     assert len(err) > 0
 
-def test_container_image_oci_manifest_instantiation():
+def test_container_image_oci_manifest_instantiation(make_payload):
     # Ensure exception is thrown on instantiation using invalid schema
-    exc = None
-    try:
-        manifest = ContainerImageManifestOCI({})
-    except Exception as e:
-        exc = e
-    assert exc != None
-    assert isinstance(exc, ValidationError)
+    with pytest.raises(ValidationError):
+        ContainerImageManifestOCI({})
 
     # Ensure ContainerImageManifestOCI is returned when using valid schema
     manifest = ContainerImageManifestOCI(
-        copy.deepcopy(OCI_MANIFEST_EXAMPLE)
+        make_payload(OCI_MANIFEST_EXAMPLE)
     )
     assert isinstance(manifest, ContainerImageManifestOCI)
 
     # Ensure a generic manifest can be converted into an OCI manifest
     generic_manifest = ContainerImageManifest(
-        copy.deepcopy(OCI_MANIFEST_EXAMPLE)
+        make_payload(OCI_MANIFEST_EXAMPLE)
     )
     manifest = ContainerImageManifestOCI.from_manifest(
         generic_manifest
     )
     assert isinstance(manifest, ContainerImageManifestOCI)
 
-def test_container_image_oci_manifest_instance_validation():
+def test_container_image_oci_manifest_instance_validation(make_payload):
     # Ensure ContainerImageManifestOCI instantiates and is valid post-instantiation
     manifest = ContainerImageManifestOCI(
-        copy.deepcopy(OCI_MANIFEST_EXAMPLE)
+        make_payload(OCI_MANIFEST_EXAMPLE)
     )
     valid, err = manifest.validate()
-    assert valid == True
-    assert isinstance(err, str)
-    assert len(err) == 0
+    assert (valid, err) == (True, "")
 
     # Ensure if we invalidate a property of the manifest, it's invalid
     manifest.manifest["mediaType"] = 1234
@@ -549,9 +483,8 @@ def test_container_image_oci_manifest_instance_validation():
     assert valid == False
     assert isinstance(err, str)
     assert len(err) > 0
-    manifest.manifest["config"]["digest"] = copy.copy(
+    manifest.manifest["config"]["digest"] = \
         OCI_MANIFEST_EXAMPLE["config"]["digest"]
-    )
 
     # Ensure if we invalidate a property of the manifest config, it's invalid
     manifest.manifest["config"]["size"] = "1234"
@@ -559,9 +492,8 @@ def test_container_image_oci_manifest_instance_validation():
     assert valid == False
     assert isinstance(err, str)
     assert len(err) > 0
-    manifest.manifest["config"]["digest"] = copy.copy(
+    manifest.manifest["config"]["digest"] = \
         OCI_MANIFEST_EXAMPLE["config"]["size"]
-    )
 
     # Ensure if we invalidate a property of a manifest layer, it's invalid
     manifest.manifest["layers"][0]["digest"] = "notadigest"
@@ -569,9 +501,8 @@ def test_container_image_oci_manifest_instance_validation():
     assert valid == False
     assert isinstance(err, str)
     assert len(err) > 0
-    manifest.manifest["layers"][0]["digest"] = copy.copy(
+    manifest.manifest["layers"][0]["digest"] = \
         OCI_MANIFEST_EXAMPLE["layers"][0]["digest"]
-    )
 
     # Ensure if we invalidate a property of a manifest layer, it's invalid
     manifest.manifest["layers"][0]["size"] = "1234"
@@ -579,6 +510,18 @@ def test_container_image_oci_manifest_instance_validation():
     assert valid == False
     assert isinstance(err, str)
     assert len(err) > 0
-    manifest.manifest["layers"][0]["size"] = copy.copy(
+    manifest.manifest["layers"][0]["size"] = \
         OCI_MANIFEST_EXAMPLE["layers"][0]["size"]
-    )
+
+@pytest.mark.parametrize("cls,example", [
+    (ContainerImageIndexEntryOCI, DOCKER_BUILDX_ATTESTATION_INDEX_ENTRY),
+    (ContainerImageIndexOCI, OCI_IMAGE_INDEX_EXAMPLE),
+    (ContainerImageManifestOCI, OCI_MANIFEST_EXAMPLE)
+])
+def test_container_image_oci_static_validation_read_only(cls, example):
+    # Ensure validating an example does not modify it, so that the examples
+    # can be validated directly without first being copied
+    before = json.dumps(example)
+    valid, err = cls.validate_static(example)
+    assert (valid, err) == (True, "")
+    assert json.dumps(example) == before
@@ -1,7 +1,8 @@
-import copy
 import json
-from jsonschema     import  ValidationError
-from image.platform import  ContainerImagePlatform
+import pytest
+from jsonschema         import  ValidationError
+from image.platform     import  ContainerImagePlatform
+from image.validators   import  IMAGE_INDEX_ENTRY_PLATFORM_VALIDATOR
 
 # Ref: https://github.com/opencontainers/image-spec/blob/v1.0.1/image-index.md
 OCI_PLATFORM_EXAMPLE = {
@@ -17,173 +18,136 @@ OCI_PLATFORM_EXAMPLE_EXTENDED = {
     ]
 }
 
+# The example serialized once, rather than on every comparison
+OCI_PLATFORM_EXAMPLE_JSON = json.dumps(OCI_PLATFORM_EXAMPLE)
+
+def make_platform(platform):
+    # Wraps an example already known to be valid without validating it again,
+    # for the tests of the getters rather than of validation
+    instance = ContainerImagePlatform.__new__(ContainerImagePlatform)
+    instance.platform = platform
+    return instance
+
+@pytest.fixture
+def oci_platform(make_payload):
+    return make_platform(make_payload(OCI_PLATFORM_EXAMPLE))
+
+@pytest.fixture
+def oci_platform_extended(make_payload):
+    return make_platform(make_payload(OCI_PLATFORM_EXAMPLE_EXTENDED))
+
 """
 ContainerImagePlatform tests
 
 Unit tests for the ContainerImagePlatform class
 """
-def test_container_image_oci_platform_static_validation():
-    # Empty dict should be invalid
-    empty_dict_valid, err = ContainerImagePlatform.validate_static(
-        {}
-    )
-    assert empty_dict_valid == False
-    assert isinstance(err, str)
-    assert len(err) > 0
-
+def test_container_image_oci_platform_static_validation(make_payload):
     # Valid OCI example should be valid
-    oci_example_mut = copy.deepcopy(OCI_PLATFORM_EXAMPLE)
     oci_example_valid, err = ContainerImagePlatform.validate_static(
-        copy.deepcopy(OCI_PLATFORM_EXAMPLE)
+        make_payload(OCI_PLATFORM_EXAMPLE)
     )
-    assert oci_example_valid == True
-    assert isinstance(err, str)
-    assert len(err) == 0
-
-    # No os should be invalid
-    oci_example_mut.pop("os")
-    no_os_valid, err = ContainerImagePlatform.validate_static(
-        oci_example_mut
-    )
-    assert no_os_valid == False
-    assert isinstance(err, str)
-    assert len(err) > 0
-
-    # Invalid os type should be invalid
-    oci_example_mut["os"] = 1234
-    inv_os_valid, err = ContainerImagePlatform.validate_static(
-        oci_example_mut
-    )
-    assert inv_os_valid == False
-    assert isinstance(err, str)
-    assert len(err) > 0
-    oci_example_mut["os"] = copy.copy(OCI_PLATFORM_EXAMPLE["os"])
-
-    # No architecture should be invalid
-    oci_example_mut.pop("architecture")
-    no_arch_valid, err = ContainerImagePlatform.validate_static(
-        oci_example_mut
-    )
-    assert no_arch_valid == False
-    assert isinstance(err, str)
-    assert len(err) > 0
-
-    # Invalid architecture type should be invalid
-    oci_example_mut["architecture"] = 1234
-    inv_arch_valid, err = ContainerImagePlatform.validate_static(
-        oci_example_mut
-    )
-    assert inv_arch_valid == False
-    assert isinstance(err, str)
-    assert len(err) > 0
-    oci_example_mut["architecture"] = copy.copy(
-        OCI_PLATFORM_EXAMPLE["architecture"]
-    )
-
-    # Invalid os.version type should be invalid
-    oci_example_mut["os.version"] = 1234
-    inv_ver_valid, err = ContainerImagePlatform.validate_static(
-        oci_example_mut
-    )
-    assert inv_ver_valid == False
-    assert isinstance(err, str)
-    assert len(err) > 0
-    oci_example_mut.pop("os.version")
-
-    # Invalid os.features type should be invalid
-    oci_example_mut["os.features"] = ""
-    inv_os_feat_valid, err = ContainerImagePlatform.validate_static(
-        oci_example_mut
-    )
-    assert inv_os_feat_valid == False
-    assert isinstance(err, str)
-    assert len(err) > 0
-    oci_example_mut.pop("os.features")
-
-    # Invalid features type should be invalid
-    oci_example_mut["features"] = ""
-    inv_feat_valid, err = ContainerImagePlatform.validate_static(
-        oci_example_mut
-    )
-    assert inv_feat_valid == False
-    assert isinstance(err, str)
-    assert len(err) > 0
-    oci_example_mut.pop("features")
-
-    # Invalid variant type should be invalid
-    oci_example_mut["variant"] = 1234
-    inv_var_valid, err = ContainerImagePlatform.validate_static(
-        oci_example_mut
-    )
-    assert inv_var_valid == False
-    assert isinstance(err, str)
-    assert len(err) > 0
+    assert (oci_example_valid, err) == (True, "")
 
     # Valid OCI extended example should be valid
     oci_ext_plt_valid, err = ContainerImagePlatform.validate_static(
-        copy.deepcopy(OCI_PLATFORM_EXAMPLE_EXTENDED)
-    )
-    assert oci_ext_plt_valid == True
+        make_payload(OCI_PLATFORM_EXAMPLE_EXTENDED)
+    )
+    assert (oci_ext_plt_valid, err) == (True, "")
+
+@pytest.mark.parametrize("platform", [
+    pytest.param({}, id="empty"),
+    pytest.param({ "architecture": "amd64" }, id="no os"),
+    pytest.param({ "architecture": "amd64", "os": 1234 }, id="invalid os"),
+    pytest.param({ "os": "linux" }, id="no architecture"),
+    pytest.param(
+        { "architecture": 1234, "os": "linux" },
+        id="invalid architecture"
+    ),
+    pytest.param(
+        { "architecture": "amd64", "os": "linux", "os.version": 1234 },
+        id="invalid os.version"
+    ),
+    pytest.param(
+        { "architecture": "amd64", "os": "linux", "os.features": "" },
+        id="invalid os.features"
+    ),
+    pytest.param(
+        { "architecture": "amd64", "os": "linux", "features": "" },
+        id="invalid features"
+    ),
+    pytest.param(
+        { "architecture": "amd64", "os": "linux", "variant": 1234 },
+        id="invalid variant"
+    )
+])
+def test_container_image_oci_platform_static_validation_invalid(platform):
+    # Each invalid platform should be invalid, with an error message
+    valid, err = ContainerImagePlatform.validate_static(platform)
+    assert valid == False
     assert isinstance(err, str)
-    assert len(err) == 0
+    assert len(err) > 0
 
-def test_container_image_oci_platform_instantiation():
+def test_container_image_oci_platform_static_validation_fast_path():
+    # The direct type check for common platforms should agree with the schema
+    platforms = [
+        { "architecture": "amd64", "os": "linux" },
+        { "architecture": "arm64", "os": "linux", "variant": "v8" },
+        { "architecture": "amd64", "os": "windows", "os.version": "10.0" },
+        { "architecture": "amd64", "os": 1234 },
+        { "architecture": "amd64", "os": "linux", "variant": None },
+        { "architecture": "amd64", "os": "linux", "extra": "value" },
+        { "architecture": "amd64" },
+        OCI_PLATFORM_EXAMPLE_EXTENDED
+    ]
+    for platform in platforms:
+        valid, err = ContainerImagePlatform.validate_static(platform)
+        assert valid == IMAGE_INDEX_ENTRY_PLATFORM_VALIDATOR.is_valid(
+            platform
+        )
+        assert (len(err) == 0) == valid
+
+def test_container_image_oci_platform_instantiation(make_payload):
     # Ensure exception is thrown on instantiation using invalid schema
-    exc = None
-    try:
-        platform = ContainerImagePlatform({})
-    except Exception as e:
-        exc = e
-    assert exc != None
-    assert isinstance(exc, ValidationError)
+    with pytest.raises(ValidationError):
+        ContainerImagePlatform({})
 
     # Ensure ContainerImagePlatform is returned on instantiation using valid schema
     platform = ContainerImagePlatform(
-        copy.deepcopy(OCI_PLATFORM_EXAMPLE)
+        make_payload(OCI_PLATFORM_EXAMPLE)
     )
     assert isinstance(platform, ContainerImagePlatform)
 
-def test_container_image_oci_platform_get_architecture():
+    # Ensure the given platform dict is wrapped without being modified
+    payload = make_payload(OCI_PLATFORM_EXAMPLE)
+    platform = ContainerImagePlatform(payload)
+    assert platform.platform is payload
+    assert payload == OCI_PLATFORM_EXAMPLE
+
+def test_container_image_oci_platform_get_architecture(oci_platform):
     # Ensure arch matches expected arch
-    platform = ContainerImagePlatform(
-        copy.deepcopy(OCI_PLATFORM_EXAMPLE)
-    )
+    platform = oci_platform
     arch = platform.get_architecture()
     assert arch == OCI_PLATFORM_EXAMPLE["architecture"]
 
     # Ensure if we remove the os, a TypeError is thrown
     platform.platform.pop("architecture")
-    exc = None
-    try:
-        arch = platform.get_architecture()
-    except Exception as e:
-        exc = e
-    assert exc != None
-    assert isinstance(exc, TypeError)
+    with pytest.raises(TypeError):
+        platform.get_architecture()
 
-def test_container_image_oci_platform_get_os():
+def test_container_image_oci_platform_get_os(oci_platform):
     # Ensure os matches expected os
-    platform = ContainerImagePlatform(
-        copy.deepcopy(OCI_PLATFORM_EXAMPLE)
-    )
+    platform = oci_platform
     os = platform.get_os()
     assert os == OCI_PLATFORM_EXAMPLE["os"]
 
     # Ensure if we remove the os, a TypeError is thrown
     platform.platform.pop("os")
-    exc = None
-    try:
-        os = platform.get_os()
-    except Exception as e:
-        exc = e
-    assert exc != None
-    assert isinstance(exc, TypeError)
+    with pytest.raises(TypeError):
+        platform.get_os()
 
-def test_container_image_oci_platform_get_os_version():
+def test_container_image_oci_platform_get_os_version(oci_platform_extended):
     # Ensure os matches expected version
-    platform = ContainerImagePlatform(
-        copy.deepcopy(OCI_PLATFORM_EXAMPLE_EXTENDED)
-    )
+    platform = oci_platform_extended
     os_ver = platform.get_os_version()
     assert os_ver == OCI_PLATFORM_EXAMPLE_EXTENDED["os.version"]
 
@@ -192,11 +156,9 @@ def test_container_image_oci_platform_get_os_version():
     os_ver = platform.get_os_version()
     assert os_ver == None
 
-def test_container_image_oci_platform_get_os_features():
+def test_container_image_oci_platform_get_os_features(oci_platform_extended):
     # Ensure os features expected os features
-    platform = ContainerImagePlatform(
-        copy.deepcopy(OCI_PLATFORM_EXAMPLE_EXTENDED)
-    )
+    platform = oci_platform_extended
     os_feat = platform.get_os_features()
     assert os_feat == OCI_PLATFORM_EXAMPLE_EXTENDED["os.features"]
 
@@ -205,11 +167,9 @@ def test_container_image_oci_platform_get_os_features():
     os_feat = platform.get_os_features()
     assert os_feat == None
 
-def test_container_image_oci_platform_get_variant():
+def test_container_image_oci_platform_get_variant(oci_platform_extended):
     # Ensure variant, if not set, is None
-    platform = ContainerImagePlatform(
-        copy.deepcopy(OCI_PLATFORM_EXAMPLE_EXTENDED)
-    )
+    platform = oci_platform_extended
     variant = platform.get_variant()
     assert variant == None
 
@@ -218,11 +178,9 @@ def test_container_image_oci_platform_get_variant():
     variant = platform.get_variant()
     assert variant == "v8"
 
-def test_container_image_oci_platform_get_features():
+def test_container_image_oci_platform_get_features(oci_platform):
     # Ensure features, when not set, is None
-    platform = ContainerImagePlatform(
-        copy.deepcopy(OCI_PLATFORM_EXAMPLE)
-    )
+    platform = oci_platform
     features = platform.get_features()
     assert features == None
 
@@ -231,11 +189,9 @@ def test_container_image_oci_platform_get_features():
     features = platform.get_features()
     assert features == ["sse4"]
 
-def test_container_image_oci_platform_to_string():
+def test_container_image_oci_platform_to_string(oci_platform):
     # Ensure platform to string matches expected value when variant is not set
-    platform = ContainerImagePlatform(
-        copy.deepcopy(OCI_PLATFORM_EXAMPLE)
-    )
+    platform = oci_platform
     assert str(platform) == f"{OCI_PLATFORM_EXAMPLE['os']}/" + \
         f"{OCI_PLATFORM_EXAMPLE['architecture']}"
 
@@ -244,14 +200,7 @@ def test_container_image_oci_platform_to_string():
     assert str(platform) == f"{OCI_PLATFORM_EXAMPLE['os']}/" + \
         f"{OCI_PLATFORM_EXAMPLE['architecture']}/v7"
 
-def test_container_image_oci_platform_to_json():
+def test_container_image_oci_platform_to_json(oci_platform):
     # Ensure JSON conversions match expected JSON conversions
-    platform = ContainerImagePlatform(
-        copy.deepcopy(OCI_PLATFORM_EXAMPLE)
-    )
-    assert json.dumps(platform) == json.dumps(OCI_PLATFORM_EXAMPLE)
-
-    platform = ContainerImagePlatform(
-        copy.deepcopy(OCI_PLATFORM_EXAMPLE)
-    )
-    assert json.dumps(platform) == json.dumps(OCI_PLATFORM_EXAMPLE)
+    platform = oci_platform
+    assert json.dumps(platform) == OCI_PLATFORM_EXAMPLE_JSON
@@ -1,8 +1,10 @@
-import copy
+import pytest
 from image.containerimage       import  ContainerImageRegistryClient
+from image.errors               import  ContainerImageError
 from tests.registryclientmock   import  REDHAT_AMD64_MANIFEST, \
                                         REDHAT_MANIFEST_LIST_EXAMPLE, \
-                                        MOCK_REGISTRY_CREDS
+                                        MOCK_REGISTRY_CREDS, \
+                                        MockResponse
 
 MOCK_IMAGE_REF = "quay.io/ibm/software/cloudpak/hello-world:latest"
 MOCK_BASE_URL = "https://quay.io/v2/ibm/software/cloudpak/hello-world"
@@ -55,25 +57,33 @@ Unit tests for the ContainerImageRegistryClient class
 def test_container_image_registry_client_get_registry_base_url():
     # Ensure the example from the type hint comment works as intended
     base_url = ContainerImageRegistryClient.get_registry_base_url(
-        copy.copy(MOCK_IMAGE_REF)
+        MOCK_IMAGE_REF
     )
     assert base_url == MOCK_BASE_URL
 
+    # Ensure a ref with no slash keeps its name
+    base_url = ContainerImageRegistryClient.get_registry_base_url("ubuntu")
+    assert base_url == "https://ubuntu/v2//ubuntu"
+    base_url = ContainerImageRegistryClient.get_registry_base_url(
+        "ubuntu:22.04"
+    )
+    assert base_url == "https://ubuntu:22.04/v2//ubuntu"
+
+    # Ensure a ref with a single path component has an empty path
+    base_url = ContainerImageRegistryClient.get_registry_base_url(
+        "docker.io/ubuntu:22.04"
+    )
+    assert base_url == "https://registry-1.docker.io/v2//ubuntu"
+
     # Ensure an invalid ref throws an error
-    exc = None
-    try:
-        base_url = ContainerImageRegistryClient.get_registry_base_url(
-            "not an image"
-        )
-    except Exception as e:
-        exc = e
-    assert exc != None
+    with pytest.raises(ContainerImageError):
+        ContainerImageRegistryClient.get_registry_base_url("not an image")
 
 def test_container_image_registry_client_get_registry_auth():
     # Ensure the longest matching registry prefix is chosen
     auth, found = ContainerImageRegistryClient.get_registry_auth(
-        copy.copy(MOCK_IMAGE_REF),
-        copy.deepcopy(MOCK_REGISTRY_AUTH)
+        MOCK_IMAGE_REF,
+        MOCK_REGISTRY_AUTH
     )
     expected_auth = MOCK_REGISTRY_AUTH["auths"]\
         ["quay.io/ibm/software/cloudpak"]\
@@ -84,14 +94,14 @@ def test_container_image_registry_client_get_registry_auth():
     # Ensure a nonexistent auth is not found
     auth, found = ContainerImageRegistryClient.get_registry_auth(
         "non.existent/registry/i-dont-exist:nonexistent",
-        copy.deepcopy(MOCK_REGISTRY_AUTH)
+        MOCK_REGISTRY_AUTH
     )
     assert found == False
 
     # Ensure the expected auth is chosen for a different included image ref
     auth, found = ContainerImageRegistryClient.get_registry_auth(
         "not.my/registry/nor-my-image:not-my-tag-either",
-        copy.deepcopy(MOCK_REGISTRY_AUTH)
+        MOCK_REGISTRY_AUTH
     )
     expected_auth = MOCK_REGISTRY_AUTH["auths"]\
         ["not.my/registry"]\
@@ -99,12 +109,28 @@ def test_container_image_registry_client_get_registry_auth():
     assert found == True
     assert auth == expected_auth
 
-def test_container_image_registry_client_get_manifest(mocker):
+    # Ensure the longest matching prefix is chosen regardless of the order in
+    # which the registries are listed
+    for reverse in (False, True):
+        sorted_auth = {
+            "auths": dict(sorted(
+                MOCK_REGISTRY_AUTH["auths"].items(),
+                key=lambda item: len(item[0]),
+                reverse=reverse
+            ))
+        }
+        auth, found = ContainerImageRegistryClient.get_registry_auth(
+            MOCK_IMAGE_REF,
+            sorted_auth
+        )
+        assert found == True
+        assert auth == MOCK_REGISTRY_AUTH["auths"]\
+            ["quay.io/ibm/software/cloudpak"]\
+            ["auth"]
+
+def test_container_image_registry_client_get_manifest(mock_get):
     # Ensure a dict is returned when valid manifest is given
-    mock_response = mocker.MagicMock()
-    mock_response.json.return_value = copy.deepcopy(REDHAT_AMD64_MANIFEST)
-    mock_response.raise_for_status.return_value = None
-    mocker.patch("requests.get", return_value=mock_response)
+    mock_get(REDHAT_AMD64_MANIFEST)
     manifest = ContainerImageRegistryClient.get_manifest(
         "registry.access.redhat.com/ubi9/ubi-minimal@" + \
             REDHAT_MANIFEST_LIST_EXAMPLE["manifests"][0]["digest"],
@@ -112,18 +138,24 @@ def test_container_image_registry_client_get_manifest(mocker):
     )
     assert isinstance(manifest, dict)
 
+def test_container_image_registry_client_get_media_type(mocker):
+    # Ensure the mediaType is parsed from the Content-Type header
+    mock_response = MockResponse(headers={
+        "Content-Type": REDHAT_AMD64_MANIFEST["mediaType"] + "; charset=utf-8"
+    })
+    mocker.patch("requests.head", return_value=mock_response)
+    media_type = ContainerImageRegistryClient.get_media_type(
+        "registry.access.redhat.com/ubi9/ubi-minimal@" + \
+            REDHAT_MANIFEST_LIST_EXAMPLE["manifests"][0]["digest"],
+        MOCK_REGISTRY_CREDS
+    )
+    assert media_type == REDHAT_AMD64_MANIFEST["mediaType"]
+
 def test_container_image_registry_client_delete(mocker):
     # Ensure no exceptions are raised when image is successfully deleted
-    mock_response = mocker.MagicMock()
-    mock_response.raise_for_status.return_value = None
-    mocker.patch("requests.delete", return_value=mock_response)
-    exc = None
-    try:
-        manifest = ContainerImageRegistryClient.delete(
-            "registry.access.redhat.com/ubi9/ubi-minimal@" + \
-                REDHAT_MANIFEST_LIST_EXAMPLE["manifests"][0]["digest"],
-            MOCK_REGISTRY_CREDS
-        )
-    except Exception as e:
-        exc = e
-    assert exc == None
+    mocker.patch("requests.delete", return_value=MockResponse())
+    ContainerImageRegistryClient.delete(
+        "registry.access.redhat.com/ubi9/ubi-minimal@" + \
+            REDHAT_MANIFEST_LIST_EXAMPLE["manifests"][0]["digest"],
+        MOCK_REGISTRY_CREDS
+    )
@@ -17,9 +17,10 @@ def _load_mock_manifest(path: str) -> Dict[str, Any]:
     """
     Helper function for loading mock manifests
     """
+    # Read the raw bytes and parse them directly, bypassing the text layer
     mock_manifest_dict = {}
-    with open(path) as mock_manifest_file:
-        mock_manifest_dict = json.load(mock_manifest_file)
+    with open(path, "rb") as mock_manifest_file:
+        mock_manifest_dict = json.loads(mock_manifest_file.read())
     return mock_manifest_dict
 
 # An example manifest list from RedHat UBI 9
@@ -70,6 +71,46 @@ ATTESTATION_S390X_ATTESTATION_MANIFEST = _load_mock_manifest(
     f"{WORKDIR}/mock/manifests/attestation-s390x-attestation-manifest.json"
 )
 
+class MockResponse:
+    """
+    A minimal stand-in for a requests.Response from the distribution registry
+    API, much cheaper to build than a MagicMock
+    """
+    __slots__ = ("headers", "status_code", "_json")
+
+    def __init__(
+            self,
+            json: Any = None,
+            headers: Union[Dict[str, str], None] = None,
+            status_code: int = 200
+        ):
+        """
+        Constructor for the MockResponse class
+
+        Args:
+        json (Any): The response body returned by json
+        headers (Union[Dict[str, str], None]): The response headers
+        status_code (int): The response status code
+        """
+        self._json = json
+        self.headers = headers if headers is not None else {}
+        self.status_code = status_code
+
+    def json(self) -> Any:
+        """
+        Returns the response body loaded from JSON
+
+        Returns:
+        Any: The response body
+        """
+        return self._json
+
+    def raise_for_status(self):
+        """
+        Mocks a successful response, which raises no HTTPError
+        """
+        return None
+
 # Mock an image name
 MOCK_IMAGE_NAME = "this.is/my/registry/and-my-image"
 
@@ -85,6 +126,40 @@ MOCK_REGISTRY_CREDS = {
     }
 }
 
+# The mock manifests keyed by their references, for mock_get_manifest
+MOCK_MANIFESTS = {
+    f"{MOCK_IMAGE_NAME}@sha256:" + \
+        "f5d2c6a1e0c86e4234ea601552dbabb4ced0e013a1efcbfb439f1f6a7a9275b0": \
+        REDHAT_AMD64_MANIFEST,
+    f"{MOCK_IMAGE_NAME}@sha256:" + \
+        "96f4394d39e6edb69ca51f000f3e7dfb62990f55868134cfd83c82177651e848": \
+        REDHAT_ARM64_MANIFEST,
+    f"{MOCK_IMAGE_NAME}@sha256:" + \
+        "39c59a30e3ecae689c23b27e54a81e03d9a5db22d11890edaf6bb16bac783e8b": \
+        REDHAT_PPC64LE_MANIFEST,
+    f"{MOCK_IMAGE_NAME}@sha256:" + \
+        "d187f310724694b1daae2f99f6f86ae05b573eed6826fa40d4233e76bd07312e": \
+        REDHAT_S390X_MANIFEST,
+    f"{MOCK_IMAGE_NAME}@sha256:" + \
+        "058913b247adb61e488c14ee8ab0f5c8022fd08dc945a9d900a02f32effde5c2": \
+        REDHAT_AMD64_MANIFEST_DUP,
+    f"{MOCK_IMAGE_NAME}:latest": REDHAT_MANIFEST_LIST_EXAMPLE,
+    f"{MOCK_IMAGE_NAME}:latest-dup": REDHAT_MANIFEST_LIST_EXAMPLE_DUP,
+    f"{MOCK_IMAGE_NAME}:latest-attestation": ATTESTATION_MANIFEST_LIST_EXAMPLE,
+    f"{MOCK_IMAGE_NAME}@sha256:" + \
+        "aa0304d8024783de8537f7e776f33deb57820b853849355b9cbc2a618511521d": \
+        ATTESTATION_AMD64_MANIFEST,
+    f"{MOCK_IMAGE_NAME}@sha256:" + \
+        "d06586cc1e3a1f21052c2747237c2394917c8ab7d2e10c284ab975196eff0084": \
+        ATTESTATION_S390X_MANIFEST,
+    f"{MOCK_IMAGE_NAME}@sha256:" + \
+        "171dcd736979ede2a044022fab58b6fa558e5ea9b1486d655d213c688af2c592": \
+        ATTESTATION_AMD64_ATTESTATION_MANIFEST,
+    f"{MOCK_IMAGE_NAME}@sha256:" + \
+        "61d78e5bc2772b75b97fc80f1e796594da4c5421957872be9302b39b1cf155b8": \
+        ATTESTATION_S390X_ATTESTATION_MANIFEST
+}
+
 # Mock the ContainerImageRegistryClient.get_manifest function
 def mock_get_manifest(ref_or_img: Union[str, ContainerImage], auth: Dict[str, Any]) -> Type[
         ContainerImageManifestV2S2
@@ -99,41 +174,24 @@ def mock_get_manifest(ref_or_img: Union[str, ContainerImage], auth: Dict[str, An
     Returns:
     Type[ContainerImageManifest]: The manifest
     """
-    if str(ref_or_img) == f"{MOCK_IMAGE_NAME}@" + \
-        "sha256:f5d2c6a1e0c86e4234ea601552dbabb4ced0e013a1efcbfb439f1f6a7a9275b0":
-        return REDHAT_AMD64_MANIFEST
-    elif str(ref_or_img) == f"{MOCK_IMAGE_NAME}@" + \
-        "sha256:96f4394d39e6edb69ca51f000f3e7dfb62990f55868134cfd83c82177651e848":
-        return REDHAT_ARM64_MANIFEST
-    elif str(ref_or_img) == f"{MOCK_IMAGE_NAME}@" + \
-        "sha256:39c59a30e3ecae689c23b27e54a81e03d9a5db22d11890edaf6bb16bac783e8b":
-        return REDHAT_PPC64LE_MANIFEST
-    elif str(ref_or_img) == f"{MOCK_IMAGE_NAME}@" + \
-        "sha256:d187f310724694b1daae2f99f6f86ae05b573eed6826fa40d4233e76bd07312e":
-        return REDHAT_S390X_MANIFEST
-    elif str(ref_or_img) == f"{MOCK_IMAGE_NAME}@" + \
-        "sha256:058913b247adb61e488c14ee8ab0f5c8022fd08dc945a9d900a02f32effde5c2":
-        return REDHAT_AMD64_MANIFEST_DUP
-    elif str(ref_or_img) == f"{MOCK_IMAGE_NAME}:latest":
-        return REDHAT_MANIFEST_LIST_EXAMPLE
-    elif str(ref_or_img) == f"{MOCK_IMAGE_NAME}:latest-dup":
-        return REDHAT_MANIFEST_LIST_EXAMPLE_DUP
-    elif str(ref_or_img) == f"{MOCK_IMAGE_NAME}:latest-attestation":
-        return ATTESTATION_MANIFEST_LIST_EXAMPLE
-    elif str(ref_or_img) == f"{MOCK_IMAGE_NAME}@" + \
-        "sha256:aa0304d8024783de8537f7e776f33deb57820b853849355b9cbc2a618511521d":
-        return ATTESTATION_AMD64_MANIFEST
-    elif str(ref_or_img) == f"{MOCK_IMAGE_NAME}@" + \
-        "sha256:d06586cc1e3a1f21052c2747237c2394917c8ab7d2e10c284ab975196eff0084":
-        return ATTESTATION_S390X_MANIFEST
-    elif str(ref_or_img) == f"{MOCK_IMAGE_NAME}@" + \
-        "sha256:171dcd736979ede2a044022fab58b6fa558e5ea9b1486d655d213c688af2c592":
-        return ATTESTATION_AMD64_ATTESTATION_MANIFEST
-    elif str(ref_or_img) == f"{MOCK_IMAGE_NAME}@" + \
-        "sha256:61d78e5bc2772b75b97fc80f1e796594da4c5421957872be9302b39b1cf155b8":
-        return ATTESTATION_S390X_ATTESTATION_MANIFEST
-    else:
+    manifest = MOCK_MANIFESTS.get(str(ref_or_img))
+    if manifest is None:
         raise Exception(f"Unmocked reference: {ref_or_img}")
+    return manifest
+
+# Mock the ContainerImageRegistryClient.get_media_type function
+def mock_get_media_type(ref_or_img: Union[str, ContainerImage], auth: Dict[str, Any]) -> str:
+    """
+    Mocks the ContainerImageRegistryClient.get_media_type function
+
+    Args:
+    ref (Union[str, ContainerImage]): The image reference
+    auth (Dict[str, Any]): The auth for the reference
+
+    Returns:
+    str: The manifest mediaType
+    """
+    return mock_get_manifest(ref_or_img, auth)["mediaType"]
 
 def mock_get_digest(ref_or_img: Union[str, ContainerImage], auth: Dict[str, Any]) -> str:
     """
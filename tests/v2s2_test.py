@@ -1,5 +1,5 @@
-import copy
-import json
+import pytest
+from contextlib                 import  contextmanager
 from jsonschema                 import  ValidationError
 from image.containerimage       import  ContainerImageManifestListV2S2
 from image.manifest             import  ContainerImageManifest
@@ -13,8 +13,7 @@ from tests.registryclientmock   import  REDHAT_MANIFEST_LIST_EXAMPLE, \
                                         REDHAT_S390X_MANIFEST, \
                                         ATTESTATION_MANIFEST_LIST_EXAMPLE, \
                                         MOCK_IMAGE_NAME, \
-                                        MOCK_REGISTRY_CREDS, \
-                                        mock_get_manifest
+                                        MOCK_REGISTRY_CREDS
 
 # An example manifest from the CNCF manifest v2s2 spec
 CNCF_MANIFEST_EXAMPLE = {
@@ -164,12 +163,53 @@ REDHAT_MANIFEST_LIST_ENTRY_EXAMPLE = {
     "size": 429
 }
 
+# See doc comments below
+REMOVED = object()
+"""
+Marks a field which an invalid fixture case removes from the example.
+"""
+
+# See doc comments below
+MANIFEST_LIST_ENTRY_CASES = [
+    { "mediaType": REMOVED },
+    { "digest": REMOVED },
+    { "digest": 1234 },
+    { "digest": "notadigest" },
+    { "size": REMOVED },
+    { "size": "abcd" },
+    { "platform": REMOVED },
+    { "platform": 1234 }
+]
+"""
+Changes applied to the example manifest list entry, each of which should make
+the changed entry invalid.
+"""
+
+def apply_changes(payload, changes):
+    # Sets each changed field of the payload, removing those marked REMOVED
+    for key, value in changes.items():
+        if value is REMOVED:
+            payload.pop(key)
+        else:
+            payload[key] = value
+
+@contextmanager
+def swapped(payload, key, value):
+    # Temporarily changes a field of the payload, removing it if marked
+    # REMOVED, and restores the original value on exit
+    original = payload[key]
+    apply_changes(payload, { key: value })
+    try:
+        yield
+    finally:
+        payload[key] = original
+
 """
 ContainerImageManifestV2S2 tests
 
 Unit tests for the ContainerImageManifestV2S2 class
 """
-def test_container_image_v2s2_manifest_static_validation():
+def test_container_image_v2s2_manifest_static_validation(make_payload):
     # Empty dict should be invalid
     empty_dict_valid, err = ContainerImageManifestV2S2.validate_static({})
     assert empty_dict_valid == False
@@ -178,140 +218,93 @@ def test_container_image_v2s2_manifest_static_validation():
 
     # Valid CNCF example should be valid
     cncf_example_valid, err = ContainerImageManifestV2S2.validate_static(
-        copy.deepcopy(CNCF_MANIFEST_EXAMPLE)
+        make_payload(CNCF_MANIFEST_EXAMPLE)
     )
-    assert cncf_example_valid == True
-    assert isinstance(err, str)
-    assert len(err) == 0
-
-    # No schemaVersion should be invalid
-    cncf_example_mut = copy.deepcopy(CNCF_MANIFEST_EXAMPLE)
-    cncf_example_mut.pop("schemaVersion")
-    no_sv_valid, err = ContainerImageManifestV2S2.validate_static(
-        cncf_example_mut
-    )
-    assert no_sv_valid == False
-    assert isinstance(err, str)
-    assert len(err) > 0
-
-    # No mediaType should be invalid
-    cncf_example_mut = copy.deepcopy(CNCF_MANIFEST_EXAMPLE)
-    cncf_example_mut.pop("mediaType")
-    no_mt_valid, err = ContainerImageManifestV2S2.validate_static(
-        cncf_example_mut
-    )
-    assert no_mt_valid == False
-    assert isinstance(err, str)
-    assert len(err) > 0
+    assert (cncf_example_valid, err) == (True, "")
 
     # Valid RedHat example should be valid
     rh_example_valid, err = ContainerImageManifestV2S2.validate_static(
-        copy.deepcopy(REDHAT_MANIFEST_EXAMPLE)
+        make_payload(REDHAT_MANIFEST_EXAMPLE)
     )
-    assert rh_example_valid == True
-    assert isinstance(err, str)
-    assert len(err) == 0
+    assert (rh_example_valid, err) == (True, "")
 
     # OCI example should be invalid
     oci_example_valid, err = ContainerImageManifestV2S2.validate_static(
-        copy.deepcopy(OCI_MANIFEST_EXAMPLE)
+        make_payload(OCI_MANIFEST_EXAMPLE)
     )
     assert oci_example_valid == False
     assert isinstance(err, str)
     assert len(err) > 0
 
-def test_container_image_v2s2_manifest_instantiation():
+@pytest.mark.parametrize("missing_key", [ "schemaVersion", "mediaType" ])
+def test_container_image_v2s2_manifest_static_validation_missing_key(
+        missing_key
+    ):
+    # A manifest missing a required key should be invalid.  Only the top
+    # level is copied, as the nested values are not modified.
+    manifest = {
+        key: value for key, value in CNCF_MANIFEST_EXAMPLE.items()
+        if key != missing_key
+    }
+    valid, err = ContainerImageManifestV2S2.validate_static(manifest)
+    assert valid == False
+    assert isinstance(err, str)
+    assert len(err) > 0
+
+def test_container_image_v2s2_manifest_instantiation(make_payload):
     # Ensure exception is thrown on instantiation using invalid schema
-    exc = None
-    try:
-        manifest = ContainerImageManifestV2S2({})
-    except Exception as e:
-        exc = e
-    assert exc != None
-    assert isinstance(exc, ValidationError)
+    with pytest.raises(ValidationError):
+        ContainerImageManifestV2S2({})
 
     # Ensure ContainerImageManifestV2S2 is returned when using valid schema
     manifest = ContainerImageManifestV2S2(
-        copy.deepcopy(CNCF_MANIFEST_EXAMPLE)
+        make_payload(CNCF_MANIFEST_EXAMPLE)
     )
     assert isinstance(manifest, ContainerImageManifestV2S2)
 
     # Ensure generic ContainerImageManifest can be converted into a
     # ContainerImageManifestV2S2
     generic_manifest = ContainerImageManifest(
-        copy.deepcopy(CNCF_MANIFEST_EXAMPLE)
+        make_payload(CNCF_MANIFEST_EXAMPLE)
     )
     manifest = ContainerImageManifestV2S2.from_manifest(
         generic_manifest
     )
     assert isinstance(manifest, ContainerImageManifestV2S2)
 
-def test_container_image_v2s2_manifest_instance_validation():
+def test_container_image_v2s2_manifest_instance_validation(make_payload):
     # Ensure ContainerImageManifestV2S2 instantiates and is valid post-instantiation
     manifest = ContainerImageManifestV2S2(
-        copy.deepcopy(CNCF_MANIFEST_EXAMPLE)
-    )
-    valid, err = manifest.validate()
-    assert valid == True
-    assert isinstance(err, str)
-    assert len(err) == 0
-
-    # Ensure if we invalidate a property of the manifest, it's invalid
-    manifest.manifest["mediaType"] = 1234
-    valid, err = manifest.validate()
-    assert valid == False
-    assert isinstance(err, str)
-    assert len(err) > 0
-    manifest.manifest["mediaType"] = copy.copy(
-        CNCF_MANIFEST_EXAMPLE["mediaType"]
-    )
-
-    # Ensure if we invalidate a property of the manifest config, it's invalid
-    manifest.manifest["config"]["digest"] = "notadigest"
-    valid, err = manifest.validate()
-    assert valid == False
-    assert isinstance(err, str)
-    assert len(err) > 0
-    manifest.manifest["config"]["digest"] = copy.copy(
-        CNCF_MANIFEST_EXAMPLE["config"]["digest"]
-    )
-
-    # Ensure if we invalidate a property of the manifest config, it's invalid
-    manifest.manifest["config"]["size"] = "1234"
-    valid, err = manifest.validate()
-    assert valid == False
-    assert isinstance(err, str)
-    assert len(err) > 0
-    manifest.manifest["config"]["digest"] = copy.copy(
-        CNCF_MANIFEST_EXAMPLE["config"]["size"]
+        make_payload(CNCF_MANIFEST_EXAMPLE)
     )
-
-    # Ensure if we invalidate a property of a manifest layer, it's invalid
-    manifest.manifest["layers"][0]["digest"] = "notadigest"
     valid, err = manifest.validate()
-    assert valid == False
-    assert isinstance(err, str)
-    assert len(err) > 0
-    manifest.manifest["layers"][0]["digest"] = copy.copy(
-        CNCF_MANIFEST_EXAMPLE["layers"][0]["digest"]
-    )
-
-    # Ensure if we invalidate a property of a manifest layer, it's invalid
-    manifest.manifest["layers"][0]["size"] = "1234"
+    assert (valid, err) == (True, "")
+
+    # Ensure if we invalidate a property of the manifest, its config, or one
+    # of its layers, it's invalid, and valid again once restored
+    cases = [
+        (manifest.manifest, "mediaType", 1234),
+        (manifest.manifest, "schemaVersion", REMOVED),
+        (manifest.manifest["config"], "digest", "notadigest"),
+        (manifest.manifest["config"], "size", "1234"),
+        (manifest.manifest["layers"][0], "digest", "notadigest"),
+        (manifest.manifest["layers"][0], "size", "1234")
+    ]
+    for payload, key, value in cases:
+        with swapped(payload, key, value):
+            valid, err = manifest.validate()
+            assert valid == False
+            assert isinstance(err, str)
+            assert len(err) > 0
     valid, err = manifest.validate()
-    assert valid == False
-    assert isinstance(err, str)
-    assert len(err) > 0
-    manifest.manifest["layers"][0]["size"] = copy.copy(
-        CNCF_MANIFEST_EXAMPLE["layers"][0]["size"]
-    )
+    assert (valid, err) == (True, "")
 
 """
 ContainerImageManifestListV2S2 tests
 
 Unit tests for the ContainerImageManifestListV2S2 class
 """
-def test_container_image_v2s2_manifest_list_static_validation():
+def test_container_image_v2s2_manifest_list_static_validation(make_payload):
     # Empty dict should be invalid
     empty_dict_valid, err = ContainerImageManifestListV2S2.validate_static({})
     assert empty_dict_valid == False
@@ -320,130 +313,92 @@ def test_container_image_v2s2_manifest_list_static_validation():
 
     # Valid CNCF example should be valid
     cncf_example_valid, err = ContainerImageManifestListV2S2.validate_static(
-        copy.deepcopy(CNCF_MANIFEST_LIST_EXAMPLE)
+        make_payload(CNCF_MANIFEST_LIST_EXAMPLE)
     )
-    assert cncf_example_valid == True
-    assert isinstance(err, str)
-    assert len(err) == 0
+    assert (cncf_example_valid, err) == (True, "")
 
-    # No schemaVersion should be invalid
-    cncf_example_mut = copy.deepcopy(CNCF_MANIFEST_LIST_EXAMPLE)
-    cncf_example_mut.pop("schemaVersion")
-    no_sv_valid, err = ContainerImageManifestListV2S2.validate_static(
-        cncf_example_mut
-    )
-    assert no_sv_valid == False
-    assert isinstance(err, str)
-    assert len(err) > 0
-
-    # No mediaType should be invalid
-    cncf_example_mut = copy.deepcopy(CNCF_MANIFEST_LIST_EXAMPLE)
-    cncf_example_mut.pop("mediaType")
-    no_mt_valid, err = ContainerImageManifestListV2S2.validate_static(
-        cncf_example_mut
-    )
-    assert no_mt_valid == False
-    assert isinstance(err, str)
-    assert len(err) > 0
-
-    # No manifests should be invalid
-    cncf_example_mut = copy.deepcopy(CNCF_MANIFEST_LIST_EXAMPLE)
-    cncf_example_mut.pop("manifests")
-    no_mf_valid, err = ContainerImageManifestListV2S2.validate_static(
-        cncf_example_mut
-    )
-    assert no_mf_valid == False
-    assert isinstance(err, str)
-    assert len(err) > 0
-
-    # Manifest missing digest should be invalid
-    cncf_example_mut = copy.deepcopy(CNCF_MANIFEST_LIST_EXAMPLE)
-    cncf_example_mut["manifests"][0].pop("digest")
-    no_dig_valid, err = ContainerImageManifestListV2S2.validate_static(
-        cncf_example_mut
+    # Ensure OCI manifest list is invalid
+    oci_valid, err = ContainerImageManifestListV2S2.validate_static(
+        ATTESTATION_MANIFEST_LIST_EXAMPLE
     )
-    assert no_dig_valid == False
+    assert oci_valid == False
     assert isinstance(err, str)
     assert len(err) > 0
 
-    # Manifest with invalid digest should be invalid
-    cncf_example_mut = copy.deepcopy(CNCF_MANIFEST_LIST_EXAMPLE)
-    cncf_example_mut["manifests"][0]["digest"] = "notadigest"
-    no_dig_valid, err = ContainerImageManifestListV2S2.validate_static(
-        cncf_example_mut
-    )
-    assert no_dig_valid == False
+@pytest.mark.parametrize("missing_key", [
+    "schemaVersion",
+    "mediaType",
+    "manifests"
+])
+def test_container_image_v2s2_manifest_list_static_validation_missing_key(
+        missing_key
+    ):
+    # A manifest list missing a required key should be invalid.  Only the top
+    # level is copied, as the nested values are not modified.
+    manifest_list = {
+        key: value for key, value in CNCF_MANIFEST_LIST_EXAMPLE.items()
+        if key != missing_key
+    }
+    valid, err = ContainerImageManifestListV2S2.validate_static(manifest_list)
+    assert valid == False
     assert isinstance(err, str)
     assert len(err) > 0
 
-    # Ensure OCI manifest list is invalid
-    oci_valid, err = ContainerImageManifestListV2S2.validate_static(
-        ATTESTATION_MANIFEST_LIST_EXAMPLE
-    )
-    assert oci_valid == False
+@pytest.mark.parametrize("changes", [
+    { "digest": REMOVED },
+    { "digest": "notadigest" }
+])
+def test_container_image_v2s2_manifest_list_static_validation_entry_changes(
+        make_payload,
+        changes
+    ):
+    # A manifest list with an invalid entry should be invalid
+    manifest_list = make_payload(CNCF_MANIFEST_LIST_EXAMPLE)
+    apply_changes(manifest_list["manifests"][0], changes)
+    valid, err = ContainerImageManifestListV2S2.validate_static(manifest_list)
+    assert valid == False
     assert isinstance(err, str)
     assert len(err) > 0
 
-def test_container_image_v2s2_manifest_list_instantiation():
+def test_container_image_v2s2_manifest_list_instantiation(make_payload):
     # Ensure exception is thrown on instantiation using invalid schema
-    exc = None
-    try:
-        manifest_list = ContainerImageManifestListV2S2({})
-    except Exception as e:
-        exc = e
-    assert exc != None
-    assert isinstance(exc, ValidationError)
+    with pytest.raises(ValidationError):
+        ContainerImageManifestListV2S2({})
 
     # Ensure ContainerImageManifestListV2S2 is returned when using valid schema
     manifest_list = ContainerImageManifestListV2S2(
-        copy.deepcopy(CNCF_MANIFEST_LIST_EXAMPLE)
+        make_payload(CNCF_MANIFEST_LIST_EXAMPLE)
     )
     assert isinstance(manifest_list, ContainerImageManifestListV2S2)
 
-def test_container_image_v2s2_manifest_list_instance_validation():
+def test_container_image_v2s2_manifest_list_instance_validation(make_payload):
     # Ensure ContainerImageManifestListV2S2 instantiates and is valid post-instantiation
     manifest_list = ContainerImageManifestListV2S2(
-        copy.deepcopy(CNCF_MANIFEST_LIST_EXAMPLE)
+        make_payload(CNCF_MANIFEST_LIST_EXAMPLE)
     )
     valid, err = manifest_list.validate()
-    assert valid == True
-    assert isinstance(err, str)
-    assert len(err) == 0
-
-    # Ensure if we invalidate a property of the manifest, it's invalid
-    manifest_list.manifest_list["mediaType"] = 1234
-    valid, err = manifest_list.validate()
-    assert valid == False
-    assert isinstance(err, str)
-    assert len(err) > 0
-    manifest_list.manifest_list["mediaType"] = copy.copy(
-        CNCF_MANIFEST_LIST_EXAMPLE["mediaType"]
-    )
-
-    # Ensure if we drop a property of the manifest, it's invalid
-    manifest_list.manifest_list.pop("schemaVersion")
-    valid, err = manifest_list.validate()
-    assert valid == False
-    assert isinstance(err, str)
-    assert len(err) > 0
-    manifest_list.manifest_list["schemaVersion"] = copy.copy(
-        CNCF_MANIFEST_LIST_EXAMPLE["schemaVersion"]
-    )
-
-    # Ensure if we invalidate a property of a manifest entry, it's invalid
-    manifest_list.manifest_list["manifests"][0]["digest"] = "notadigest"
+    assert (valid, err) == (True, "")
+
+    # Ensure if we invalidate a property of the manifest list or one of its
+    # entries, it's invalid, and valid again once restored
+    cases = [
+        (manifest_list.manifest_list, "mediaType", 1234),
+        (manifest_list.manifest_list, "schemaVersion", REMOVED),
+        (manifest_list.manifest_list["manifests"][0], "digest", "notadigest")
+    ]
+    for payload, key, value in cases:
+        with swapped(payload, key, value):
+            valid, err = manifest_list.validate()
+            assert valid == False
+            assert isinstance(err, str)
+            assert len(err) > 0
     valid, err = manifest_list.validate()
-    assert valid == False
-    assert isinstance(err, str)
-    assert len(err) > 0
-    manifest_list.manifest_list["manifests"][0]["digest"] = copy.copy(
-        CNCF_MANIFEST_LIST_EXAMPLE["manifests"][0]["digest"]
-    )
+    assert (valid, err) == (True, "")
 
-def test_container_image_v2s2_manifest_list_get_entries():
+def test_container_image_v2s2_manifest_list_get_entries(make_payload):
     # Ensure entries match expected typing and length
     manifest_list = ContainerImageManifestListV2S2(
-        copy.deepcopy(CNCF_MANIFEST_LIST_EXAMPLE)
+        make_payload(CNCF_MANIFEST_LIST_EXAMPLE)
     )
     entries = manifest_list.get_v2s2_entries()
     assert isinstance(entries, list)
@@ -452,42 +407,41 @@ def test_container_image_v2s2_manifest_list_get_entries():
     assert isinstance(entries[1], ContainerImageManifestListEntryV2S2)
 
     # Ensure if we invalidate a property of a manifest entry, it's invalid
-    exc = None
     manifest_list.manifest_list["manifests"][0]["digest"] = "notadigest"
-    try:
-        entries = manifest_list.get_v2s2_entries()
-    except Exception as e:
-        exc = e
-    assert exc != None
-    assert isinstance(exc, ValidationError)
-
-def test_container_image_v2s2_manifest_list_get_manifests(mocker):
-    # Mock the ContainerImageRegistryClient.get_manifest function which is
-    # called in the implementation of ContainerImageManifestList.get_size
-    mocker.patch(
-        "image.containerimage.ContainerImageRegistryClient.get_manifest",
-        mock_get_manifest
-    )
+    with pytest.raises(ValidationError):
+        manifest_list.get_v2s2_entries()
+
+def test_container_image_v2s2_manifest_list_get_manifests(
+        mock_registry,
+        make_payload
+    ):
     manifest_list = ContainerImageManifestListV2S2(
-        copy.deepcopy(REDHAT_MANIFEST_LIST_EXAMPLE)
+        make_payload(REDHAT_MANIFEST_LIST_EXAMPLE)
     )
     manifests = manifest_list.get_v2s2_manifests(
         MOCK_IMAGE_NAME, MOCK_REGISTRY_CREDS
     )
     expected_manifests = [
-        ContainerImageManifestV2S2(REDHAT_AMD64_MANIFEST),
-        ContainerImageManifestV2S2(REDHAT_ARM64_MANIFEST),
-        ContainerImageManifestV2S2(REDHAT_PPC64LE_MANIFEST),
-        ContainerImageManifestV2S2(REDHAT_S390X_MANIFEST)
+        REDHAT_AMD64_MANIFEST,
+        REDHAT_ARM64_MANIFEST,
+        REDHAT_PPC64LE_MANIFEST,
+        REDHAT_S390X_MANIFEST
     ]
-    assert json.dumps(manifests) == json.dumps(expected_manifests)
+    assert all(
+        isinstance(manifest, ContainerImageManifestV2S2)
+        for manifest in manifests
+    )
+    assert [ manifest.manifest for manifest in manifests ] == \
+        expected_manifests
 
 """
 ContainerImageManifestListEntryV2S2 tests
 
 Unit tests for the ContainerImageManifestListEntryV2S2 class
 """
-def test_container_image_v2s2_manifest_list_entry_static_validation():
+def test_container_image_v2s2_manifest_list_entry_static_validation(
+        make_payload
+    ):
     # Empty dict should be invalid
     empty_dict_valid, err = ContainerImageManifestListEntryV2S2.validate_static(
         {}
@@ -498,117 +452,41 @@ def test_container_image_v2s2_manifest_list_entry_static_validation():
 
     # Valid CNCF example should be valid
     cncf_example_valid, err = ContainerImageManifestListEntryV2S2.validate_static(
-        copy.deepcopy(CNCF_MANIFEST_LIST_ENTRY_EXAMPLE)
+        make_payload(CNCF_MANIFEST_LIST_ENTRY_EXAMPLE)
     )
-    assert cncf_example_valid == True
-    assert isinstance(err, str)
-    assert len(err) == 0
-
-    # No mediaType should be invalid
-    cncf_example_mut = copy.deepcopy(CNCF_MANIFEST_LIST_ENTRY_EXAMPLE)
-    cncf_example_mut.pop("mediaType")
-    no_mt_valid, err = ContainerImageManifestListEntryV2S2.validate_static(
-        cncf_example_mut
-    )
-    assert no_mt_valid == False
-    assert isinstance(err, str)
-    assert len(err) > 0
-
-    # No digest should be invalid
-    cncf_example_mut = copy.deepcopy(CNCF_MANIFEST_LIST_ENTRY_EXAMPLE)
-    cncf_example_mut.pop("digest")
-    no_dig_valid, err = ContainerImageManifestListEntryV2S2.validate_static(
-        cncf_example_mut
-    )
-    assert no_dig_valid == False
-    assert isinstance(err, str)
-    assert len(err) > 0
-
-    # Invalid digest type should be invalid
-    cncf_example_mut = copy.deepcopy(CNCF_MANIFEST_LIST_ENTRY_EXAMPLE)
-    cncf_example_mut["digest"] = 1234
-    no_dig_valid, err = ContainerImageManifestListEntryV2S2.validate_static(
-        cncf_example_mut
-    )
-    assert no_dig_valid == False
-    assert isinstance(err, str)
-    assert len(err) > 0
-
-    # Invalid digest value should be invalid
-    cncf_example_mut = copy.deepcopy(CNCF_MANIFEST_LIST_ENTRY_EXAMPLE)
-    cncf_example_mut["digest"] = "notadigest"
-    inv_dig_valid, err = ContainerImageManifestListEntryV2S2.validate_static(
-        cncf_example_mut
-    )
-    assert inv_dig_valid == False
-    assert isinstance(err, str)
-    assert len(err) > 0
-
-    # No size should be invalid
-    cncf_example_mut = copy.deepcopy(CNCF_MANIFEST_LIST_ENTRY_EXAMPLE)
-    cncf_example_mut.pop("size")
-    no_size_valid, err = ContainerImageManifestListEntryV2S2.validate_static(
-        cncf_example_mut
-    )
-    assert no_size_valid == False
-    assert isinstance(err, str)
-    assert len(err) > 0
-
-    # Invalid size type should be invalid
-    cncf_example_mut = copy.deepcopy(CNCF_MANIFEST_LIST_ENTRY_EXAMPLE)
-    cncf_example_mut["size"] = "abcd"
-    inv_size_valid, err = ContainerImageManifestListEntryV2S2.validate_static(
-        cncf_example_mut
-    )
-    assert inv_size_valid == False
-    assert isinstance(err, str)
-    assert len(err) > 0
-
-    # No platform should be invalid
-    cncf_example_mut = copy.deepcopy(CNCF_MANIFEST_LIST_ENTRY_EXAMPLE)
-    cncf_example_mut.pop("platform")
-    no_plt_valid, err = ContainerImageManifestListEntryV2S2.validate_static(
-        cncf_example_mut
-    )
-    assert no_plt_valid == False
-    assert isinstance(err, str)
-    assert len(err) > 0
-
-    # Invalid platform type should be invalid
-    cncf_example_mut = copy.deepcopy(CNCF_MANIFEST_LIST_ENTRY_EXAMPLE)
-    cncf_example_mut["platform"] = 1234
-    inv_plt_valid, err = ContainerImageManifestListEntryV2S2.validate_static(
-        cncf_example_mut
-    )
-    assert inv_plt_valid == False
-    assert isinstance(err, str)
-    assert len(err) > 0
+    assert (cncf_example_valid, err) == (True, "")
 
     # Valid RedHat example should be valid
     rh_example_valid, err = ContainerImageManifestListEntryV2S2.validate_static(
-        copy.deepcopy(REDHAT_MANIFEST_LIST_ENTRY_EXAMPLE)
+        make_payload(REDHAT_MANIFEST_LIST_ENTRY_EXAMPLE)
     )
-    assert rh_example_valid == True
-    assert isinstance(err, str)
-    assert len(err) == 0
+    assert (rh_example_valid, err) == (True, "")
 
     # Invalid OCI example should be invalid
     oci_example_valid, err = ContainerImageManifestListEntryV2S2.validate_static(
-        copy.deepcopy(DOCKER_BUILDX_ATTESTATION_INDEX_ENTRY)
+        make_payload(DOCKER_BUILDX_ATTESTATION_INDEX_ENTRY)
     )
     assert oci_example_valid == False
     assert isinstance(err, str)
     assert len(err) > 0
 
+@pytest.mark.parametrize("changes", MANIFEST_LIST_ENTRY_CASES)
+def test_container_image_v2s2_manifest_list_entry_static_validation_changes(
+        make_payload,
+        changes
+    ):
+    # Each change to the example entry should make it invalid
+    entry = make_payload(CNCF_MANIFEST_LIST_ENTRY_EXAMPLE)
+    apply_changes(entry, changes)
+    valid, err = ContainerImageManifestListEntryV2S2.validate_static(entry)
+    assert valid == False
+    assert isinstance(err, str)
+    assert len(err) > 0
+
 def test_container_image_v2s2_manifest_list_entry_instantiation():
     # Ensure exception is thrown on instantiation using invalid schema
-    exc = None
-    try:
-        entry = ContainerImageManifestListEntryV2S2({})
-    except Exception as e:
-        exc = e
-    assert exc != None
-    assert isinstance(exc, ValidationError)
+    with pytest.raises(ValidationError):
+        ContainerImageManifestListEntryV2S2({})
 
     # Ensure ContainerImageManifestListEntryV2S2 is returned on instantiation
     # using valid schema
@@ -627,15 +505,16 @@ def test_container_image_v2s2_manifest_list_entry_instantiation():
     )
     assert isinstance(entry, ContainerImageManifestListEntryV2S2)
 
-def test_container_image_v2s2_manifest_list_entry_instance_validation():
+def test_container_image_v2s2_manifest_list_entry_instance_validation(
+        make_payload
+    ):
     # Ensure ContainerImageManifestListEntryV2S2 instantiates and is valid
     # post-instantiation
     entry = ContainerImageManifestListEntryV2S2(
-        copy.deepcopy(CNCF_MANIFEST_LIST_ENTRY_EXAMPLE)
+        make_payload(CNCF_MANIFEST_LIST_ENTRY_EXAMPLE)
     )
     valid, err = entry.validate()
-    assert valid == True
-    assert isinstance(err, str)
+    assert (valid, err) == (True, "")
 
     # Ensure if we modify a property of the ContainerImageManifestListEntryV2S2
     # to be invalid, it becomes invalid
@@ -0,0 +1,103 @@
+import image.validators
+import pytest
+from jsonschema             import  ValidationError, validate
+from jsonschema.exceptions  import  best_match
+from image.ocischema        import  MANIFEST_OCI_SCHEMA
+from image.validators       import  MANIFEST_OCI_VALIDATOR, \
+                                    LazyValidator, \
+                                    build_validator, \
+                                    compile_schema, \
+                                    validate_instance
+
+"""
+Validator tests
+
+Unit tests for the prebuilt JSON schema validators
+"""
+def test_validate_instance():
+    # Empty dict should be invalid, with the error jsonschema.validate raises
+    valid, err = validate_instance(MANIFEST_OCI_VALIDATOR, {})
+    assert valid == False
+    assert isinstance(err, str)
+    with pytest.raises(ValidationError) as exc_info:
+        validate(instance={}, schema=MANIFEST_OCI_SCHEMA)
+    assert err == f"{exc_info.value.json_path}: {exc_info.value.message}"
+
+    # Instance satisfying the schema should be valid
+    validator = build_validator({ "type": "integer" })
+    valid, err = validate_instance(validator, 1234)
+    assert (valid, err) == (True, "")
+
+def test_compile_schema():
+    # Compiled schema should agree with jsonschema across keywords
+    schema = {
+        "type": "object",
+        "required": [ "size" ],
+        "additionalProperties": False,
+        "properties": {
+            "size": { "type": "integer" },
+            "urls": { "type": "array", "items": { "type": "string" } },
+            "labels": { "oneOf": [ { "type": "object" }, { "type": "null" } ] }
+        }
+    }
+    is_valid = compile_schema(schema)
+    validator = build_validator(schema)
+    instances = [
+        { "size": 1 },
+        { "size": 1.0 },
+        { "size": True },
+        { "size": 1, "urls": [ "a", "b" ] },
+        { "size": 1, "urls": [ "a", 1 ] },
+        { "size": 1, "labels": None },
+        { "size": 1, "labels": [] },
+        { "size": 1, "extra": 1 },
+        {},
+        []
+    ]
+    for instance in instances:
+        assert is_valid(instance) == validator.is_valid(instance)
+
+    # Schemas using unsupported keywords should not be compiled
+    assert compile_schema({ "type": "string", "pattern": "^a$" }) is None
+
+def test_compile_schema_prebuilt_validators():
+    # Every prebuilt validator's schema should compile, so that no validator
+    # silently falls back to jsonschema for valid instances
+    validators = [
+        value for value in vars(image.validators).values()
+        if isinstance(value, LazyValidator)
+    ]
+    assert len(validators) > 0
+    for validator in validators:
+        assert compile_schema(validator.schema) is not None
+
+def test_build_validator_cache():
+    # Equal schemas should share a validator, regardless of key order
+    validator = build_validator({ "type": "object", "required": [ "a" ] })
+    assert build_validator(
+        { "required": [ "a" ], "type": "object" }
+    ) is validator
+    assert build_validator({ "type": "object" }) is not validator
+
+def test_validate_instance_precheck():
+    # Obvious errors found without jsonschema should match its best match
+    validators = [
+        value for value in vars(image.validators).values()
+        if isinstance(value, LazyValidator)
+    ]
+    instances = [
+        {},
+        [],
+        None,
+        "abcd",
+        { "mediaType": 1 },
+        { "schemaVersion": 2, "extra": True },
+        [ {} ]
+    ]
+    for validator in validators:
+        for instance in instances:
+            if validator.precheck(instance) is None:
+                continue
+            error = best_match(validator.iter_errors(instance))
+            assert validator.precheck(instance) == \
+                f"{error.json_path}: {error.message}"